@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""Measure the latency of small records sent over loopback connections
+while other connections send large records, with large batches decoded on
+the event loop and in an executor.
+
+Usage: python benchmarks/aio.py [connection-count] [large-record-size]
+"""
+
+import asyncio
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import dodge
+import dodge.aio
+
+
+Message = dodge.data_class("Message", ["sent_at", dodge.field("values", type=dodge.list_of(int), default=[])])
+
+_messages_per_connection = 200
+_large_connection_count = 2
+_large_message_count = 5
+
+
+def main(argv):
+    connection_count = int(argv[1]) if len(argv) > 1 else 50
+    large_record_size = int(argv[2]) if len(argv) > 2 else 500000
+
+    for name, executor, offload_size in [
+        ("on event loop", None, float("inf")),
+        ("offloaded to threads", ThreadPoolExecutor(4), 1024 * 1024),
+        ("offloaded to processes", ProcessPoolExecutor(4, mp_context=multiprocessing.get_context("spawn")), 1024 * 1024),
+    ]:
+        latencies = asyncio.run(_run(connection_count, large_record_size, executor, offload_size))
+        latencies.sort()
+        print("{0} connections, {1}: p50 {2:.2f}ms, p99 {3:.2f}ms, max {4:.2f}ms".format(
+            connection_count, name,
+            _percentile(latencies, 0.5) * 1000,
+            _percentile(latencies, 0.99) * 1000,
+            latencies[-1] * 1000,
+        ))
+        if executor is not None:
+            executor.shutdown()
+
+
+async def _run(connection_count, large_record_size, executor, offload_size):
+    latencies = []
+    finished = asyncio.Event()
+    connections_left = [connection_count + _large_connection_count]
+
+    async def handle(reader, writer):
+        async for message in dodge.aio.iter_objects(reader, Message, executor=executor, offload_size=offload_size):
+            if not message.values:
+                latencies.append(time.perf_counter() - message.sent_at)
+        writer.close()
+        connections_left[0] -= 1
+        if not connections_left[0]:
+            finished.set()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def send_small_messages():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(_messages_per_connection):
+            await dodge.aio.write_objects(writer, [Message(time.perf_counter())])
+            await asyncio.sleep(0.001)
+        writer.close()
+
+    # Large records are encoded once, so that only decoding them affects
+    # the latency of other connections
+    large_record = (dodge.dumps(Message(0, list(range(large_record_size)))) + "\n").encode("utf-8")
+
+    async def send_large_messages():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(_large_message_count):
+            writer.write(large_record)
+            await writer.drain()
+            await asyncio.sleep(0.05)
+        writer.close()
+
+    await asyncio.gather(*(
+        [send_small_messages() for _ in range(connection_count)] +
+        [send_large_messages() for _ in range(_large_connection_count)]
+    ))
+    await finished.wait()
+    server.close()
+    await server.wait_closed()
+    return latencies
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+if __name__ == "__main__":
+    main(sys.argv)
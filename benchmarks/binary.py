@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""Compare the size and speed of pack/unpack with dumps/loads.
+
+Usage: python benchmarks/binary.py [record-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", "location"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    "score",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=Profile),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    users = [
+        User(index, "bob", "bob@example.com", index * 0.5, profile=Profile("I'm Bob.", "London"))
+        for index in range(count)
+    ]
+
+    for name, encode, decode in [
+        ("dumps/loads", dodge.dumps, dodge.loads),
+        ("pack/unpack", dodge.pack, dodge.unpack),
+    ]:
+        encoded = [encode(user) for user in users]
+        size = sum(len(record) for record in encoded)
+        encode_time = min(timeit.repeat(lambda: [encode(user) for user in users], number=1, repeat=3))
+        decode_time = min(timeit.repeat(lambda: [decode(record, User) for record in encoded], number=1, repeat=3))
+        print("{0}: {1:.1f} bytes/record, encode {2:.0f} records/sec, decode {3:.0f} records/sec".format(
+            name, size / float(count), count / encode_time, count / decode_time))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+"""Compare from_rows and from_dicts with calling the constructor for each row.
+
+Usage: python benchmarks/bulk_construction.py [row-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("salt", default=None, keyword_only=True),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    rows = [(index, "bob", "bob@example.com") for index in range(count)]
+    dicts = [{"id": index, "username": "bob", "email_address": "bob@example.com"} for index in range(count)]
+
+    for name, func in [
+        ("[User(*row) for row in rows]", lambda: [User(*row) for row in rows]),
+        ("from_rows(User, rows)", lambda: dodge.from_rows(User, rows)),
+        ("[User(**kwargs) for kwargs in dicts]", lambda: [User(**kwargs) for kwargs in dicts]),
+        ("from_dicts(User, dicts)", lambda: dodge.from_dicts(User, dicts)),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print("{0}: {1:.0f} instances/sec".format(name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
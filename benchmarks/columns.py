@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+"""Compare columnar conversion with converting each object to a flat list.
+
+Usage: python benchmarks/columns.py [object-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", "score"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    dodge.field("profile", type=Profile),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    users = [User(index, "bob", Profile("I'm Bob.", index * 0.5)) for index in range(count)]
+    flat_lists = [dodge.obj_to_flat_list(user) for user in users]
+    columns = dodge.objs_to_columns(users, User)
+
+    _report("obj_to_flat_list", lambda: [dodge.obj_to_flat_list(user) for user in users])
+    _report("objs_to_columns", lambda: dodge.objs_to_columns(users, User))
+    _report("objs_to_columns (arrays)", lambda: dodge.objs_to_columns(
+        users, User, typecodes={"id": "q", "profile.score": "d"}))
+    _report("flat_list_to_obj", lambda: [dodge.flat_list_to_obj(values, User) for values in flat_lists])
+    _report("columns_to_objs", lambda: dodge.columns_to_objs(columns, User))
+
+
+def _report(name, func):
+    print("{0}: {1:.3f}s".format(name, min(timeit.repeat(func, number=1, repeat=3))))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
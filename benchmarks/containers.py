@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""Time conversions of a record with a list of child objects, comparing a
+list_of field with converting each child by hand.
+
+Usage: python benchmarks/containers.py [child-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Child = dodge.data_class("Child", ["id", "name", dodge.field("score", default=0)])
+
+Parent = dodge.data_class("Parent", ["name", dodge.field("children", type=dodge.list_of(Child))])
+
+UntypedParent = dodge.data_class("UntypedParent", ["name", "children"])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    children = [Child(index, "child {0}".format(index), index % 7) for index in range(count)]
+    parent = Parent("parent", children)
+    parent_dict = dodge.obj_to_dict(parent)
+    flat_list = dodge.obj_to_flat_list(parent)
+
+    def obj_to_dict_by_hand():
+        parent_dict = dodge.obj_to_dict(UntypedParent(parent.name, []))
+        parent_dict["children"] = [dodge.obj_to_dict(child) for child in parent.children]
+        return parent_dict
+
+    def dict_to_obj_by_hand():
+        return Parent(
+            parent_dict["name"],
+            [dodge.dict_to_obj(child_dict, Child) for child_dict in parent_dict["children"]],
+        )
+
+    for name, func in [
+        ("obj_to_dict", lambda: dodge.obj_to_dict(parent)),
+        ("obj_to_dict by hand", obj_to_dict_by_hand),
+        ("dict_to_obj", lambda: dodge.dict_to_obj(parent_dict, Parent)),
+        ("dict_to_obj by hand", dict_to_obj_by_hand),
+        ("obj_to_flat_list", lambda: dodge.obj_to_flat_list(parent)),
+        ("flat_list_to_obj", lambda: dodge.flat_list_to_obj(flat_list, Parent)),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print("{0} children, {1}: {2:.2f}ms".format(count, name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
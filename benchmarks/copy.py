@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+"""Compare copy and copy_many with copying through the constructor.
+
+Usage: python benchmarks/copy.py [object-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Record = dodge.data_class("Record", [
+    "field_{0}".format(index)
+    for index in range(32)
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    records = [Record(*range(index, index + 32)) for index in range(count)]
+
+    for name, func in [
+        ("copy through constructor", lambda: [_copy_through_constructor(record, field_0=-1) for record in records]),
+        ("copy", lambda: [dodge.copy(record, field_0=-1) for record in records]),
+        ("copy_many", lambda: dodge.copy_many(records, field_0=-1)),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print("{0}: {1:.0f} copies/sec".format(name, count / elapsed))
+
+
+def _copy_through_constructor(obj, **kwargs):
+    field_values = dict(
+        (field.name, getattr(obj, field.name))
+        for field in dodge.fields(obj)
+    )
+    field_values.update(kwargs)
+    return type(obj)(**field_values)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
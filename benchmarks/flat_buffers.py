@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""Compare the time and memory of building objects from one buffer of
+fixed-width numeric fields, either by splitting it into a flat list per
+object or by reading consecutive objects with flat_list_to_objs.
+
+Usage: python benchmarks/flat_buffers.py [object-count]
+"""
+
+import array
+import mmap
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import dodge
+
+
+Point = dodge.data_class("Point", ["x", "y"])
+
+Sample = dodge.data_class("Sample", [
+    "id",
+    dodge.field("position", type=Point),
+    "value",
+])
+
+_record_length = 4
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    values = array.array("d", range(count * _record_length))
+
+    def flat_list_to_obj_per_record():
+        flat_list = values.tolist()
+        return [
+            dodge.flat_list_to_obj(flat_list[index:index + _record_length], Sample)
+            for index in range(0, len(flat_list), _record_length)
+        ]
+
+    view = memoryview(values)
+    _report(count, "flat_list_to_obj per record", flat_list_to_obj_per_record)
+    _report(count, "flat_list_to_objs (list)", lambda: dodge.flat_list_to_objs(values.tolist(), Sample))
+    _report(count, "flat_list_to_objs (memoryview)", lambda: dodge.flat_list_to_objs(view, Sample))
+    view.release()
+
+    with tempfile.TemporaryFile() as fileobj:
+        fileobj.write(values.tobytes())
+        fileobj.flush()
+        mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped_view = memoryview(mapped).cast("d")
+        _report(count, "flat_list_to_objs (mmap)", lambda: dodge.flat_list_to_objs(mapped_view, Sample))
+        mapped_view.release()
+        mapped.close()
+
+
+def _report(count, name, func):
+    elapsed = min(timeit.repeat(func, number=1, repeat=3))
+
+    tracemalloc.start()
+    objs = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+
+    # Memory used beyond the objects themselves is freed once they're built
+    print("{0} objects, {1}: {2:.3f}s, objects {3:.1f}MB, other {4:.1f}MB".format(
+        count, name, elapsed, retained / 1024.0 / 1024.0, (peak - retained) / 1024.0 / 1024.0))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
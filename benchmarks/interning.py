@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""Compare the time and memory of loading JSON lines in which the same
+nested objects and strings are repeated, with and without interning.
+
+Usage: python benchmarks/interning.py [line-count] [instrument-count]
+"""
+
+import io
+import sys
+import timeit
+import tracemalloc
+
+import dodge
+
+
+Instrument = dodge.data_class("Instrument", ["symbol", "exchange", "currency"], frozen=True)
+
+Trade = dodge.data_class("Trade", [
+    "id",
+    "side",
+    "quantity",
+    dodge.field("instrument", type=Instrument),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+    instrument_count = int(argv[2]) if len(argv) > 2 else 100
+
+    output = io.StringIO()
+    dodge.dump_lines(
+        (
+            Trade(
+                index,
+                "buy" if index % 2 else "sell",
+                index % 1000,
+                Instrument("SYM{0}".format(index % instrument_count), "LSE", "GBP"),
+            )
+            for index in range(count)
+        ),
+        output,
+    )
+    lines = output.getvalue()
+
+    for name, intern in [("without interning", False), ("with interning", True)]:
+        load = lambda: list(dodge.load_lines(io.StringIO(lines), Trade, intern=intern))
+        elapsed = min(timeit.repeat(load, number=1, repeat=3))
+
+        tracemalloc.start()
+        trades = load()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del trades
+
+        print("{0} trades of {1} instruments, {2}: {3:.3f}s, {4:.1f}MB".format(
+            count, instrument_count, name, elapsed, retained / 1024.0 / 1024.0))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
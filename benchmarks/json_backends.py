@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+"""Time dumps and loads with each available JSON backend.
+
+Usage: python benchmarks/json_backends.py [record-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", "location"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=Profile),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    users = [
+        User(index, "bob", "bob@example.com", profile=Profile("I'm Bob.", "London"))
+        for index in range(count)
+    ]
+    strings = [dodge.dumps(user, backend="json") for user in users]
+
+    for backend in dodge.json_backends():
+        for name, func in [
+            ("dumps", lambda: [dodge.dumps(user, backend=backend) for user in users]),
+            ("loads", lambda: [dodge.loads(string, User, backend=backend) for string in strings]),
+        ]:
+            elapsed = min(timeit.repeat(func, number=1, repeat=5))
+            print("{0} {1}: {2:.0f} records/sec".format(backend, name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""Measure records per second and peak memory of dump_lines and load_lines.
+
+Usage: python benchmarks/json_lines.py [record-count]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", "location"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=Profile),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 1000000
+
+    def users():
+        for index in range(count):
+            yield User(index, "bob", "bob@example.com", profile=Profile("I'm Bob.", "London"))
+
+    def dump(path):
+        with io.open(path, "w") as fp:
+            dodge.dump_lines(users(), fp)
+
+    def load(path):
+        with io.open(path, "r") as fp:
+            for user in dodge.load_lines(fp, User):
+                pass
+
+    handle, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(handle)
+    try:
+        for name, run in [("dump_lines", dump), ("load_lines", load)]:
+            start = time.time()
+            run(path)
+            elapsed = time.time() - start
+
+            tracemalloc.start()
+            try:
+                run(path)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            print("{0}: {1:.0f} records/sec, peak memory {2:.1f} KiB".format(
+                name, count / elapsed, peak / 1024.0))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
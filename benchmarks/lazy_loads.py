@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""Compare eager and lazy loading when only a few fields are read.
+
+Usage: python benchmarks/lazy_loads.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+
+import dodge
+
+
+Item = dodge.data_class("Item", ["item_id", "description", "unit_price"])
+
+Order = dodge.data_class("Order", [
+    "order_id",
+    "customer_name",
+] + [
+    dodge.field("item_{0}".format(chr(ord("a") + index)), type=Item)
+    for index in range(20)
+] + [
+    "field_{0}".format(chr(ord("a") + index))
+    for index in range(20)
+])
+
+
+def main(argv):
+    iterations = int(argv[1]) if len(argv) > 1 else 10000
+
+    order_dict = dict(
+        (field.name, Item(index, "Widget", 1.5) if field.type else index)
+        for index, field in enumerate(dodge.fields(Order))
+    )
+    order_dict = dodge.obj_to_dict(Order(**order_dict))
+    order_json = json.dumps(order_dict)
+
+    def partial_access(order):
+        return order.order_id, order.customer_name
+
+    def full_access(order):
+        return dodge.obj_to_dict(order)
+
+    for access_name, access in [("partial access", partial_access), ("full access", full_access)]:
+        for name, lazy in [("eager", False), ("lazy", True)]:
+            for source_name, load in [
+                ("dict_to_obj", lambda: dodge.dict_to_obj(order_dict, Order, lazy=lazy)),
+                ("loads", lambda: dodge.loads(order_json, Order, lazy=lazy)),
+            ]:
+                elapsed = min(timeit.repeat(lambda: access(load()), number=iterations, repeat=3))
+                print("{0}, {1} {2}: {3:.1f}us per object".format(
+                    access_name, name, source_name, elapsed / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
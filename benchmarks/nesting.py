@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Time conversions of deeply nested and widely branching objects.
+
+Usage: python benchmarks/nesting.py [depth] [width]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+def main(argv):
+    depth = int(argv[1]) if len(argv) > 1 else 5000
+    width = int(argv[2]) if len(argv) > 2 else 200
+
+    _report_conversions("deep ({0} levels)".format(depth), *_deep(depth))
+    _report_conversions("wide ({0}x{0} leaves)".format(width), *_wide(width))
+
+
+def _deep(depth):
+    Level = dodge.data_class("Level", ["value"])
+    obj = Level(0)
+    for index in range(1, depth):
+        Level = dodge.data_class("Level", ["value", dodge.field("child", type=Level)])
+        obj = Level(index, obj)
+    return obj, Level
+
+
+def _wide(width):
+    Leaf = dodge.data_class("Leaf", ["value"])
+    Branch = dodge.data_class("Branch", [
+        dodge.field("branch{0}".format(index), type=Leaf)
+        for index in range(width)
+    ])
+    Tree = dodge.data_class("Tree", [
+        dodge.field("tree{0}".format(index), type=Branch)
+        for index in range(width)
+    ])
+    tree = Tree(*[
+        Branch(*[Leaf(branch * width + leaf) for leaf in range(width)])
+        for branch in range(width)
+    ])
+    return tree, Tree
+
+
+def _report_conversions(name, obj, cls):
+    obj_dict = dodge.obj_to_dict(obj)
+    flat_list = dodge.obj_to_flat_list(obj)
+
+    for conversion_name, func in [
+        ("obj_to_dict", lambda: dodge.obj_to_dict(obj)),
+        ("dict_to_obj", lambda: dodge.dict_to_obj(obj_dict, cls)),
+        ("obj_to_flat_list", lambda: dodge.obj_to_flat_list(obj)),
+        ("flat_list_to_obj", lambda: dodge.flat_list_to_obj(flat_list, cls)),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print("{0} {1}: {2:.2f}ms".format(name, conversion_name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
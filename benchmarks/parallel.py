@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""Time loads_many and dumps_many with increasing numbers of worker processes.
+
+Usage: python benchmarks/parallel.py [record-count] [max-workers]
+"""
+
+import multiprocessing
+import sys
+import time
+
+import dodge
+import dodge.parallel
+
+
+Profile = dodge.data_class("Profile", ["bio", "location"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=Profile),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 200000
+    max_workers = int(argv[2]) if len(argv) > 2 else multiprocessing.cpu_count()
+
+    users = [
+        User(index, "bob", "bob@example.com", profile=Profile("I'm Bob.", "London"))
+        for index in range(count)
+    ]
+    strings = [dodge.dumps(user) for user in users]
+
+    for name, func in [
+        ("loads", lambda: [dodge.loads(string, User) for string in strings]),
+        ("dumps", lambda: [dodge.dumps(user) for user in users]),
+    ]:
+        print("{0} in process: {1:.0f} records/sec".format(name, count / _time(func)))
+
+    workers = 1
+    while workers <= max_workers:
+        for name, func in [
+            ("loads_many", lambda: dodge.parallel.loads_many(strings, User, workers=workers, chunksize=5000)),
+            ("dumps_many", lambda: dodge.parallel.dumps_many(users, workers=workers, chunksize=5000)),
+        ]:
+            print("{0} with {1} worker(s): {2:.0f} records/sec".format(name, workers, count / _time(func)))
+        workers *= 2
+
+
+def _time(func):
+    start = time.time()
+    func()
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    main(sys.argv)
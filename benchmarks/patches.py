@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Compare sending a patch for a change to one field of an object with
+sending the whole object, in size and in the time taken to make and apply
+the change on the other side.
+
+Usage: python benchmarks/patches.py [update-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Position = dodge.data_class("Position", ["x", "y", "z"])
+
+State = dodge.data_class("State", [
+    dodge.field("position", type=Position),
+] + ["field{0}".format(index) for index in range(39)])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    old = State(Position(1.0, 2.0, 3.0), *["value {0}".format(index) for index in range(39)])
+    new = dodge.copy(old, position=dodge.copy(old.position, z=4.0))
+
+    string = dodge.dumps(new)
+    data = dodge.pack(new)
+    patch = dodge.diff(old, new)
+    patch_string = dodge.dumps_patch(patch)
+    patch_data = dodge.pack_patch(patch)
+
+    print("dumps: {0} bytes, dumps_patch: {1} bytes".format(len(string), len(patch_string)))
+    print("pack: {0} bytes, pack_patch: {1} bytes".format(len(data), len(patch_data)))
+
+    for name, func in [
+        ("dumps and loads", lambda: dodge.loads(dodge.dumps(new), State)),
+        ("diff, dumps_patch, loads_patch and apply_patch",
+            lambda: dodge.apply_patch(old, dodge.loads_patch(dodge.dumps_patch(dodge.diff(old, new)), State))),
+        ("pack and unpack", lambda: dodge.unpack(dodge.pack(new), State)),
+        ("diff, pack_patch, unpack_patch and apply_patch",
+            lambda: dodge.apply_patch(old, dodge.unpack_patch(dodge.pack_patch(dodge.diff(old, new)), State))),
+        ("loads", lambda: dodge.loads(string, State)),
+        ("loads_patch and apply_patch", lambda: dodge.apply_patch(old, dodge.loads_patch(patch_string, State))),
+    ]:
+        elapsed = min(timeit.repeat(func, number=count, repeat=3))
+        print("{0} updates, {1}: {2:.2f}ms".format(count, name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
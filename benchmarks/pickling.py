@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""Compare the size and round-trip time of pickled data class instances with
+pickling their __dict__, as Python does by default.
+
+Usage: python benchmarks/pickling.py [instance-count]
+"""
+
+import pickle
+import sys
+import timeit
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", "location"])
+
+User = dodge.data_class("User", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=Profile),
+])
+
+# Without the generated __reduce__ and __setstate__, instances are pickled
+# using their __dict__
+DictProfile = dodge.data_class("DictProfile", ["bio", "location"])
+del DictProfile.__reduce__
+del DictProfile.__setstate__
+
+DictUser = dodge.data_class("DictUser", [
+    "id",
+    "username",
+    "email_address",
+    dodge.field("is_root", default=False),
+    dodge.field("profile", type=DictProfile),
+])
+del DictUser.__reduce__
+del DictUser.__setstate__
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    for name, user_type, profile_type in [("__dict__", DictUser, DictProfile), ("__reduce__", User, Profile)]:
+        users = [
+            user_type(index, "bob", "bob@example.com", profile=profile_type("I'm Bob.", "London"))
+            for index in range(count)
+        ]
+        assert pickle.loads(pickle.dumps(users, protocol=pickle.HIGHEST_PROTOCOL)) == users
+        single = pickle.dumps(users[0], protocol=pickle.HIGHEST_PROTOCOL)
+        batch = pickle.dumps(users, protocol=pickle.HIGHEST_PROTOCOL)
+        elapsed = min(timeit.repeat(
+            lambda: pickle.loads(pickle.dumps(users, protocol=pickle.HIGHEST_PROTOCOL)),
+            number=1,
+            repeat=5,
+        ))
+        print("{0}: {1} bytes for one instance, {2:.1f} bytes per instance in a list, {3:.2f}us per round trip".format(
+            name, len(single), len(batch) / float(count), elapsed / count * 1e6))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+"""Compare reading two fields from large records using a projection with
+building each record and reading the fields from it.
+
+Usage: python benchmarks/projection.py [record-count]
+"""
+
+import sys
+import timeit
+
+import dodge
+
+
+Owner = dodge.data_class("Owner", ["id", "name", "email_address"])
+
+Record = dodge.data_class("Record", [
+    "id",
+    dodge.field("owner", type=Owner),
+] + ["field{0}".format(index) for index in range(30)])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    records = [
+        Record(index, Owner(index % 10, "Bob", "bob@example.com"), *range(30))
+        for index in range(count)
+    ]
+    dicts = [dodge.obj_to_dict(record) for record in records]
+    strings = [dodge.dumps(record) for record in records]
+    flat_lists = [dodge.obj_to_flat_list(record) for record in records]
+
+    projection = dodge.project(Record, ["id", "owner.name"])
+
+    def read_fields(record):
+        return (record.id, record.owner.name)
+
+    for name, func in [
+        ("dict_to_obj", lambda: [read_fields(dodge.dict_to_obj(record_dict, Record)) for record_dict in dicts]),
+        ("project from dicts", lambda: projection.from_dicts(dicts)),
+        ("loads", lambda: [read_fields(dodge.loads(string, Record)) for string in strings]),
+        ("project from JSON", lambda: projection.from_json_lines(strings)),
+        ("flat_list_to_obj", lambda: [read_fields(dodge.flat_list_to_obj(values, Record)) for values in flat_lists]),
+        ("project from flat lists", lambda: projection.from_flat_lists(flat_lists)),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print("{0} records, {1}: {2:.2f}ms".format(count, name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
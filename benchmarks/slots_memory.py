@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""Compare the memory used by data class instances with and without __slots__.
+
+Usage: python benchmarks/slots_memory.py [instance-count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import dodge
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    for slots in [False, True]:
+        User = dodge.data_class("User", [
+            "id",
+            "username",
+            "email_address",
+            dodge.field("is_root", default=False),
+        ], slots=slots)
+
+        print("slots={0}: {1:.1f} bytes per instance".format(
+            slots,
+            _measure(lambda: [
+                User(index, "bob", "bob@example.com")
+                for index in range(count)
+            ]) / count,
+        ))
+
+
+def _measure(create):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        instances = create()
+        current, peak = tracemalloc.get_traced_memory()
+        del instances
+        return current
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""Time importing dodge and defining a large schema of data classes.
+
+Startup is timed in a fresh interpreter, both importing dodge alone and
+importing dodge then defining the schema one class at a time. The timing is
+made by the interpreter itself, so that the time taken to start it isn't
+included. The schema only uses data_class and field, so the same timings can
+be made for other checkouts of dodge, such as an earlier release, by passing
+their paths.
+
+Defining classes is then timed in this process, one class at a time and in
+a single call to data_classes, which also resolves the names of classes used
+as the types of fields. Classes defined with compiled=False, which always use
+generic methods, are timed for comparison.
+
+Usage: python benchmarks/startup.py [class-count] [other-checkout ...]
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+
+import dodge
+
+
+_startup_source = """
+import time
+timer = getattr(time, "perf_counter", time.time)
+start = timer()
+
+import dodge
+
+classes = []
+for index in range({0}):
+    classes.append(dodge.data_class("Record{{0}}".format(index), [
+        "id",
+        "name",
+        dodge.field("description", default=None),
+        dodge.field("previous", type=classes[-1] if classes else None, default=None),
+    ]))
+
+print(timer() - start)
+"""
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 500
+    checkouts = [os.path.dirname(os.path.dirname(os.path.abspath(dodge.__file__)))] + argv[2:]
+
+    for checkout in checkouts:
+        import_time = _time_startup(0, checkout)
+        define_time = _time_startup(count, checkout)
+        print("{0}: import dodge: {1:.2f}ms, import dodge and define {2} classes: {3:.2f}ms".format(
+            checkout, import_time * 1000, count, define_time * 1000))
+
+    def define_one_at_a_time(compiled):
+        classes = {}
+        for index in range(count):
+            classes[index] = dodge.data_class(
+                "Record{0}".format(index), _fields(classes.get(index - 1)), compiled=compiled)
+        return classes
+
+    def define_together(compiled):
+        return dodge.data_classes(dict(
+            ("Record{0}".format(index), _fields("Record{0}".format(index - 1) if index else None))
+            for index in range(count)
+        ), compiled=compiled)
+
+    def define_and_use(compiled):
+        classes = define_one_at_a_time(compiled)
+        return [cls(1, "name") for cls in classes.values()]
+
+    for compiled in [False, True]:
+        for name, func in [
+            ("data_class", define_one_at_a_time),
+            ("data_classes", define_together),
+            ("data_class and construct", define_and_use),
+        ]:
+            elapsed = min(timeit.repeat(lambda: func(compiled), number=1, repeat=15))
+            print("{0} classes, {1}, compiled={2}: {3:.2f}ms".format(count, name, compiled, elapsed * 1000))
+
+
+def _time_startup(count, path):
+    # Run from the checkout, since the current directory is searched for
+    # modules first
+    env = dict(os.environ)
+    env["PYTHONPATH"] = path
+    return min(
+        float(subprocess.check_output(
+            [sys.executable, "-c", _startup_source.format(count)], env=env, cwd=path))
+        for repeat in range(15)
+    )
+
+
+def _fields(previous):
+    return [
+        "id",
+        "name",
+        dodge.field("description", default=None),
+        dodge.field("previous", type=previous, default=None),
+    ]
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+"""Time construction, comparison and conversion of data classes.
+
+Results are written as JSON, mapping each case to the time taken per object
+in seconds. If a baseline from a previous run is given, cases that are slower
+than the baseline by more than the threshold are reported as regressions and
+the script exits with a non-zero status.
+
+Each time is the fastest of several runs, and cases that look slower than
+the baseline are timed again before being reported, since a single run can
+be slowed by more than the threshold by anything else using the machine.
+Quick runs are too short to compare, so they can't be written or compared
+against a baseline.
+
+Usage:
+    python benchmarks/suite.py [--output FILE] [--baseline FILE] [--threshold FRACTION] [--quick]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+import dodge
+
+
+_operations = [
+    ("construct", lambda case: lambda: [case.cls(*args) for args in case.args]),
+    ("eq", lambda case: lambda: [obj == other for obj, other in zip(case.objs, case.others)]),
+    ("repr", lambda case: lambda: [repr(obj) for obj in case.objs]),
+    ("copy", lambda case: lambda: [dodge.copy(obj) for obj in case.objs]),
+    ("obj_to_dict", lambda case: lambda: [dodge.obj_to_dict(obj) for obj in case.objs]),
+    ("dict_to_obj", lambda case: lambda: [dodge.dict_to_obj(obj_dict, case.cls) for obj_dict in case.dicts]),
+    ("dumps", lambda case: lambda: [dodge.dumps(obj) for obj in case.objs]),
+    ("loads", lambda case: lambda: [dodge.loads(string, case.cls) for string in case.strings]),
+    ("obj_to_flat_list", lambda case: lambda: [dodge.obj_to_flat_list(obj) for obj in case.objs]),
+    ("flat_list_to_obj", lambda case: lambda: [dodge.flat_list_to_obj(values, case.cls) for values in case.flat_lists]),
+]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", help="file to write results to as JSON")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+        help="fraction slower than the baseline that counts as a regression (default 0.25)")
+    parser.add_argument("--quick", action="store_true",
+        help="run fewer, shorter cases, without writing or comparing results")
+    args = parser.parse_args(argv[1:])
+
+    if args.quick:
+        if args.output or args.baseline:
+            parser.error("--quick can't be used with --output or --baseline")
+        field_counts, depths, batch_sizes, min_time, repeat = [2, 10], [0, 2], [1, 100], 0.01, 3
+    else:
+        field_counts, depths, batch_sizes, min_time, repeat = [2, 10, 40], [0, 2, 5], [1, 100, 1000], 0.05, 9
+
+    def time_case(field_count, depth, batch_size, operation):
+        case = _Case(field_count, depth, batch_size)
+        return _time(operation(case), min_time, repeat) / batch_size
+
+    results = {}
+    case_args = {}
+    for field_count in field_counts:
+        for depth in depths:
+            for batch_size in batch_sizes:
+                case = _Case(field_count, depth, batch_size)
+                for operation_name, operation in _operations:
+                    name = "{0}/fields={1}/depth={2}/batch={3}".format(
+                        operation_name, field_count, depth, batch_size)
+                    case_args[name] = (field_count, depth, batch_size, operation)
+                    results[name] = _time(operation(case), min_time, repeat) / batch_size
+                    print("{0}: {1:.2f}us".format(name, results[name] * 1e6))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "results": results,
+            }, output_file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        for attempt in range(_retries):
+            for name, ratio in _regressions(results, baseline, args.threshold):
+                results[name] = min(results[name], time_case(*case_args[name]))
+        return _compare(results, baseline, args.threshold)
+    else:
+        return 0
+
+
+_retries = 2
+
+
+class _Case(object):
+    def __init__(self, field_count, depth, batch_size):
+        cls = None
+        for level in range(depth + 1):
+            fields = ["field_{0}".format(index) for index in range(field_count - 1)]
+            if cls is None:
+                fields.append("last_field")
+            else:
+                fields.append(dodge.field("nested", type=cls))
+            cls = dodge.data_class("Level{0}".format(level), fields)
+
+        self.cls = cls
+        self.objs = [self._create(cls, index) for index in range(batch_size)]
+        self.others = [self._create(cls, index) for index in range(batch_size)]
+        self.args = [
+            [getattr(obj, field.name) for field in dodge.fields(obj)]
+            for obj in self.objs
+        ]
+        self.dicts = [dodge.obj_to_dict(obj) for obj in self.objs]
+        self.strings = [dodge.dumps(obj) for obj in self.objs]
+        self.flat_lists = [dodge.obj_to_flat_list(obj) for obj in self.objs]
+
+    def _create(self, cls, index):
+        args = []
+        for field in dodge.fields(cls):
+            if field.type is None:
+                args.append("value {0}".format(index))
+            else:
+                args.append(self._create(field.type, index))
+        return cls(*args)
+
+
+def _time(func, min_time, repeat):
+    number = 1
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed * 10 > min_time else 10
+
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _regressions(results, baseline, threshold):
+    regressions = []
+    for name in sorted(results):
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            if ratio > 1 + threshold:
+                regressions.append((name, ratio))
+    return regressions
+
+
+def _compare(results, baseline, threshold):
+    regressions = _regressions(results, baseline, threshold)
+    for name, ratio in regressions:
+        print("REGRESSION {0}: {1:.2f}x baseline".format(name, ratio))
+    print("{0} regression(s) beyond {1:.0%} of baseline".format(len(regressions), threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""Compare validating payloads with converting them to objects.
+
+Usage: python benchmarks/validation.py [payload-count]
+"""
+
+import datetime
+import sys
+import timeit
+
+import dodge
+
+
+Address = dodge.data_class("Address", ["street", "city", "postcode"])
+
+Order = dodge.data_class("Order", ["id", "total", dodge.field("placed_on", type=datetime.date)])
+
+Customer = dodge.data_class("Customer", [
+    "id",
+    "first_name",
+    "last_name",
+    dodge.field("address", type=Address),
+    dodge.field("orders", type=dodge.list_of(Order)),
+    dodge.field("notes", default=None),
+])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+
+    customers = [
+        Customer(
+            index, "Bob", "Smith",
+            Address("1 High Street", "London", "N1"),
+            [Order(order, order * 1.5, datetime.date(2014, 3, 1)) for order in range(3)],
+        )
+        for index in range(count)
+    ]
+    dicts = [dodge.obj_to_dict(customer) for customer in customers]
+    strings = [dodge.dumps(customer) for customer in customers]
+
+    for name, func in [
+        ("dict_to_obj", lambda: [dodge.dict_to_obj(customer_dict, Customer) for customer_dict in dicts]),
+        ("validate (dict)", lambda: [dodge.validate(customer_dict, Customer) for customer_dict in dicts]),
+        ("loads", lambda: [dodge.loads(string, Customer) for string in strings]),
+        ("validate (JSON)", lambda: [dodge.validate(string, Customer) for string in strings]),
+    ]:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print("{0} payloads, {1}: {2:.2f}ms".format(count, name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -1,6 +1,23 @@
-from .data import data_class, field, copy, fields
+from .data import (
+    data_class, data_classes, field, copy, copy_many, fields, from_rows, from_dicts,
+    list_of, dict_of, optional,
+)
 from .conversion import (
     dumps, loads,
-    dict_to_obj, obj_to_dict,
-    obj_to_flat_list, flat_list_to_obj,
+    dump_lines, load_lines,
+    dict_to_obj, obj_to_dict, Interner,
+    validate, ValidationError,
+    obj_to_flat_list, flat_list_to_obj, flat_list_to_objs,
+    objs_to_columns, columns_to_objs,
+    clear_conversion_plan,
+)
+from .binary import pack, unpack, pack_stream, unpack_stream
+from .codecs import Codec, register_codec, unregister_codec
+from .json_backends import json_backends, set_json_backend
+from .patches import (
+    Patch, diff, apply_patch, dumps_patch, loads_patch, pack_patch, unpack_patch,
+)
+from .projection import project
+from .instrumentation import (
+    stats, reset_stats, enable_stats, disable_stats, collect_stats, OperationStats,
 )
@@ -0,0 +1,138 @@
+import asyncio
+
+from . import binary, conversion
+from .binary import _record_length
+from .json_backends import _json_backend
+
+
+# Records are read from and written to asyncio streams in the same formats
+# as the synchronous functions: "lines" for JSON lines, as written by
+# dump_lines, and "length" for length-prefixed binary records, as written by
+# pack_stream. Complete records are split from the data read so far and
+# decoded in batches. Decoding a batch doesn't wait on the event loop, so
+# batches of at least offload_size bytes, such as a single large record, are
+# decoded using executor instead. Any executor can be used, including a
+# ProcessPoolExecutor, since data classes can be pickled, although its
+# workers should be spawned rather than forked, since forked workers keep
+# open any sockets that the event loop has open.
+
+async def iter_objects(
+    reader, cls, framing="lines", batch_size=100, chunk_size=65536,
+    executor=None, offload_size=1024 * 1024, backend=None,
+):
+    split, decode = _framing(framing)
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    loop = _running_loop()
+    buffer = bytearray()
+    while True:
+        chunk = await reader.read(chunk_size)
+        at_eof = not chunk
+        buffer += chunk
+        records, consumed = split(buffer, len(buffer) - len(chunk), at_eof)
+        del buffer[:consumed]
+
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            if sum(map(len, batch)) >= offload_size:
+                objs = await loop.run_in_executor(executor, decode, batch, cls, backend)
+            else:
+                objs = decode(batch, cls, backend)
+                # Let other tasks run between batches, since reading data
+                # that's already buffered doesn't
+                await asyncio.sleep(0)
+            for obj in objs:
+                yield obj
+
+        if at_eof:
+            return
+
+
+async def write_objects(writer, objs, framing="lines", batch_size=100, backend=None):
+    # objs may be an iterable or an asynchronous iterable. The writer is
+    # drained after each batch, so a slow reader slows down the writer.
+    if framing not in _encoders:
+        raise ValueError("unknown framing: '{0}'".format(framing))
+    encode = _encoders[framing]
+
+    async for batch in _batches(objs, batch_size):
+        writer.write(encode(batch, backend))
+        await writer.drain()
+
+
+async def _batches(objs, batch_size):
+    batch = []
+    if hasattr(objs, "__aiter__"):
+        async for obj in objs:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for obj in objs:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
+
+
+def _framing(framing):
+    if framing not in _decoders:
+        raise ValueError("unknown framing: '{0}'".format(framing))
+    return _splitters[framing], _decoders[framing]
+
+
+def _split_lines(buffer, new_data_start, at_eof):
+    # Complete lines are always split from the buffer, so only the data
+    # just read can contain a new line
+    end = len(buffer) if at_eof else buffer.rfind(b"\n", new_data_start) + 1
+    return bytes(buffer[:end]).split(b"\n"), end
+
+
+def _split_length_prefixed(buffer, new_data_start, at_eof):
+    records = []
+    offset = 0
+    while len(buffer) - offset >= _record_length.size:
+        length = _record_length.unpack_from(buffer, offset)[0]
+        start = offset + _record_length.size
+        if len(buffer) < start + length:
+            break
+        records.append(bytes(buffer[start:start + length]))
+        offset = start + length
+
+    if at_eof and offset != len(buffer):
+        raise ValueError("unexpected end of stream")
+    return records, offset
+
+
+def _decode_lines(lines, cls, backend):
+    json_loads = _json_backend(backend).loads
+    return [conversion.dict_to_obj(json_loads(line), cls) for line in lines if line.strip()]
+
+
+def _decode_records(records, cls, backend):
+    return [binary.unpack(record, cls) for record in records]
+
+
+def _encode_lines(objs, backend):
+    return "".join(conversion.dumps(obj, backend=backend) + "\n" for obj in objs).encode("utf-8")
+
+
+def _encode_records(objs, backend):
+    parts = []
+    for obj in objs:
+        record = binary.pack(obj)
+        parts.append(_record_length.pack(len(record)))
+        parts.append(record)
+    return b"".join(parts)
+
+
+_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+_splitters = {"lines": _split_lines, "length": _split_length_prefixed}
+_decoders = {"lines": _decode_lines, "length": _decode_records}
+_encoders = {"lines": _encode_lines, "length": _encode_records}
@@ -0,0 +1,307 @@
+import struct
+import sys
+
+from .data import _fields_attr
+from . import conversion
+from .conversion import _plan
+
+
+# Each record is written as the values of its fields in the order given by
+# fields(cls), with no keys. Each value starts with a single tag byte
+# identifying how the rest of the value is encoded.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_TEXT = 5
+_BYTES = 6
+_OBJECT = 7
+_LIST = 8
+_DICT = 9
+_BIG_INT = 10
+
+_tag = struct.Struct(">B")
+_int = struct.Struct(">Bq")
+_float = struct.Struct(">Bd")
+_length = struct.Struct(">BI")
+_record_length = struct.Struct(">I")
+
+_min_int = -2 ** 63
+_max_int = 2 ** 63 - 1
+
+
+def pack(obj):
+    parts = []
+    _pack_obj(obj, parts)
+    return b"".join(parts)
+
+
+def unpack(data, cls):
+    data = bytes(data)
+    try:
+        obj, offset = _unpack_obj(data, 0, cls)
+    except struct.error:
+        raise ValueError("unexpected end of data")
+    if offset != len(data):
+        raise ValueError("unexpected data after record")
+    return obj
+
+
+def pack_stream(objs, fp, batch_size=1000):
+    parts = []
+    for obj in objs:
+        record = pack(obj)
+        parts.append(_record_length.pack(len(record)))
+        parts.append(record)
+        if len(parts) >= batch_size * 2:
+            fp.write(b"".join(parts))
+            parts = []
+
+    if parts:
+        fp.write(b"".join(parts))
+
+
+def unpack_stream(fp, cls):
+    while True:
+        header = fp.read(_record_length.size)
+        if not header:
+            return
+        length = _record_length.unpack(_read_remaining(fp, header, _record_length.size))[0]
+        yield unpack(_read_remaining(fp, b"", length), cls)
+
+
+def _read_remaining(fp, data, length):
+    while len(data) < length:
+        chunk = fp.read(length - len(data))
+        if not chunk:
+            raise ValueError("unexpected end of stream")
+        data += chunk
+    return data
+
+
+def _pack_obj(obj, parts):
+    for name, field_type, codec in _plan(type(obj)).typed_names:
+        value = getattr(obj, name)
+        if codec is not None and value is not None:
+            _pack_value(codec.encode(value), parts)
+        elif field_type is not None and hasattr(value, _fields_attr):
+            parts.append(_tag.pack(_OBJECT))
+            _pack_obj(value, parts)
+        else:
+            _pack_value(value, parts)
+
+
+def _pack_value(value, parts):
+    packer = _packers.get(type(value))
+    if packer is None:
+        packer = _find_packer(value)
+    packer(value, parts)
+
+
+def _find_packer(value):
+    if hasattr(value, _fields_attr):
+        return _pack_untyped_obj
+
+    for value_type, packer in _subclass_packers:
+        if isinstance(value, value_type):
+            return packer
+
+    raise TypeError("cannot pack value of type {0}".format(type(value).__name__))
+
+
+def _pack_none(value, parts):
+    parts.append(_tag.pack(_NONE))
+
+
+def _pack_bool(value, parts):
+    parts.append(_tag.pack(_TRUE if value else _FALSE))
+
+
+def _pack_int(value, parts):
+    if _min_int <= value <= _max_int:
+        parts.append(_int.pack(_INT, value))
+    else:
+        _pack_length_prefixed(_BIG_INT, str(value).encode("ascii"), parts)
+
+
+def _pack_float(value, parts):
+    parts.append(_float.pack(_FLOAT, value))
+
+
+def _pack_text(value, parts):
+    _pack_length_prefixed(_TEXT, value.encode("utf-8"), parts)
+
+
+def _pack_bytes(value, parts):
+    _pack_length_prefixed(_BYTES, bytes(value), parts)
+
+
+def _pack_length_prefixed(tag, data, parts):
+    parts.append(_length.pack(tag, len(data)))
+    parts.append(data)
+
+
+def _pack_list(value, parts):
+    parts.append(_length.pack(_LIST, len(value)))
+    for element in value:
+        _pack_value(element, parts)
+
+
+def _pack_dict(value, parts):
+    parts.append(_length.pack(_DICT, len(value)))
+    for key, element in _iteritems(value):
+        _pack_value(key, parts)
+        _pack_value(element, parts)
+
+
+def _pack_untyped_obj(value, parts):
+    # Without a field type, there's no way to know the type of the object
+    # when unpacking, so it's packed as a dict in the same way as obj_to_dict
+    _pack_dict(conversion.obj_to_dict(value), parts)
+
+
+def _unpack_obj(data, offset, cls):
+    plan = _plan(cls)
+    values = []
+    for field_type, codec in zip(plan.types, plan.dict_codecs):
+        if field_type is not None and data[offset:offset + 1] == _object_tag:
+            value, offset = _unpack_obj(data, offset + 1, field_type)
+        else:
+            value, offset = _unpack_value(data, offset)
+            if codec is not None and value is not None:
+                value = codec.decode(value)
+        values.append(value)
+    return plan.build(values), offset
+
+
+def _unpack_value(data, offset):
+    tag = _tag.unpack_from(data, offset)[0]
+    return _unpackers.get(tag, _unpack_unknown)(data, offset)
+
+
+def _unpack_unknown(data, offset):
+    raise ValueError("unknown tag: {0}".format(_tag.unpack_from(data, offset)[0]))
+
+
+def _unpack_none(data, offset):
+    return None, offset + 1
+
+
+def _unpack_false(data, offset):
+    return False, offset + 1
+
+
+def _unpack_true(data, offset):
+    return True, offset + 1
+
+
+def _unpack_int(data, offset):
+    return _int.unpack_from(data, offset)[1], offset + _int.size
+
+
+def _unpack_float(data, offset):
+    return _float.unpack_from(data, offset)[1], offset + _float.size
+
+
+def _unpack_text(data, offset):
+    value, offset = _unpack_length_prefixed(data, offset)
+    return value.decode("utf-8"), offset
+
+
+def _unpack_bytes(data, offset):
+    return _unpack_length_prefixed(data, offset)
+
+
+def _unpack_big_int(data, offset):
+    value, offset = _unpack_length_prefixed(data, offset)
+    return int(value.decode("ascii")), offset
+
+
+def _unpack_length_prefixed(data, offset):
+    length = _length.unpack_from(data, offset)[1]
+    start = offset + _length.size
+    end = start + length
+    if end > len(data):
+        raise struct.error("unexpected end of data")
+    return data[start:end], end
+
+
+def _unpack_list(data, offset):
+    length = _length.unpack_from(data, offset)[1]
+    offset += _length.size
+    result = []
+    for index in range(length):
+        element, offset = _unpack_value(data, offset)
+        result.append(element)
+    return result, offset
+
+
+def _unpack_dict(data, offset):
+    length = _length.unpack_from(data, offset)[1]
+    offset += _length.size
+    result = {}
+    for index in range(length):
+        key, offset = _unpack_value(data, offset)
+        result[key], offset = _unpack_value(data, offset)
+    return result, offset
+
+
+def _unpack_nested_obj(data, offset):
+    raise ValueError("nested object in field without type")
+
+
+_object_tag = _tag.pack(_OBJECT)
+
+_unpackers = {
+    _NONE: _unpack_none,
+    _FALSE: _unpack_false,
+    _TRUE: _unpack_true,
+    _INT: _unpack_int,
+    _FLOAT: _unpack_float,
+    _TEXT: _unpack_text,
+    _BYTES: _unpack_bytes,
+    _OBJECT: _unpack_nested_obj,
+    _LIST: _unpack_list,
+    _DICT: _unpack_dict,
+    _BIG_INT: _unpack_big_int,
+}
+
+
+if sys.version_info[0] >= 3:
+    _text_type = str
+    _integer_types = (int, )
+
+    def _iteritems(x):
+        return x.items()
+else:
+    _text_type = unicode
+    _integer_types = (int, long)
+
+    def _iteritems(x):
+        return x.iteritems()
+
+
+_packers = {
+    type(None): _pack_none,
+    bool: _pack_bool,
+    float: _pack_float,
+    _text_type: _pack_text,
+    bytes: _pack_bytes,
+    bytearray: _pack_bytes,
+    list: _pack_list,
+    tuple: _pack_list,
+    dict: _pack_dict,
+}
+for _integer_type in _integer_types:
+    _packers[_integer_type] = _pack_int
+
+_subclass_packers = [
+    (bool, _pack_bool),
+    (_integer_types, _pack_int),
+    (float, _pack_float),
+    (_text_type, _pack_text),
+    ((bytes, bytearray), _pack_bytes),
+    ((list, tuple), _pack_list),
+    (dict, _pack_dict),
+]
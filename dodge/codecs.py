@@ -0,0 +1,135 @@
+import sys
+
+
+class Codec(object):
+    def __init__(self, encode, decode):
+        self.encode = encode
+        self.decode = decode
+
+
+# Maps types to either a codec, or a function that takes the type of a field
+# and returns a codec, for codecs that depend on the exact type, such as
+# those for enums. Conversions look up the codec for each field once per
+# class, so a codec registered after a class has been converted is only used
+# for that class once its conversion plan has been cleared.
+_codecs = {}
+
+
+def register_codec(value_type, codec):
+    _codecs[value_type] = codec
+
+
+def unregister_codec(value_type):
+    _codecs.pop(value_type, None)
+
+
+def codec_for(value_type):
+    for base in getattr(value_type, "__mro__", (value_type, )):
+        codec = _codecs.get(base)
+        if codec is None:
+            codec = _builtin_codec(base)
+        if codec is not None:
+            if isinstance(codec, Codec):
+                return codec
+            else:
+                return codec(value_type)
+
+    return None
+
+
+# Values of these types are converted to and from JSON and binary data
+# without a codec
+_plain_types = set([bool, int, float, str, bytes, list, dict])
+if sys.version_info[0] < 3:
+    _plain_types.update([long, unicode])
+
+
+def _is_plain_type(value_type):
+    return value_type in _plain_types
+
+
+# The codecs for types in the standard library are only created, and their
+# modules imported, when a field of that type is first converted. The types
+# are found by module and name, since a field can't have one of these types
+# unless its module has already been imported.
+def _builtin_codec(value_type):
+    key = (getattr(value_type, "__module__", None), getattr(value_type, "__name__", None))
+    create_codec = _builtin_codecs.get(key)
+    if create_codec is None:
+        return None
+    codec = create_codec()
+    _codecs[value_type] = codec
+    return codec
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def _isoformat_parser(value_type, formats, convert):
+    fromisoformat = getattr(value_type, "fromisoformat", None)
+    if fromisoformat is not None:
+        return fromisoformat
+
+    import datetime
+
+    def parse(value):
+        for value_format in formats:
+            try:
+                return convert(datetime.datetime.strptime(value, value_format))
+            except ValueError:
+                pass
+        raise ValueError("invalid isoformat string: {0!r}".format(value))
+
+    return parse
+
+
+def _datetime_codec():
+    import datetime
+    return Codec(_isoformat, _isoformat_parser(
+        datetime.datetime,
+        ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"],
+        lambda value: value,
+    ))
+
+
+def _date_codec():
+    import datetime
+    return Codec(_isoformat, _isoformat_parser(
+        datetime.date,
+        ["%Y-%m-%d"],
+        lambda value: value.date(),
+    ))
+
+
+def _time_codec():
+    import datetime
+    return Codec(_isoformat, _isoformat_parser(
+        datetime.time,
+        ["%H:%M:%S.%f", "%H:%M:%S"],
+        lambda value: value.time(),
+    ))
+
+
+def _decimal_codec():
+    import decimal
+    return Codec(str, decimal.Decimal)
+
+
+def _uuid_codec():
+    import uuid
+    return Codec(str, uuid.UUID)
+
+
+def _enum_codec():
+    return lambda enum_type: Codec(lambda value: value.value, enum_type)
+
+
+_builtin_codecs = {
+    ("datetime", "datetime"): _datetime_codec,
+    ("datetime", "date"): _date_codec,
+    ("datetime", "time"): _time_codec,
+    ("decimal", "Decimal"): _decimal_codec,
+    ("uuid", "UUID"): _uuid_codec,
+    ("enum", "Enum"): _enum_codec,
+}
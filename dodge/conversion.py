@@ -1,16 +1,25 @@
 import sys
-import json
-import re
+import array
+import itertools
+import operator
 try:
     from collections import OrderedDict
 except ImportError:
     from ordereddict import OrderedDict
 
-from .data import _fields_attr, fields as _fields
+from .data import (
+    data_class, _fields_attr, _missing_argument_error, fields as _fields, _is_frozen,
+    _ListOf, _DictOf, _Optional, _reduce_as, _stands_in_for_attr, _unique_name,
+)
+from .codecs import Codec, codec_for, _is_plain_type
+from .json_backends import _json_backend
 
 
 def _from_camel_case(string):
     # http://stackoverflow.com/questions/1175208
+    # The results are cached by the conversion plan, so re is only imported
+    # when a key isn't the name of a field
+    import re
     s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', string)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
@@ -26,93 +35,1099 @@ def _to_camel_case(value):
     return "".join(next(c)(x) if x else '_' for x in value.split("_"))
 
 
-def dumps(obj):
-    return json.dumps(obj_to_dict(obj))
+def dumps(obj, backend=None):
+    return _json_backend(backend).dumps(obj_to_dict(obj, ordered=_ordered_for_json))
 
 
-def loads(string, cls):
-    return dict_to_obj(json.loads(string), cls)
+def loads(string, cls, lazy=False, backend=None, intern=False):
+    return dict_to_obj(_json_backend(backend).loads(string), cls, lazy=lazy, intern=intern)
 
 
-def dict_to_obj(dict_kwargs, cls):
-    dict_kwargs_without_camel_case = dict(
-        (_from_camel_case(key), value)
-        for key, value in _iteritems(dict_kwargs)
-    )
+def dump_lines(objs, fp, batch_size=1000, backend=None):
+    json_dumps = _json_backend(backend).dumps
+    lines = []
+    for obj in objs:
+        lines.append(json_dumps(obj_to_dict(obj, ordered=_ordered_for_json)))
+        if len(lines) >= batch_size:
+            _write_lines(fp, lines)
+            lines = []
     
-    fields = dict(
-        (field.name, field)
-        for field in _fields(cls)
-    )
+    if lines:
+        _write_lines(fp, lines)
+
+
+def _write_lines(fp, lines):
+    lines.append("")
+    fp.write("\n".join(lines))
+
+
+def load_lines(fp, cls, backend=None, intern=False):
+    # Every line shares the same interner, so values repeated across lines
+    # are shared
+    json_loads = _json_backend(backend).loads
+    interner = _interner(intern)
+    for line in fp:
+        if line.strip():
+            yield dict_to_obj(json_loads(line), cls, intern=interner)
+
+
+# Plain dicts keep the order of their keys from Python 3.7, so JSON can be
+# written from them without the cost of creating an OrderedDict
+_ordered_for_json = sys.version_info[:2] < (3, 7)
+
+
+# Conversions to and from dicts use an explicit stack rather than recursing
+# into nested objects, so there's no limit on how deeply objects can be
+# nested.
+
+def dict_to_obj(dict_kwargs, cls, lazy=False, intern=False):
+    interner = _interner(intern)
+    if lazy:
+        if interner is not None:
+            raise ValueError("values can't be interned when converting lazily")
+        return _lazy_dict_to_obj(dict_kwargs, cls)
     
-    def _read_value(key, value):
-        field = fields[key]
-        if field.type is None:
-            return value
-        else:
-            return dict_to_obj(value, field.type)
+    result = {}
+    _dicts_to_objs(_ObjStack([(dict_kwargs, cls, result, None)], interner))
+    return result[None]
+
+
+class _ObjStack(list):
+    # Each entry is the dict to convert, the class to convert it to, and the
+    # kwargs of the parent object (or the list or dict) and the key that the
+    # converted object belongs in. Objects are built with interner, if it's
+    # not None.
+    def __init__(self, entries, interner):
+        super(_ObjStack, self).__init__(entries)
+        self.interner = interner
+
+
+# Interning shares a single instance between equal strings and equal objects
+# of frozen data classes, which are the only objects that are safe to share.
+# Objects are looked up by their class and the values of their fields before
+# they're built, so duplicate objects are never built.
+
+class Interner(object):
+    def __init__(self, max_size=10000):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._values = OrderedDict()
+    
+    def build(self, cls, kwargs):
+        for name, value in list(_iteritems(kwargs)):
+            if type(value) is _text_type:
+                kwargs[name] = self._shared(value, value)
+        
+        if not _is_frozen(cls):
+            return cls(**kwargs)
+        
+        try:
+            # Values of different types can be equal, such as 1 and True
+            key = (cls, frozenset(
+                (name, type(value), value)
+                for name, value in _iteritems(kwargs)
+            ))
+            obj = self._values.pop(key)
+        except KeyError:
+            obj = cls(**kwargs)
+        except TypeError:
+            # Values that can't be hashed can't be used as keys
+            return cls(**kwargs)
+        return self._store(key, obj)
     
-    raw_kwargs = (
-        (key, value)
-        for key, value in _iteritems(dict_kwargs_without_camel_case)
-        if key in fields
-    )
+    def _shared(self, key, value):
+        try:
+            value = self._values.pop(key)
+        except KeyError:
+            pass
+        return self._store(key, value)
+    
+    def _store(self, key, value):
+        # The most recently used values are kept at the end, so the least
+        # recently used value is discarded first
+        values = self._values
+        values[key] = value
+        if len(values) > self.max_size:
+            values.popitem(last=False)
+        return value
+
+
+def _interner(intern):
+    if intern is True:
+        return Interner()
+    elif intern is False or intern is None:
+        return None
+    else:
+        return intern
+
+
+def _dicts_to_objs(stack):
+    # Objects are built in reverse order so that nested objects are built
+    # before the objects that contain them
+    pending = []
     
-    cls_kwargs = dict(
-        (key, _read_value(key, value))
-        for key, value in raw_kwargs
-    )
+    while stack:
+        dict_kwargs, cls, parent_kwargs, parent_key = stack.pop()
+        plan = _plan(cls)
+        kwargs = plan.kwargs_for_dict(dict_kwargs)
+        
+        for name, decode in plan.decoders:
+            value = kwargs.get(name)
+            if value is not None:
+                kwargs[name] = decode(value)
+        
+        for name, field_type in plan.nested_fields:
+            if name in kwargs:
+                stack.append((kwargs[name], field_type, kwargs, name))
+        
+        for name, decode in plan.container_decoders:
+            value = kwargs.get(name)
+            if value is not None:
+                decode(value, kwargs, name, stack)
+        
+        pending.append((cls, kwargs, parent_kwargs, parent_key))
     
-    return cls(**cls_kwargs)
+    interner = stack.interner
+    if interner is None:
+        for cls, kwargs, parent_kwargs, parent_key in reversed(pending):
+            parent_kwargs[parent_key] = cls(**kwargs)
+    else:
+        for cls, kwargs, parent_kwargs, parent_key in reversed(pending):
+            parent_kwargs[parent_key] = interner.build(cls, kwargs)
 
 
-def obj_to_dict(obj):
-    def _serialise(value):
-        if hasattr(value, _fields_attr):
-            return obj_to_dict(value)
+# Validation follows the same steps as dict_to_obj, but only checks the
+# values of each field, so no objects are built. Nested objects are checked
+# in the order they're found, by appending them to the list being iterated
+# over. Paths are built as (parent, key) pairs, and only turned into lists
+# for errors.
+
+ValidationError = data_class("ValidationError", ["path", "message"])
+
+
+def validate(value, cls, backend=None):
+    # Returns a ValidationError for each problem with a dict, or a JSON
+    # string, that would be converted to cls
+    if isinstance(value, _string_types):
+        try:
+            value = _json_backend(backend).loads(value)
+        except ValueError:
+            return [ValidationError([], "invalid JSON")]
+    
+    errors = []
+    pending = []
+    _check_obj(value, cls, None, errors, pending)
+    for dict_kwargs, cls, path in pending:
+        plan = _plan(cls)
+        names_by_key = plan._names_by_key
+        checks = plan.value_checks()
+        names = set()
+        
+        for key, value in _iteritems(dict_kwargs):
+            name = names_by_key.get(key)
+            if name is None:
+                field = plan.field_for_key(key)
+                if field is None:
+                    errors.append(_validation_error((path, key), "unknown field"))
+                    continue
+                name = field.name
+            names.add(name)
+            check = checks.get(name)
+            if check is not None:
+                check(value, (path, key), errors, pending)
+        
+        for name, key in plan.required_keys():
+            if name not in names:
+                errors.append(_validation_error((path, key), "missing field"))
+    
+    return errors
+
+
+def _check_obj(value, cls, path, errors, pending):
+    if isinstance(value, dict):
+        pending.append((value, cls, path))
+    else:
+        errors.append(_validation_error(path, "expected object"))
+
+
+def _validation_error(path, message):
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    keys.reverse()
+    return ValidationError(keys, message)
+
+
+def _lazy_dict_to_obj(dict_kwargs, cls):
+    # Fields are converted when they're first accessed, which includes
+    # reporting any missing fields
+    lazy_type = _plan(cls).lazy_type()
+    obj = lazy_type.__new__(lazy_type)
+    super(cls, obj).__init__()
+    object.__setattr__(obj, "_dodge_lazy_source", dict_kwargs)
+    return obj
+
+
+def _create_lazy_type(plan):
+    cls = plan.cls
+    
+    def __getattr__(self, name):
+        # Only called if the attribute hasn't been set, so each field is
+        # converted at most once
+        field = plan.field_for_name(name)
+        if field is None:
+            raise AttributeError(name)
+        
+        try:
+            values = object.__getattribute__(self, "_dodge_lazy_values")
+        except AttributeError:
+            try:
+                dict_kwargs = object.__getattribute__(self, "_dodge_lazy_source")
+            except AttributeError:
+                raise AttributeError(name)
+            values = plan.kwargs_for_dict(dict_kwargs)
+            object.__setattr__(self, "_dodge_lazy_values", values)
+        
+        if name in values:
+            value = values[name]
+            if name in plan.nested_types_by_name:
+                value = _lazy_dict_to_obj(value, plan.nested_types_by_name[name])
+            elif value is not None and name in plan.dict_decoders_by_name:
+                value = plan.dict_decoders_by_name[name](value)
+        elif field.has_default:
+            value = field.default
         else:
-            return value
+            raise _missing_argument_error(name)
+        
+        object.__setattr__(self, name, value)
+        return value
     
-    return OrderedDict(
-        (_to_camel_case(field.name), _serialise(getattr(obj, field.name)))
-        for field in _fields(obj)
-    )
+    def __reduce__(self):
+        # Lazily converted objects are pickled as instances of their data
+        # class, since their type can't be pickled
+        return _reduce_as(self, cls)
     
+    lazy_type = type(cls.__name__, (cls, ), {
+        "__slots__": ("_dodge_lazy_source", "_dodge_lazy_values"),
+        "__getattr__": __getattr__,
+        "__reduce__": __reduce__,
+        _plan_attr: plan,
+        _stands_in_for_attr: cls,
+    })
+    lazy_type.__module__ = cls.__module__
+    return lazy_type
+
+
+def obj_to_dict(obj, ordered=True):
+    dict_type = OrderedDict if ordered else dict
+    result = dict_type()
+    _objs_to_dicts(_DictStack([(obj, result)], dict_type))
+    return result
+
+
+class _DictStack(list):
+    # Each entry is the object to convert and the dict to convert it into,
+    # which is created with dict_type
+    def __init__(self, entries, dict_type):
+        super(_DictStack, self).__init__(entries)
+        self.dict_type = dict_type
+
+
+def _objs_to_dicts(stack):
+    while stack:
+        obj, obj_dict = stack.pop()
+        for name, key, encode, encode_container in _plan(type(obj)).dict_keys:
+            value = getattr(obj, name)
+            if value is None:
+                pass
+            elif encode is not None:
+                value = encode(value)
+            elif encode_container is not None:
+                value = encode_container(value, stack)
+            elif hasattr(value, _fields_attr):
+                value = _push_obj_to_dict(value, stack)
+            obj_dict[key] = value
+
+
+def _push_obj_to_dict(obj, stack):
+    obj_dict = stack.dict_type()
+    stack.append((obj, obj_dict))
+    return obj_dict
+
+
+# Each object in a list or dict field is converted to its own flat list,
+# so that a field always takes up a single value in a flat list. Like nested
+# objects in dicts, those objects are added to a stack of objects to convert
+# rather than converted recursively.
 
 def obj_to_flat_list(obj):
     result = []
+    _objs_to_flat_lists([(obj, result)])
+    return result
+
+
+def _objs_to_flat_lists(pending):
+    while pending:
+        obj, result = pending.pop()
+        stack = [obj]
+        
+        while stack:
+            value = stack.pop()
+            if hasattr(value, _fields_attr):
+                plan = _plan(type(value))
+                values = plan.reversed_values(value)
+                if plan.reversed_flat_encoders is not None:
+                    values = [
+                        value if encode is None or value is None else encode(value, pending)
+                        for encode, value in zip(plan.reversed_flat_encoders, values)
+                    ]
+                stack.extend(values)
+            else:
+                result.append(value)
+
+
+# Values are read by index, so any sequence can be used, including a
+# memoryview over an array.array or an mmap'd file, without copying it.
+
+def flat_list_to_obj(values, cls, offset=0):
+    return _flat_list_to_obj(values, _plan(cls), offset)
+
+
+def flat_list_to_objs(values, cls, offset=0, count=None):
+    # Reads count consecutive objects starting at offset, or as many as
+    # values holds if count is None
+    plan = _plan(cls)
+    record_length = plan.flat_length()
     
-    def _serialise_obj(value):
-        if hasattr(value, _fields_attr):
-            for field in _fields(value):
-                _serialise_obj(getattr(value, field.name))
+    if count is None:
+        remaining = len(values) - offset
+        if record_length == 0:
+            count = 0
+        elif remaining % record_length:
+            raise ValueError("values do not hold a whole number of records")
         else:
-            result.append(value)
-            
-    _serialise_obj(obj)
-    return result
+            count = remaining // record_length
+    end = offset + count * record_length
+    if end > len(values):
+        raise ValueError("values end before last record")
+    
+    if plan.is_flat:
+        # Records are read by zipping one iterator over the values with
+        # itself, which copies no values, unlike slicing a list
+        if record_length:
+            value_iterator = itertools.islice(values, offset, end)
+            return list(map(plan.build, zip(*[value_iterator] * record_length)))
+        else:
+            return [plan.build(()) for _ in range(count)]
+    else:
+        return [
+            _flat_list_to_obj(values, plan, index)
+            for index in range(offset, end, record_length)
+        ]
+
+
+def _flat_list_to_obj(values, plan, index):
+    if plan.flat_layout_has_containers():
+        result = [None]
+        _flat_lists_to_objs([(values, plan, index, result, 0)])
+        return result[0]
+    else:
+        return _build_from_flat_layout(values, plan.flat_layout(), index, None)
+
+
+def _flat_lists_to_objs(stack):
+    # Each entry is a flat list, the plan and index of the object it holds,
+    # and the container and key to store the object in. Containers in each
+    # flat list are converted first, adding any objects they hold to the
+    # stack, so objects are built in reverse order, as in _dicts_to_objs.
+    pending = []
+    
+    while stack:
+        values, plan, index, target, key = stack.pop()
+        start = index
+        containers = []
+        for entry in plan.flat_layout():
+            if entry is None:
+                index += 1
+            elif not isinstance(entry, _ConversionPlan):
+                value = values[index]
+                containers.append(None)
+                if value is not None:
+                    entry(value, containers, len(containers) - 1, stack)
+                index += 1
+        pending.append((values, plan, start, containers, target, key))
+    
+    for values, plan, start, containers, target, key in reversed(pending):
+        target[key] = _build_from_flat_layout(values, plan.flat_layout(), start, containers)
+
+
+def _build_from_flat_layout(values, layout, index, containers):
+    stack = []
+    container_index = 0
+    
+    for entry in layout:
+        if entry is None:
+            stack.append(values[index])
+            index += 1
+        elif isinstance(entry, _ConversionPlan):
+            args_start = len(stack) - len(entry.fields)
+            obj = entry.build(stack[args_start:])
+            del stack[args_start:]
+            stack.append(obj)
+        else:
+            stack.append(containers[container_index])
+            container_index += 1
+            index += 1
+    
+    return stack[0]
+
+
+def _decode_flat_value(decode, value):
+    # Converts the value of a single container field of a flat list
+    result = [None]
+    stack = []
+    decode(value, result, 0, stack)
+    _flat_lists_to_objs(stack)
+    return result[0]
+
+
+def objs_to_columns(objs, cls, typecodes=None, use_numpy=False):
+    if not isinstance(objs, list):
+        objs = list(objs)
+    
+    plan = _plan(cls)
+    typecodes = _check_column_names(plan, typecodes or {})
+    
+    columns = OrderedDict()
+    for column_name, getter in plan.columns():
+        values = list(map(getter, objs))
+        typecode = typecodes.get(column_name)
+        if typecode is not None:
+            values = _to_array(values, typecode, use_numpy)
+        columns[column_name] = values
+    return columns
+
+
+def _check_column_names(plan, column_names):
+    for column_name in column_names:
+        if column_name not in plan.column_names():
+            raise ValueError("unknown column: '{0}'".format(column_name))
+    return column_names
 
 
-def flat_list_to_obj(values, cls):
-    values = list(reversed(values))
+def _to_array(values, typecode, use_numpy):
+    if use_numpy:
+        import numpy
+        return numpy.array(values, dtype=typecode)
+    else:
+        return array.array(typecode, values)
+
+
+def columns_to_objs(columns, cls):
+    values = []
+    for column_name in _plan(cls).column_names():
+        if column_name not in columns:
+            raise ValueError("missing column: '{0}'".format(column_name))
+        values.append(_to_list(columns[column_name]))
+    
+    if len(set(map(len, values))) > 1:
+        raise ValueError("columns have different lengths")
     
-    def _unserialise_type(target_type):
-        if target_type is None:
-            return values.pop()
+    return _columns_to_objs(iter(values), cls)
+
+
+def _to_list(column):
+    # array.array and NumPy arrays both convert their elements to Python
+    # values in a single call
+    to_list = getattr(column, "tolist", None)
+    if to_list is None:
+        return column
+    else:
+        return to_list()
+
+
+def _columns_to_objs(columns, cls):
+    plan = _plan(cls)
+    field_columns = [
+        next(columns) if field_type is None else _columns_to_objs(columns, field_type)
+        for field_type in plan.types
+    ]
+    return list(map(plan.build, zip(*field_columns)))
+
+
+def clear_conversion_plan(cls):
+    # Plans are stored on the class they describe, so they're discarded
+    # along with dynamically created classes. Clearing a plan is only
+    # needed if the fields of a class are changed after it's been converted.
+    if _plan_attr in cls.__dict__:
+        delattr(cls, _plan_attr)
+
+
+def _plan(cls):
+    # Look in the class's own __dict__ so that a data class that extends
+    # another data class doesn't use its base's plan
+    plan = cls.__dict__.get(_plan_attr)
+    if plan is None:
+        plan = _ConversionPlan(cls)
+        setattr(cls, _plan_attr, plan)
+    return plan
+
+
+_plan_attr = _unique_name()
+
+
+class _ConversionPlan(object):
+    def __init__(self, cls):
+        fields = _fields(cls)
+        self.cls = cls
+        self.fields = fields
+        self.names = [field.name for field in fields]
+        # The data class of each nested field, or None for other fields
+        self.types = [_nested_type(field) for field in fields]
+        self.codecs = [_field_codec(field) for field in fields]
+        containers = [_container_type(field) for field in fields]
+        self.nested_fields = [
+            (name, field_type)
+            for name, field_type in zip(self.names, self.types)
+            if field_type is not None
+        ]
+        self.nested_types_by_name = dict(self.nested_fields)
+        self.decoders = [
+            (name, codec.decode)
+            for name, codec in zip(self.names, self.codecs)
+            if codec is not None
+        ]
+        self.container_decoders = [
+            (name, decode)
+            for name, decode in zip(self.names, map(_container_decoder, containers))
+            if decode is not None
+        ]
+        self.dict_keys = [
+            (
+                field.name,
+                _to_camel_case(field.name),
+                None if codec is None else codec.encode,
+                None if container is None else _converter(container, _to_dict_converter, _to_dict_codec_converter),
+            )
+            for field, codec, container in zip(fields, self.codecs, containers)
+        ]
+        # Converts the value of each field to and from the values in its
+        # dict, for fields other than nested objects
+        self.dict_codecs = [
+            codec if container is None else _container_codec(container)
+            for codec, container in zip(self.codecs, containers)
+        ]
+        self.typed_names = list(zip(self.names, self.types, self.dict_codecs))
+        self.dict_decoders_by_name = dict(
+            (name, codec.decode)
+            for name, codec in zip(self.names, self.dict_codecs)
+            if codec is not None
+        )
+        # Whether objects can be converted to and from flat lists and dicts
+        # without converting any of their fields
+        self.is_flat = not (self.nested_fields or self.container_decoders)
+        self.is_leaf = self.is_flat and not self.decoders
+        self._positional_argument_length = len(
+            list(itertools.takewhile(lambda field: not field.keyword_only, fields))
+        )
+        
+        self.values = _values_getter(self.names)
+        self.reversed_values = _values_getter(self.names[::-1])
+        if self.container_decoders:
+            self.reversed_flat_encoders = [
+                None if container is None else _converter(container, _to_flat_list_converter, _flat_list_codec_converter)
+                for container in reversed(containers)
+            ]
         else:
-            args = [
-                _unserialise_type(field.type)
-                for field in _fields(target_type)
+            self.reversed_flat_encoders = None
+        self._flat_types = [
+            field_type if container is None else _flat_container_decoder(container)
+            for field_type, container in zip(self.types, containers)
+        ]
+        self._columns = None
+        self._column_names = None
+        self._flat_layout = None
+        self._flat_layout_has_containers = None
+        self._flat_length = None
+        self._lazy_type = None
+        self._value_checks = None
+        self._required_keys = None
+        
+        self._fields_by_name = dict(
+            (field.name, field)
+            for field in fields
+        )
+        # The key of a field may not convert back to its name, such as the
+        # key "field1" of the field "field_1", so keys are added directly,
+        # followed by names so that a name wins over the key of another field
+        self._fields_by_key = {}
+        for name, key, encode, encode_container in self.dict_keys:
+            self._fields_by_key[key] = self._fields_by_name[name]
+        self._fields_by_key.update(self._fields_by_name)
+        self._names_by_key = dict(
+            (key, field.name)
+            for key, field in self._fields_by_key.items()
+        )
+        # Bounds the number of other keys remembered, so that arbitrary
+        # input can't grow the cache without limit
+        self._max_keys = len(self._fields_by_key) + 256
+    
+    def field_for_name(self, name):
+        return self._fields_by_name.get(name)
+    
+    def field_for_key(self, key):
+        try:
+            return self._fields_by_key[key]
+        except KeyError:
+            if len(self._fields_by_key) < self._max_keys:
+                return self._add_key(key)
+            else:
+                return self._fields_by_name.get(_from_camel_case(key))
+    
+    def columns(self):
+        if self._columns is None:
+            self._columns = [
+                (column_name, operator.attrgetter(column_name))
+                for column_name in self.column_names()
             ]
-            return target_type(*args)
+        return self._columns
+    
+    def column_names(self):
+        if self._column_names is None:
+            column_names = []
+            for name, field_type in zip(self.names, self.types):
+                if field_type is None:
+                    column_names.append(name)
+                else:
+                    column_names += [
+                        name + "." + column_name
+                        for column_name in _plan(field_type).column_names()
+                    ]
+            self._column_names = column_names
+        return self._column_names
+    
+    def flat_layout(self):
+        # The steps to build an object from a flat list, in order: None reads
+        # the next value, a function reads and converts the next value, and a
+        # plan builds an object from the values or objects built by the
+        # previous steps for each of its fields
+        if self._flat_layout is None:
+            layout = []
+            stack = [self.cls]
+            while stack:
+                entry = stack.pop()
+                if hasattr(entry, _fields_attr):
+                    plan = _plan(entry)
+                    stack.append(plan)
+                    stack.extend(reversed(plan._flat_types))
+                else:
+                    layout.append(entry)
+            self._flat_layout = layout
+        return self._flat_layout
     
+    def flat_layout_has_containers(self):
+        if self._flat_layout_has_containers is None:
+            self._flat_layout_has_containers = any(
+                entry is not None and not isinstance(entry, _ConversionPlan)
+                for entry in self.flat_layout()
+            )
+        return self._flat_layout_has_containers
+    
+    def flat_length(self):
+        # The number of values in the flat list of each object
+        if self._flat_length is None:
+            self._flat_length = sum(
+                1 for entry in self.flat_layout()
+                if not isinstance(entry, _ConversionPlan)
+            )
+        return self._flat_length
+    
+    def lazy_type(self):
+        if self._lazy_type is None:
+            self._lazy_type = _create_lazy_type(self)
+        return self._lazy_type
+    
+    def value_checks(self):
+        # The function that checks the value of each field, for fields with
+        # values other than plain values
+        if self._value_checks is None:
+            self._value_checks = dict(
+                (field.name, check)
+                for field, check in zip(self.fields, map(_field_check, self.fields))
+                if check is not None
+            )
+        return self._value_checks
+    
+    def required_keys(self):
+        if self._required_keys is None:
+            self._required_keys = [
+                (name, key)
+                for field, (name, key, encode, encode_container) in zip(self.fields, self.dict_keys)
+                if not field.has_default
+            ]
+        return self._required_keys
     
-    return _unserialise_type(cls)
+    def kwargs_for_dict(self, dict_kwargs):
+        names_by_key = self._names_by_key
+        kwargs = {}
+        for key, value in _iteritems(dict_kwargs):
+            name = names_by_key.get(key)
+            if name is None:
+                field = self.field_for_key(key)
+                if field is None:
+                    continue
+                name = field.name
+            kwargs[name] = value
+        return kwargs
+    
+    def objs_from_dicts(self, dicts):
+        cls = self.cls
+        kwargs_for_dict = self.kwargs_for_dict
+        return [cls(**kwargs_for_dict(dict_kwargs)) for dict_kwargs in dicts]
+    
+    def build(self, values):
+        # Keyword-only fields can't be passed by position
+        positional_argument_length = self._positional_argument_length
+        if positional_argument_length == len(values):
+            return self.cls(*values)
+        else:
+            return self.cls(
+                *values[:positional_argument_length],
+                **dict(zip(self.names[positional_argument_length:], values[positional_argument_length:]))
+            )
+    
+    def _add_key(self, key):
+        field = self._fields_by_key[key] = self._fields_by_name.get(_from_camel_case(key))
+        return field
+
+
+def _nested_type(field):
+    if field.codec is None and hasattr(field.type, _fields_attr):
+        return field.type
+    else:
+        return None
+
+
+def _field_codec(field):
+    if (
+        field.codec is not None or
+        field.type is None or
+        _is_plain_type(field.type) or
+        hasattr(field.type, _fields_attr) or
+        isinstance(field.type, _container_types)
+    ):
+        return field.codec
+    
+    codec = codec_for(field.type)
+    if codec is None:
+        # Values of other types are converted as they are, as they were
+        # before codecs were added, but can't be read back
+        return Codec(_unconverted, _missing_codec_decoder(field))
+    return codec
+
+
+def _unconverted(value):
+    return value
+
+
+def _missing_codec_decoder(field):
+    def decode(value):
+        raise ValueError("no codec for type of field '{0}': {1}".format(field.name, field.type.__name__))
+    
+    return decode
+
+
+def _container_type(field):
+    if field.codec is None and isinstance(field.type, _container_types):
+        return field.type
+    else:
+        return None
+
+
+_container_types = (_ListOf, _DictOf, _Optional)
+
+
+# The values in lists, dicts and optional fields are converted by functions
+# built once per field from the type of the field, so that the elements of
+# a container are converted in a single loop. Each function takes the value
+# to convert and the stack of the conversion.
+
+def _converter(value_type, obj_converter, codec_converter):
+    # Returns None if values of the type are left unchanged
+    if value_type is None or _is_plain_type(value_type):
+        return None
+    elif isinstance(value_type, _ListOf):
+        convert_element = _converter(value_type.element_type, obj_converter, codec_converter)
+        if convert_element is None:
+            return lambda value, stack: list(value)
+        else:
+            return lambda value, stack: [convert_element(element, stack) for element in value]
+    elif isinstance(value_type, _DictOf):
+        convert_element = _converter(value_type.value_type, obj_converter, codec_converter)
+        if convert_element is None:
+            return lambda value, stack: dict(value)
+        else:
+            return lambda value, stack: dict(
+                (key, convert_element(element, stack))
+                for key, element in _iteritems(value)
+            )
+    elif isinstance(value_type, _Optional):
+        convert_value = _converter(value_type.value_type, obj_converter, codec_converter)
+        if convert_value is None:
+            return None
+        else:
+            return lambda value, stack: None if value is None else convert_value(value, stack)
+    elif hasattr(value_type, _fields_attr):
+        return obj_converter(value_type)
+    else:
+        return codec_converter(_codec_for_element(value_type))
+
+
+def _to_dict_converter(cls):
+    return _push_obj_to_dict
+
+
+def _to_dict_codec_converter(codec):
+    encode = codec.encode
+    return lambda value, stack: None if value is None else encode(value)
+
+
+def _flat_list_codec_converter(codec):
+    # Flat lists keep values as they are
+    return None
+
+
+def _to_flat_list_converter(cls):
+    # The stack holds objects and the flat lists to convert them into
+    def convert(value, stack):
+        plan = _plan(cls)
+        if plan.is_flat:
+            return list(plan.values(value))
+        else:
+            result = []
+            stack.append((value, result))
+            return result
+    return convert
+
+
+def _flat_container_decoder(value_type):
+    # Like _container_decoder, but for values in flat lists, which hold
+    # values with codecs as they are, and each object as its own flat list.
+    # Objects are added to the stack of _flat_lists_to_objs rather than being
+    # built immediately, unless none of their fields need converting.
+    if isinstance(value_type, _ListOf):
+        decode_element = _flat_container_decoder(value_type.element_type)
+        if decode_element is None:
+            def decode(value, target, key, stack):
+                target[key] = list(value)
+        else:
+            def decode(value, target, key, stack):
+                result = target[key] = list(value)
+                for index, element in enumerate(result):
+                    if element is not None:
+                        decode_element(element, result, index, stack)
+        return decode
+    elif isinstance(value_type, _DictOf):
+        decode_element = _flat_container_decoder(value_type.value_type)
+        if decode_element is None:
+            def decode(value, target, key, stack):
+                target[key] = dict(value)
+        else:
+            def decode(value, target, key, stack):
+                result = target[key] = dict(value)
+                for element_key, element in _iteritems(value):
+                    if element is not None:
+                        decode_element(element, result, element_key, stack)
+        return decode
+    elif isinstance(value_type, _Optional):
+        return _flat_container_decoder(value_type.value_type)
+    elif hasattr(value_type, _fields_attr):
+        def decode(value, target, key, stack):
+            plan = _plan(value_type)
+            if plan.is_flat:
+                target[key] = plan.build(value)
+            else:
+                stack.append((value, plan, 0, target, key))
+        return decode
+    else:
+        return None
+
+
+def _field_check(field):
+    # Values of nested objects can't be None, but dict_to_obj leaves None
+    # in place for other fields
+    if field.codec is not None:
+        return _codec_check(field.codec)
+    
+    check = _value_check(field.type)
+    if check is None or hasattr(field.type, _fields_attr):
+        return check
+    else:
+        return lambda value, path, errors, pending: value is None or check(value, path, errors, pending)
+
+
+def _value_check(value_type):
+    # Returns a function that takes a value, its path, the list of errors and
+    # the objects pending validation, or None if any value is allowed
+    if value_type is None or _is_plain_type(value_type):
+        return None
+    elif isinstance(value_type, _ListOf):
+        check_element = _value_check(value_type.element_type)
+        def check(value, path, errors, pending):
+            if not isinstance(value, (list, tuple)):
+                errors.append(_validation_error(path, "expected list"))
+            elif check_element is not None:
+                for index, element in enumerate(value):
+                    check_element(element, (path, index), errors, pending)
+        return check
+    elif isinstance(value_type, _DictOf):
+        check_element = _value_check(value_type.value_type)
+        def check(value, path, errors, pending):
+            if not isinstance(value, dict):
+                errors.append(_validation_error(path, "expected object"))
+            elif check_element is not None:
+                for key, element in _iteritems(value):
+                    check_element(element, (path, key), errors, pending)
+        return check
+    elif isinstance(value_type, _Optional):
+        check_value = _value_check(value_type.value_type)
+        if check_value is None:
+            return None
+        else:
+            return lambda value, path, errors, pending: value is None or check_value(value, path, errors, pending)
+    elif hasattr(value_type, _fields_attr):
+        return lambda value, path, errors, pending: _check_obj(value, value_type, path, errors, pending)
+    else:
+        return _codec_check(_codec_for_element(value_type))
+
+
+def _codec_check(codec):
+    decode = codec.decode
+    def check(value, path, errors, pending):
+        if value is not None:
+            # Codecs may be written by users, so any error while decoding
+            # means that the value is invalid
+            try:
+                decode(value)
+            except Exception:
+                errors.append(_validation_error(path, "invalid value"))
+    return check
+
+
+def _container_decoder(value_type):
+    # Returns a function that takes the value to convert, the container and
+    # key to store the converted value in, and the stack of dict_to_obj.
+    # Objects are added to the stack rather than being built immediately,
+    # unless none of their fields need converting.
+    if value_type is None or _is_plain_type(value_type):
+        return None
+    elif isinstance(value_type, _ListOf):
+        element_type = value_type.element_type
+        decode_element = _container_decoder(element_type)
+        if decode_element is None:
+            def decode(value, target, key, stack):
+                target[key] = list(value)
+        elif hasattr(element_type, _fields_attr):
+            def decode(value, target, key, stack):
+                plan = _plan(element_type)
+                if plan.is_leaf and stack.interner is None:
+                    target[key] = plan.objs_from_dicts(value)
+                else:
+                    result = target[key] = list(value)
+                    for index, element in enumerate(result):
+                        stack.append((element, element_type, result, index))
+        else:
+            def decode(value, target, key, stack):
+                result = target[key] = list(value)
+                for index, element in enumerate(result):
+                    decode_element(element, result, index, stack)
+        return decode
+    elif isinstance(value_type, _DictOf):
+        decode_element = _container_decoder(value_type.value_type)
+        if decode_element is None:
+            def decode(value, target, key, stack):
+                target[key] = dict(value)
+        else:
+            def decode(value, target, key, stack):
+                result = target[key] = dict(value)
+                for element_key, element in _iteritems(value):
+                    decode_element(element, result, element_key, stack)
+        return decode
+    elif isinstance(value_type, _Optional):
+        decode_value = _container_decoder(value_type.value_type)
+        if decode_value is None:
+            return None
+        
+        def decode(value, target, key, stack):
+            if value is None:
+                target[key] = None
+            else:
+                decode_value(value, target, key, stack)
+        return decode
+    elif hasattr(value_type, _fields_attr):
+        def decode(value, target, key, stack):
+            stack.append((value, value_type, target, key))
+        return decode
+    else:
+        decode_codec = _codec_for_element(value_type).decode
+        
+        def decode(value, target, key, stack):
+            target[key] = None if value is None else decode_codec(value)
+        return decode
+
+
+def _container_codec(value_type):
+    # Converts a container field on its own, such as when unpacking binary
+    # data or accessing a field of a lazily converted object
+    encode_value = _converter(value_type, _to_dict_converter, _to_dict_codec_converter)
+    decode_value = _container_decoder(value_type)
+    if encode_value is None:
+        return None
+    
+    def encode(value):
+        stack = _DictStack([], OrderedDict)
+        result = encode_value(value, stack)
+        _objs_to_dicts(stack)
+        return result
+    
+    def decode(value):
+        result = {}
+        stack = _ObjStack([], None)
+        decode_value(value, result, None, stack)
+        _dicts_to_objs(stack)
+        return result[None]
+    
+    return Codec(encode, decode)
+
+
+def _codec_for_element(value_type):
+    codec = codec_for(value_type)
+    if codec is None:
+        raise ValueError("no codec for type: {0}".format(value_type.__name__))
+    return codec
+
+
+def _values_getter(names):
+    if len(names) == 1:
+        name, = names
+        return lambda obj: (getattr(obj, name), )
+    elif names:
+        return operator.attrgetter(*names)
+    else:
+        return lambda obj: ()
 
 
 if sys.version_info[0] >= 3:
+    _string_types = (str, bytes)
+    _text_type = str
+    
     def _iteritems(x):
         return x.items()
 else:
+    _string_types = (basestring, )
+    _text_type = unicode
+    
     def _iteritems(x):
         return x.iteritems()
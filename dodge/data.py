@@ -1,90 +1,840 @@
-import uuid
+import binascii
+import itertools
+import keyword
+import os
 import sys
+try:
+    import copyreg
+except ImportError:
+    import copy_reg as copyreg
 
 
 def fields(obj):
     return getattr(obj, _fields_attr)
 
 
-_fields_attr = str(uuid.uuid4())
+def _unique_name():
+    # Used instead of uuid, which is slow to import
+    return binascii.hexlify(os.urandom(16)).decode("ascii")
 
 
-def data_class(name, fields, bases=None):
+_fields_attr = _unique_name()
+
+
+def data_class(name, fields, bases=None, compiled=True, slots=False, frozen=False):
+    fields = [_to_field(field) for field in fields]
+    return _create_data_class(name, fields, bases, compiled, slots, frozen, _caller_module())
+
+
+def data_classes(definitions, compiled=True, slots=False, frozen=False):
+    # Defines several data classes at once. The type of a field may be the
+    # name of any of the classes, including the class of the field itself,
+    # so classes can refer to each other in any order. Only the fields that
+    # refer to classes by name are copied and resolved, and the caller's
+    # module is only found once.
+    module = _caller_module()
+    classes = {}
+    named_fields = []
+    for name, cls_fields in _iteritems(definitions):
+        cls_fields = [_to_field(cls_field) for cls_field in cls_fields]
+        for index, cls_field in enumerate(cls_fields):
+            if cls_field.type is not None and _has_type_names(cls_field.type):
+                cls_fields[index] = cls_field = _copy_field(cls_field)
+                named_fields.append(cls_field)
+        classes[name] = _create_data_class(name, cls_fields, None, compiled, slots, frozen, module)
+    
+    for cls_field in named_fields:
+        cls_field.type = _resolve_type_names(cls_field.type, classes)
+    
+    return classes
+
+
+def _caller_module():
+    try:
+        return sys._getframe(2).f_globals.get("__name__", "__main__")
+    except (AttributeError, ValueError):
+        return None
+
+
+def _copy_field(original, **changes):
+    copied = _Field.__new__(_Field)
+    copied.__dict__.update(original.__dict__)
+    copied.__dict__.update(changes)
+    return copied
+
+
+def _has_type_names(value_type):
+    if isinstance(value_type, _ListOf):
+        return _has_type_names(value_type.element_type)
+    elif isinstance(value_type, (_DictOf, _Optional)):
+        return _has_type_names(value_type.value_type)
+    else:
+        return isinstance(value_type, basestring)
+
+
+def _resolve_type_names(value_type, classes):
+    if isinstance(value_type, basestring):
+        if value_type not in classes:
+            raise ValueError("unknown data class: '{0}'".format(value_type))
+        return classes[value_type]
+    elif isinstance(value_type, _ListOf):
+        return _ListOf(_resolve_type_names(value_type.element_type, classes))
+    elif isinstance(value_type, _DictOf):
+        return _DictOf(_resolve_type_names(value_type.value_type, classes))
+    elif isinstance(value_type, _Optional):
+        return _Optional(_resolve_type_names(value_type.value_type, classes))
+    else:
+        return value_type
+
+
+def _create_data_class(name, fields, bases, compiled, slots, frozen, module):
     if bases is None:
         bases = (object,)
     
-    fields = [_to_field(field) for field in fields]
     _check_for_duplicate_fields(fields)
+    positional_argument_length = _find_first_keyword_argument_index(fields)
+    
+    # _type is added to the namespace once the type has been created
+    namespace = {}
+    if compiled:
+        properties = _deferred_methods(name, fields, positional_argument_length, namespace, frozen)
+    else:
+        properties = _generic_methods(name, fields, positional_argument_length, namespace, frozen)
+    
+    properties["__str__"] = _str
+    properties[_fields_attr] = fields
+    properties[_definition_attr] = (name, fields, bases, compiled, slots, frozen)
+    if module is not None:
+        properties["__module__"] = module
+    if slots:
+        properties["__slots__"] = tuple(field.name for field in fields)
+    if frozen:
+        properties["__setattr__"] = _frozen_setattr
+        properties["__delattr__"] = _frozen_delattr
+        if slots:
+            properties["__slots__"] += (_hash_attr, )
+    
+    new_type = _metaclass(bases)(name, bases, properties)
+    namespace["_type"] = new_type
+    return new_type
+
+
+def _str(self):
+    return repr(self)
+
+
+# Data classes are usually created dynamically, so they can't always be
+# pickled by reference. Instead, classes that can't be imported by name are
+# pickled as their definition along with a token identifying the class.
+# Unpickling the definition finds the class with that token in the current
+# process, or creates it if there isn't one, so that pickled objects can be
+# sent to other processes. Since pickle always saves instances of type by
+# reference, data classes are created with their own metaclass so that they
+# can be reduced with copyreg. Classes are only given a token when they're
+# first pickled, since most classes never are, and weakref is only imported
+# then too.
+_definition_attr = _unique_name()
+_token_attr = _unique_name()
+_found_classes_by_token = None
+
+
+def _classes_by_token():
+    global _found_classes_by_token
+    if _found_classes_by_token is None:
+        import weakref
+        _found_classes_by_token = weakref.WeakValueDictionary()
+    return _found_classes_by_token
+
+
+def _new_token():
+    # Generating a UUID for every class takes longer than creating the rest
+    # of the class, so tokens are unique to the process instead, which
+    # includes the process ID in case the process was forked
+    return "{0}-{1}-{2}".format(_token_prefix, os.getpid(), next(_token_counter))
+
+
+_token_prefix = _unique_name()
+_token_counter = itertools.count()
+
+
+class _DataClassType(type):
+    pass
+
+
+def _metaclass(bases):
+    if bases == (object, ):
+        return _DataClassType
+    
+    base_metaclass = type
+    for base in bases:
+        if issubclass(type(base), base_metaclass):
+            base_metaclass = type(base)
+    
+    if issubclass(base_metaclass, _DataClassType):
+        return base_metaclass
+    elif base_metaclass is type:
+        return _DataClassType
+    
+    metaclass = _metaclasses.get(base_metaclass)
+    if metaclass is None:
+        metaclass = _metaclasses[base_metaclass] = type(
+            base_metaclass.__name__, (base_metaclass, _DataClassType), {})
+        copyreg.pickle(metaclass, _reduce_class)
+    return metaclass
+
+
+_metaclasses = {}
+
+
+def _reduce_class(cls):
+    # Lazy types are pickled as their data class. Other subclasses of data
+    # classes are pickled by reference, like any other class.
+    cls = _data_class(cls)
+    
+    if _is_importable(cls) or _definition_attr not in cls.__dict__:
+        return cls.__name__
+    else:
+        name, cls_fields, bases, compiled, slots, frozen = cls.__dict__[_definition_attr]
+        token = _class_token(cls)
+        if _can_set_state_separately:
+            # The types of fields are set once the class has been unpickled,
+            # so that fields can refer back to their own class
+            untyped_fields = [_copy_field(cls_field, type=None) for cls_field in cls_fields]
+            return (
+                _resolve_class,
+                (token, cls.__module__, name, untyped_fields, bases, compiled, slots, frozen),
+                [cls_field.type for cls_field in cls_fields],
+                None,
+                None,
+                _set_field_types,
+            )
+        else:
+            return (_resolve_class, (token, cls.__module__, name, cls_fields, bases, compiled, slots, frozen))
+
+
+# Python 3.8 added state setters to the reduce protocol
+_can_set_state_separately = sys.version_info[:2] >= (3, 8)
+
+
+def _set_field_types(cls, field_types):
+    for cls_field, field_type in zip(cls.__dict__[_fields_attr], field_types):
+        cls_field.type = field_type
+
+
+def _class_token(cls):
+    token = cls.__dict__.get(_token_attr)
+    if token is None:
+        token = _new_token()
+        setattr(cls, _token_attr, token)
+        _classes_by_token()[token] = cls
+    return token
+
+
+def _is_importable(cls):
+    module = sys.modules.get(cls.__module__)
+    return getattr(module, cls.__name__, None) is cls
+
+
+def _resolve_class(token, module, name, cls_fields, bases, compiled, slots, frozen):
+    cls = _classes_by_token().get(token)
+    if cls is None:
+        cls = data_class(name, cls_fields, bases=bases, compiled=compiled, slots=slots, frozen=frozen)
+        cls.__module__ = module
+        setattr(cls, _definition_attr, (name, cls_fields, bases, compiled, slots, frozen))
+        setattr(cls, _token_attr, token)
+        _classes_by_token()[token] = cls
+    return cls
+
+
+copyreg.pickle(_DataClassType, _reduce_class)
+
+
+# Objects are pickled as the values of their fields, in the same order as
+# fields(cls), rather than their __dict__. As with other objects, __init__
+# isn't called when unpickling, and the values are set by __setstate__. Any
+# other attributes, such as those set by the __init__ of a base class, are
+# pickled as a dict after the values of the fields.
+
+def _reduce_as(obj, cls):
+    # Used for objects that should be unpickled as an instance of cls rather
+    # than their own type
+    return (_restore, (cls, tuple(getattr(obj, field.name) for field in fields(cls))))
+
+
+def _restore(cls, values):
+    obj = cls.__new__(cls)
+    obj.__setstate__(values)
+    return obj
+
+
+def _extra_state(obj, field_names):
+    # Returns None if the object has no attributes other than its fields,
+    # which is checked cheaply for objects with a __dict__ by its length
+    state = None
+    obj_dict = getattr(obj, "__dict__", None)
+    if obj_dict is not None and len(obj_dict) != len(field_names):
+        for name, value in _iteritems(obj_dict):
+            if name not in field_names and name != _hash_attr:
+                if state is None:
+                    state = {}
+                state[name] = value
+    
+    for name in _extra_slots(type(obj), field_names):
+        try:
+            value = getattr(obj, name)
+        except AttributeError:
+            continue
+        if state is None:
+            state = {}
+        state[name] = value
+    
+    return state
+
+
+def _extra_slots(cls, field_names):
+    extra_slots = cls.__dict__.get(_extra_slots_attr)
+    if extra_slots is None:
+        extra_slots = []
+        for base in cls.__mro__:
+            base_slots = base.__dict__.get("__slots__", ())
+            if isinstance(base_slots, basestring):
+                base_slots = (base_slots, )
+            for slot in base_slots:
+                if slot.startswith("__") and not slot.endswith("__"):
+                    slot = "_{0}{1}".format(base.__name__.lstrip("_"), slot)
+                if slot not in field_names and slot not in _special_slots and slot != _hash_attr:
+                    extra_slots.append(slot)
+        extra_slots = tuple(extra_slots)
+        setattr(cls, _extra_slots_attr, extra_slots)
+    return extra_slots
+
+
+def _has_instance_dict(cls):
+    return any(
+        base is not object and "__slots__" not in base.__dict__
+        for base in cls.__mro__
+    )
+
+
+_extra_slots_attr = _unique_name()
+_special_slots = frozenset(["__dict__", "__weakref__"])
+
+
+def _set_extra_state(obj, state):
+    for name, value in _iteritems(state):
+        object.__setattr__(obj, name, value)
+
+
+def _generic_methods(name, fields, positional_argument_length, namespace, frozen):
+    return dict(
+        (method_name, _generic_method(method_name, name, fields, positional_argument_length, namespace, frozen))
+        for method_name in _method_names(frozen)
+    )
+
+
+def _generic_method(method_name, name, fields, positional_argument_length, namespace, frozen):
+    if method_name == "__init__":
+        return _generic_init(name, fields, positional_argument_length, namespace, frozen)
+    elif method_name == "__eq__":
+        return _generic_eq(fields, namespace, frozen)
+    elif method_name == "__ne__":
+        return _generic_ne()
+    elif method_name == "__repr__":
+        return _generic_repr(name, fields)
+    elif method_name == "__reduce__":
+        return _generic_reduce(fields)
+    elif method_name == "__setstate__":
+        return _generic_setstate(fields)
+    else:
+        return _generic_hash(fields)
+
+
+def _generic_init(name, fields, positional_argument_length, namespace, frozen):
     defaults = dict(
         (field.name, field.default)
         for field in fields
         if field.has_default
     )
-    positional_argument_length = _find_first_keyword_argument_index(fields)
+    set_field = object.__setattr__ if frozen else setattr
     
     def __init__(self, *args, **kwargs):
-        super(new_type, self).__init__()
+        super(namespace["_type"], self).__init__()
         
         if len(args) > positional_argument_length:
-            raise TypeError(
-                "{0}.__init__ takes {1} positional argument{2} but {3} {4} given".format(
-                    name,
-                    positional_argument_length,
-                    "" if positional_argument_length == 1 else "s",
-                    len(args),
-                    "was" if len(args) == 1 else "were"))
+            raise _positional_argument_error(name, positional_argument_length, len(args))
         
         for field_index, field in enumerate(fields):
             if field_index < len(args) and not field.keyword_only:
-                setattr(self, field.name, args[field_index])
+                set_field(self, field.name, args[field_index])
             elif field.name in kwargs:
-                setattr(self, field.name, kwargs.pop(field.name))
+                set_field(self, field.name, kwargs.pop(field.name))
             elif field.name in defaults:
-                setattr(self, field.name, defaults[field.name])
+                set_field(self, field.name, defaults[field.name])
             else:
-                raise TypeError("Missing argument: '{0}'".format(field.name))
+                raise _missing_argument_error(field.name)
                 
-        for field_name in kwargs:
-            raise TypeError("{0}.__init__ does not take keyword argument '{1}'".format(name, field_name))
+        if kwargs:
+            raise _keyword_argument_error(name, kwargs)
     
+    return __init__
+
+
+def _generic_eq(fields, namespace, frozen):
     def __eq__(self, other):
-        if isinstance(other, new_type):
+        if isinstance(other, namespace["_type"]):
+            if frozen and _hashes_differ(self, other):
+                return False
             return all(
                 getattr(self, field.name) == getattr(other, field.name)
                 for field in fields
             )
         else:
             return NotImplemented
-        
+    
+    return __eq__
+
+
+def _generic_ne():
     def __ne__(self, other):
         return not (self == other)
-        
+    
+    return __ne__
+
+
+def _generic_repr(name, fields):
     def __repr__(self):
         values = (
             _repr_value(field, getattr(self, field.name))
             for field in fields
         )
         return "{0}({1})".format(name, ", ".join(filter(None, values)))
-        
-    def __str__(self):
-        return repr(self)
     
-    properties = {
+    return __repr__
+
+
+def _generic_reduce(fields):
+    field_names = frozenset(field.name for field in fields)
+    
+    def __reduce__(self):
+        values = tuple(getattr(self, field.name) for field in fields)
+        state = _extra_state(self, field_names)
+        if state is not None:
+            values += (state, )
+        return (copyreg.__newobj__, (type(self), ), values)
+    
+    return __reduce__
+
+
+def _generic_setstate(fields):
+    def __setstate__(self, values):
+        for field, value in zip(fields, values):
+            object.__setattr__(self, field.name, value)
+        if len(values) > len(fields):
+            _set_extra_state(self, values[-1])
+    
+    return __setstate__
+
+
+def _generic_hash(fields):
+    def __hash__(self):
+        hash_value = getattr(self, _hash_attr, None)
+        if hash_value is None:
+            hash_value = hash(tuple(getattr(self, field.name) for field in fields))
+            object.__setattr__(self, _hash_attr, hash_value)
+        return hash_value
+    
+    return __hash__
+
+
+def _deferred_methods(name, fields, positional_argument_length, namespace, frozen):
+    # Compiling a method takes much longer than creating the class, and
+    # most classes in a large schema are only used a few times, so each
+    # method starts as a stub that calls the generic method. Once a stub
+    # has been called enough times, that method alone is compiled and
+    # replaces the stub on the class, unless the method has since been
+    # replaced by something else. Both use the fields as they were when the
+    # class was defined. Methods can't be compiled for fields whose names
+    # aren't identifiers, so those stubs are replaced by the generic method.
+    # The stubs for a class are all created by one call so that they share
+    # a single closure cell, since definition time is dominated by
+    # allocating objects for each class.
+    deferred = _DeferredMethods(name, fields, positional_argument_length, namespace, frozen)
+    deferred.stubs = _stubs(deferred, frozen)
+    return dict(deferred.stubs)
+
+
+class _DeferredMethods(object):
+    def __init__(self, name, fields, positional_argument_length, namespace, frozen):
+        self._name = name
+        self._fields = list(fields)
+        self._positional_argument_length = positional_argument_length
+        self._namespace = namespace
+        self._frozen = frozen
+        self._calls = {}
+        self._generic_methods = {}
+        self.stubs = None
+    
+    def method(self, method_name):
+        calls = self._calls.get(method_name, 0)
+        if calls < _calls_before_compiling:
+            self._calls[method_name] = calls + 1
+            return self._generic_method(method_name)
+        else:
+            return self._compiled_method(method_name)
+    
+    def _generic_method(self, method_name):
+        method = self._generic_methods.get(method_name)
+        if method is None:
+            method = self._generic_methods[method_name] = _generic_method(
+                method_name, self._name, self._fields, self._positional_argument_length,
+                self._namespace, self._frozen)
+        return method
+    
+    def _compiled_method(self, method_name):
+        namespace = self._namespace
+        if method_name not in namespace:
+            if all(_is_identifier(field.name) for field in self._fields):
+                _compile_method(
+                    method_name, self._name, self._fields, self._positional_argument_length,
+                    namespace, self._frozen)
+            else:
+                namespace[method_name] = self._generic_method(method_name)
+            cls = namespace["_type"]
+            if cls.__dict__.get(method_name) is self.stubs[method_name]:
+                setattr(cls, method_name, namespace[method_name])
+        return namespace[method_name]
+
+
+def _stubs(deferred, frozen):
+    def __init__(self, *args, **kwargs):
+        return deferred.method("__init__")(self, *args, **kwargs)
+    
+    def __eq__(self, other):
+        return deferred.method("__eq__")(self, other)
+    
+    def __ne__(self, other):
+        return deferred.method("__ne__")(self, other)
+    
+    def __repr__(self):
+        return deferred.method("__repr__")(self)
+    
+    def __reduce__(self):
+        return deferred.method("__reduce__")(self)
+    
+    def __setstate__(self, values):
+        return deferred.method("__setstate__")(self, values)
+    
+    stubs = {
         "__init__": __init__,
         "__eq__": __eq__,
         "__ne__": __ne__,
         "__repr__": __repr__,
-        "__str__": __str__,
-        _fields_attr: fields,
+        "__reduce__": __reduce__,
+        "__setstate__": __setstate__,
     }
     
-    new_type = type(name, bases, properties)
-    try:
-        new_type.__module__ = sys._getframe(1).f_globals.get('__name__', '__main__')
-    except (AttributeError, ValueError):
-        pass
+    if frozen:
+        def __hash__(self):
+            return deferred.method("__hash__")(self)
+        
+        stubs["__hash__"] = __hash__
     
-    return new_type
+    return stubs
+
+
+def _method_names(frozen):
+    method_names = ["__init__", "__eq__", "__ne__", "__repr__", "__reduce__", "__setstate__"]
+    if frozen:
+        method_names.append("__hash__")
+    return method_names
+
+
+_calls_before_compiling = 100
+
+
+def _compile_method(method_name, name, fields, positional_argument_length, namespace, frozen):
+    # Generates source for the method with each field written out, so that
+    # instances don't pay for a generic loop over the fields on every call.
+    namespace.update({
+        "_newobj": copyreg.__newobj__,
+        "_positional_argument_error": _positional_argument_error,
+        "_keyword_argument_error": _keyword_argument_error,
+        "_setattr": object.__setattr__,
+        "_extra_state": _extra_state,
+        "_set_extra_state": _set_extra_state,
+        "_field_names": frozenset(field.name for field in fields),
+    })
+    for index, field in enumerate(fields):
+        if field.has_default:
+            namespace[_default_name(index)] = field.default
+    
+    if method_name == "__init__":
+        lines = _init_source(name, fields, positional_argument_length, frozen)
+    elif method_name == "__eq__":
+        lines = _eq_source(fields, frozen)
+    elif method_name == "__ne__":
+        lines = _ne_source(fields, frozen)
+    elif method_name == "__repr__":
+        lines = _repr_source(name, fields)
+    elif method_name == "__reduce__":
+        lines = _reduce_source(namespace["_type"], fields)
+    elif method_name == "__setstate__":
+        lines = _setstate_source(fields, frozen)
+    else:
+        lines = _hash_source(fields)
+    
+    _exec_source(name, lines, namespace)
+
+
+def _exec_source(name, lines, namespace):
+    code = compile("\n".join(lines), "<dodge.data_class {0}>".format(name), "exec")
+    exec(code, namespace)
+
+
+def _init_source(name, fields, positional_argument_length, frozen):
+    positional_fields = fields[:positional_argument_length]
+    keyword_only_fields = fields[positional_argument_length:]
+    
+    lines = [
+        "def __init__(self, *args, **kwargs):",
+        "    super(_type, self).__init__()",
+        "    _args_length = len(args)",
+    ]
+    
+    # Fast path for the common case of all required values being passed by position
+    if positional_fields and all(field.has_default for field in keyword_only_fields):
+        lines.append("    if not kwargs and _args_length == {0}:".format(positional_argument_length))
+        lines += ["        " + line for line in _unpack_source(positional_fields, "args", frozen)]
+        for index, field in enumerate(keyword_only_fields, positional_argument_length):
+            lines += ["        " + line for line in _default_source(index, field, frozen)]
+        lines.append("        return")
+    
+    lines += [
+        "    if _args_length > {0}:".format(positional_argument_length),
+        "        raise _positional_argument_error({0!r}, {1}, _args_length)".format(
+            name, positional_argument_length),
+    ]
+    
+    for index, field in enumerate(fields):
+        if index < positional_argument_length:
+            lines += [
+                "    if _args_length > {0}:".format(index),
+                "        " + _set_source(field, "args[{0}]".format(index), frozen),
+                "    elif {0!r} in kwargs:".format(field.name),
+            ]
+        else:
+            lines.append("    if {0!r} in kwargs:".format(field.name))
+        lines.append("        " + _set_source(field, "kwargs.pop({0!r})".format(field.name), frozen))
+        lines.append("    else:")
+        lines += ["        " + line for line in _default_source(index, field, frozen)]
+    
+    lines += [
+        "    if kwargs:",
+        "        raise _keyword_argument_error({0!r}, kwargs)".format(name),
+    ]
+    return lines
+
+
+def _set_source(field, value_source, frozen):
+    if frozen:
+        return "_setattr(self, {0!r}, {1})".format(field.name, value_source)
+    else:
+        return "self.{0} = {1}".format(field.name, value_source)
+
+
+def _unpack_source(fields, values_source, frozen):
+    if frozen:
+        return [
+            _set_source(field, "{0}[{1}]".format(values_source, index), frozen)
+            for index, field in enumerate(fields)
+        ]
+    else:
+        return ["{0}{1} = {2}".format(
+            ", ".join("self." + field.name for field in fields),
+            "," if len(fields) == 1 else "",
+            values_source,
+        )]
+
+
+def _default_source(index, field, frozen):
+    if field.has_default:
+        return [_set_source(field, _default_name(index), frozen)]
+    else:
+        return ["raise TypeError({0!r})".format(str(_missing_argument_error(field.name)))]
+
+
+def _eq_source(fields, frozen):
+    return _comparison_source("__eq__", fields, frozen, "False", "True", "NotImplemented")
+
+
+def _ne_source(fields, frozen):
+    return _comparison_source("__ne__", fields, frozen, "True", "False", "not (self == other)")
+
+
+def _comparison_source(method_name, fields, frozen, differ_source, same_source, other_type_source):
+    lines = [
+        "def {0}(self, other):".format(method_name),
+        "    if isinstance(other, _type):",
+    ]
+    if frozen:
+        # Unequal hashes mean unequal values, but there's no point
+        # calculating hashes just to compare them
+        lines += [
+            "        self_hash = getattr(self, {0!r}, None)".format(_hash_attr),
+            "        if self_hash is not None:",
+            "            other_hash = getattr(other, {0!r}, None)".format(_hash_attr),
+            "            if other_hash is not None and self_hash != other_hash:",
+            "                return {0}".format(differ_source),
+        ]
+    for field in fields:
+        lines += [
+            "        if not (self.{0} == other.{0}):".format(field.name),
+            "            return {0}".format(differ_source),
+        ]
+    lines += [
+        "        return {0}".format(same_source),
+        "    else:",
+        "        return {0}".format(other_type_source),
+    ]
+    return lines
+
+
+def _hash_source(fields):
+    return [
+        "def __hash__(self):",
+        "    hash_value = getattr(self, {0!r}, None)".format(_hash_attr),
+        "    if hash_value is None:",
+        "        hash_value = hash(({0}))".format("".join(
+            "self.{0}, ".format(field.name) for field in fields
+        )),
+        "        _setattr(self, {0!r}, hash_value)".format(_hash_attr),
+        "    return hash_value",
+    ]
+
+
+def _reduce_source(cls, fields):
+    values_source = "".join("self.{0}, ".format(field.name) for field in fields)
+    lines = ["def __reduce__(self):"]
+    
+    # Instances of the class itself can only have extra state in their
+    # __dict__, if they have one, unless a base class has other slots
+    field_names = frozenset(field.name for field in fields)
+    if not _extra_slots(cls, field_names):
+        condition = "self.__class__ is _type"
+        if _has_instance_dict(cls):
+            condition += " and len(self.__dict__) == {0}".format(len(fields))
+        lines += [
+            "    if {0}:".format(condition),
+            "        return (_newobj, (_type, ), ({0}))".format(values_source),
+        ]
+    
+    return lines + [
+        "    state = _extra_state(self, _field_names)",
+        "    if state is None:",
+        "        return (_newobj, (self.__class__, ), ({0}))".format(values_source),
+        "    else:",
+        "        return (_newobj, (self.__class__, ), ({0}state, ))".format(values_source),
+    ]
+
+
+def _setstate_source(fields, frozen):
+    lines = [
+        "def __setstate__(self, values):",
+        "    if len(values) > {0}:".format(len(fields)),
+        "        _set_extra_state(self, values[-1])",
+        "        values = values[:-1]",
+    ]
+    if fields:
+        lines += ["    " + line for line in _unpack_source(fields, "values", frozen)]
+    return lines
+
+
+def _repr_source(name, fields):
+    lines = [
+        "def __repr__(self):",
+        "    values = []",
+    ]
+    for index, field in enumerate(fields):
+        if field.is_kwarg:
+            value_source = "{0!r} + repr(self.{1})".format(field.name + "=", field.name)
+        else:
+            value_source = "repr(self.{0})".format(field.name)
+        
+        if not field.show_default and field.has_default:
+            lines += [
+                "    if not ({0} == self.{1}):".format(_default_name(index), field.name),
+                "        values.append({0})".format(value_source),
+            ]
+        else:
+            lines.append("    values.append({0})".format(value_source))
+    lines.append("    return {0!r} + \", \".join(values) + \")\"".format(name + "("))
+    return lines
+
+
+def _default_name(index):
+    return "_default_{0}".format(index)
+
+
+if hasattr(str, "isascii"):
+    def _is_identifier(name):
+        return (
+            isinstance(name, str) and
+            name.isascii() and
+            name.isidentifier() and
+            not keyword.iskeyword(name)
+        )
+else:
+    import re
+
+    def _is_identifier(name):
+        return (
+            isinstance(name, str) and
+            _identifier_pattern.match(name) is not None and
+            not keyword.iskeyword(name)
+        )
+
+    _identifier_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+_hash_attr = "_dodge_hash"
+
+
+def _hashes_differ(first, second):
+    first_hash = getattr(first, _hash_attr, None)
+    second_hash = getattr(second, _hash_attr, None)
+    return first_hash is not None and second_hash is not None and first_hash != second_hash
+
+
+def _frozen_setattr(self, name, value):
+    raise AttributeError("cannot assign to attribute '{0}' of frozen {1}".format(name, type(self).__name__))
+
+
+def _frozen_delattr(self, name):
+    raise AttributeError("cannot delete attribute '{0}' of frozen {1}".format(name, type(self).__name__))
+
+
+def _is_frozen(cls):
+    setattr_method = cls.__setattr__
+    return getattr(setattr_method, "__func__", setattr_method) is _frozen_setattr
+
+
+def _positional_argument_error(name, positional_argument_length, args_length):
+    return TypeError(
+        "{0}.__init__ takes {1} positional argument{2} but {3} {4} given".format(
+            name,
+            positional_argument_length,
+            "" if positional_argument_length == 1 else "s",
+            args_length,
+            "was" if args_length == 1 else "were"))
+
+
+def _missing_argument_error(field_name):
+    return TypeError("Missing argument: '{0}'".format(field_name))
+
+
+def _keyword_argument_error(name, kwargs):
+    for field_name in kwargs:
+        return TypeError("{0}.__init__ does not take keyword argument '{1}'".format(name, field_name))
     
 
 def _to_field(field):
@@ -130,19 +880,28 @@ def _repr_value(field, value):
 
 
 class _Field(object):
-    def __init__(self, name, type, default, has_default, show_default, keyword_only):
+    def __init__(self, name, type, default, has_default, show_default, keyword_only, codec):
         self.name = name
         self.type = type
+        self.codec = codec
         self.default = default
         self.has_default = has_default
         self.show_default = show_default
         self.is_kwarg = has_default or keyword_only
         self.keyword_only = keyword_only
+    
+    def __reduce__(self):
+        return (field, (self.name, self.type, self.default, self.show_default, self.keyword_only, self.codec))
+
+
+class _Undefined(object):
+    def __reduce__(self):
+        return "_undefined"
 
 
-_undefined = object()
+_undefined = _Undefined()
 
-def field(name, type=None, default=_undefined, show_default=True, keyword_only=False):
+def field(name, type=None, default=_undefined, show_default=True, keyword_only=False, codec=None):
     return _Field(
         name=name,
         type=type,
@@ -150,17 +909,263 @@ def field(name, type=None, default=_undefined, show_default=True, keyword_only=F
         has_default=default is not _undefined,
         show_default=show_default,
         keyword_only=keyword_only,
+        codec=codec,
     )
 
 
+class _ListOf(object):
+    def __init__(self, element_type):
+        self.element_type = element_type
+
+
+class _DictOf(object):
+    def __init__(self, value_type):
+        self.value_type = value_type
+
+
+class _Optional(object):
+    def __init__(self, value_type):
+        self.value_type = value_type
+
+
+def list_of(element_type):
+    return _ListOf(element_type)
+
+
+def dict_of(value_type):
+    return _DictOf(value_type)
+
+
+def optional(value_type):
+    return _Optional(value_type)
+
+
 def copy(obj, **kwargs):
-    field_values = dict(
-        (field.name, getattr(obj, field.name))
-        for field in fields(obj)
-    )
-    field_values.update(kwargs)
-    return type(obj)(**field_values)
+    return _builder(type(obj), ("copy", ))(obj, kwargs)
+
+
+def copy_many(objs, **kwargs):
+    copiers = {}
+    result = []
+    for obj in objs:
+        obj_type = type(obj)
+        copier = copiers.get(obj_type)
+        if copier is None:
+            copier = copiers[obj_type] = _builder(obj_type, ("copy", ))
+        result.append(copier(obj, kwargs))
+    return result
+
+
+def from_rows(cls, rows, stream=False):
+    # Each row holds the positional arguments for one instance. The length
+    # of the first row is checked against the fields of cls once, and any
+    # row with a different length is passed to cls itself.
+    rows = iter(rows)
+    for first_row in rows:
+        build = _builder(cls, ("rows", len(first_row), stream))
+        return build(itertools.chain([first_row], rows))
+    
+    return iter([]) if stream else []
+
+
+def from_dicts(cls, dicts, stream=False):
+    # Each dict holds the keyword arguments for one instance. Any dict that
+    # doesn't match the fields of cls is passed to cls itself, so that the
+    # usual error is raised.
+    return _builder(cls, ("dicts", stream))(dicts)
+
+
+def _builder(cls, key):
+    builders = cls.__dict__.get(_builders_attr)
+    if builders is None:
+        builders = {}
+        setattr(cls, _builders_attr, builders)
+    
+    builder = builders.get(key)
+    if builder is None:
+        builder = builders[key] = _compile_builder(cls, key)
+    return builder
+
+
+_builders_attr = _unique_name()
+
+
+def _compile_builder(cls, key):
+    if key[0] == "copy":
+        return _compile_copier(_data_class(cls))
+    
+    cls_fields = fields(cls)
+    stream = key[-1]
+    
+    if not all(_is_identifier(field.name) for field in cls_fields):
+        if key[0] == "rows":
+            objs = lambda rows: (cls(*row) for row in rows)
+        else:
+            objs = lambda dicts: (cls(**kwargs) for kwargs in dicts)
+        return objs if stream else lambda values: list(objs(values))
+    
+    namespace = {"_type": cls, "_new": cls.__new__, "_setattr": object.__setattr__}
+    for index, field in enumerate(cls_fields):
+        if field.has_default:
+            namespace[_default_name(index)] = field.default
+    
+    if stream:
+        emit = "yield {0}".format
+        lines = ["def build(values):"]
+    else:
+        emit = "append({0})".format
+        lines = [
+            "def build(values):",
+            "    result = []",
+            "    append = result.append",
+        ]
+    
+    frozen = _is_frozen(cls)
+    if key[0] == "rows":
+        body = _rows_builder_source(cls, cls_fields, key[1], emit, frozen)
+    else:
+        body = _dicts_builder_source(cls, cls_fields, emit, frozen)
+    lines += ["    " + line for line in body]
+    
+    if not stream:
+        lines.append("    return result")
+    
+    _exec_source(cls.__name__, lines, namespace)
+    return namespace["build"]
+
+
+def _compile_copier(cls):
+    # Copies are built directly from the values of the original's fields,
+    # so only the names of changed fields need checking
+    cls_fields = fields(cls)
+    field_names = frozenset(field.name for field in cls_fields)
+    
+    # Subclasses of data classes may define their own __init__, so their
+    # copies are built by calling the class
+    if _definition_attr not in cls.__dict__ or not all(_is_identifier(field.name) for field in cls_fields):
+        def copy_fields(obj, changes):
+            field_values = dict(
+                (field.name, getattr(obj, field.name))
+                for field in cls_fields
+            )
+            field_values.update(changes)
+            return cls(**field_values)
+        
+        return copy_fields
+    
+    namespace = {
+        "_type": cls,
+        "_new": cls.__new__,
+        "_setattr": object.__setattr__,
+        "_field_names": field_names,
+        "_keyword_argument_error": _keyword_argument_error,
+    }
+    frozen = _is_frozen(cls)
+    
+    lines = [
+        "def copy_fields(obj, changes):",
+        "    self = _new(_type)",
+    ] + _super_init_source(cls) + [
+        "    if changes:",
+        "        for name in changes:",
+        "            if name not in _field_names:",
+        "                raise _keyword_argument_error({0!r}, [name])".format(cls.__name__),
+    ]
+    for field in cls_fields:
+        lines.append("        " + _set_source(
+            field,
+            "changes[{0!r}] if {0!r} in changes else obj.{0}".format(field.name),
+            frozen,
+        ))
+    lines.append("    else:")
+    for field in cls_fields:
+        lines.append("        " + _set_source(field, "obj." + field.name, frozen))
+    lines.append("    return self")
+    
+    _exec_source(cls.__name__, lines, namespace)
+    return namespace["copy_fields"]
+
+
+def _data_class(cls):
+    # Lazily converted objects are instances of a subclass of their data
+    # class, which is marked with the data class that it stands in for
+    return cls.__dict__.get(_stands_in_for_attr, cls)
+
+
+_stands_in_for_attr = _unique_name()
+
+
+def _rows_builder_source(cls, cls_fields, row_length, emit, frozen):
+    positional_argument_length = _find_first_keyword_argument_index(cls_fields)
+    if row_length > positional_argument_length:
+        raise _positional_argument_error(cls.__name__, positional_argument_length, row_length)
+    
+    lines = [
+        "for row in values:",
+        "    if len(row) != {0}:".format(row_length),
+        "        " + emit("_type(*row)"),
+        "        continue",
+        "    self = _new(_type)",
+    ] + _super_init_source(cls)
+    
+    if row_length:
+        lines += ["    " + line for line in _unpack_source(cls_fields[:row_length], "row", frozen)]
+    
+    for index, field in enumerate(cls_fields[row_length:], row_length):
+        if not field.has_default:
+            raise _missing_argument_error(field.name)
+        lines += ["    " + line for line in _default_source(index, field, frozen)]
+    
+    lines.append("    " + emit("self"))
+    return lines
+
+
+def _dicts_builder_source(cls, cls_fields, emit, frozen):
+    lines = [
+        "for kwargs in values:",
+        "    try:",
+        "        self = _new(_type)",
+    ] + ["    " + line for line in _super_init_source(cls)] + [
+        "        arguments_length = {0}".format(
+            len([field for field in cls_fields if not field.has_default])),
+    ]
+    
+    for index, field in enumerate(cls_fields):
+        value_source = "kwargs[{0!r}]".format(field.name)
+        if field.has_default:
+            lines += [
+                "        if {0!r} in kwargs:".format(field.name),
+                "            " + _set_source(field, value_source, frozen),
+                "            arguments_length += 1",
+                "        else:",
+                "            " + _set_source(field, _default_name(index), frozen),
+            ]
+        else:
+            lines.append("        " + _set_source(field, value_source, frozen))
+    
+    lines += [
+        "        if arguments_length != len(kwargs):",
+        "            raise KeyError()",
+        "    except KeyError:",
+        "        self = _type(**kwargs)",
+        "    " + emit("self"),
+    ]
+    return lines
+
+
+def _super_init_source(cls):
+    # object.__init__ does nothing, so there's no need to call it
+    if cls.__mro__[1:] == (object, ):
+        return []
+    else:
+        return ["    super(_type, self).__init__()"]
 
 
 if sys.version_info[0] >= 3:
     basestring = str
+    
+    def _iteritems(x):
+        return x.items()
+else:
+    def _iteritems(x):
+        return x.iteritems()
@@ -0,0 +1,170 @@
+import sys
+import time
+try:
+    from _thread import RLock
+except ImportError:
+    from threading import RLock
+
+from . import binary, conversion
+from .data import data_class, _DataClassType
+
+
+# Collecting stats replaces the conversion functions with timed wrappers,
+# both in the modules that define them and in the dodge package, and adds
+# __call__ to the metaclass of data classes to time construction. Turning
+# stats off puts the original functions back, so nothing is in the call path
+# unless stats are being collected. Times include any conversions made by
+# the call, such as obj_to_dict in dumps.
+
+OperationStats = data_class("OperationStats", ["calls", "seconds", "bytes"])
+
+
+def stats():
+    # Maps (operation, cls) to the stats for that operation on that class
+    with _lock:
+        totals = [(key, tuple(values)) for key, values in _totals.items()]
+    return dict(
+        (key, OperationStats(*values))
+        for key, values in totals
+    )
+
+
+def reset_stats():
+    with _lock:
+        _totals.clear()
+
+
+def enable_stats():
+    global _enabled_count
+    with _lock:
+        _enabled_count += 1
+        if _enabled_count == 1:
+            _install()
+
+
+def disable_stats():
+    global _enabled_count
+    with _lock:
+        if _enabled_count == 0:
+            return
+        _enabled_count -= 1
+        if _enabled_count == 0:
+            _uninstall()
+
+
+def collect_stats():
+    # Returns a context manager that gives a dict that's filled in with the
+    # stats for calls made inside the block once it exits. It's a class
+    # rather than using contextlib, which is slow to import.
+    return _StatsCollector()
+
+
+class _StatsCollector(object):
+    def __enter__(self):
+        self._collected = {}
+        self._before = stats()
+        enable_stats()
+        return self._collected
+    
+    def __exit__(self, *exc_info):
+        disable_stats()
+        for key, after in stats().items():
+            previous = self._before.get(key, OperationStats(0, 0, 0))
+            if after.calls != previous.calls:
+                self._collected[key] = OperationStats(
+                    after.calls - previous.calls,
+                    after.seconds - previous.seconds,
+                    after.bytes - previous.bytes,
+                )
+
+
+def _record(operation, cls, start, size):
+    elapsed = _clock() - start
+    key = (operation, cls)
+    with _lock:
+        totals = _totals.get(key)
+        if totals is None:
+            totals = _totals[key] = [0, 0, 0]
+        totals[0] += 1
+        totals[1] += elapsed
+        totals[2] += size
+
+
+def _timed(operation, func, cls_for_call, size_of_result):
+    def timed(*args, **kwargs):
+        start = _clock()
+        result = func(*args, **kwargs)
+        _record(operation, cls_for_call(args, kwargs), start, size_of_result(result))
+        return result
+    timed.__name__ = func.__name__
+    timed.__doc__ = func.__doc__
+    return timed
+
+
+def _type_of_obj(args, kwargs):
+    return type(args[0] if args else kwargs["obj"])
+
+
+def _cls_argument(args, kwargs):
+    return args[1] if len(args) > 1 else kwargs["cls"]
+
+
+def _no_size(result):
+    return 0
+
+
+def _text_size(result):
+    return len(result.encode("utf-8"))
+
+
+def _bytes_size(result):
+    return len(result)
+
+
+_instrumented_functions = [
+    (conversion, "obj_to_dict", _type_of_obj, _no_size),
+    (conversion, "dict_to_obj", _cls_argument, _no_size),
+    (conversion, "dumps", _type_of_obj, _text_size),
+    (conversion, "loads", _cls_argument, _no_size),
+    (conversion, "obj_to_flat_list", _type_of_obj, _no_size),
+    (conversion, "flat_list_to_obj", _cls_argument, _no_size),
+    (conversion, "flat_list_to_objs", _cls_argument, _no_size),
+    (binary, "pack", _type_of_obj, _bytes_size),
+    (binary, "unpack", _cls_argument, _no_size),
+]
+
+
+def _construct(cls, *args, **kwargs):
+    start = _clock()
+    obj = super(_DataClassType, cls).__call__(*args, **kwargs)
+    _record("construct", cls, start, 0)
+    return obj
+
+
+def _install():
+    package = sys.modules[__name__.rpartition(".")[0]]
+    for module, name, cls_for_call, size_of_result in _instrumented_functions:
+        func = getattr(module, name)
+        _originals.append((module, name, func))
+        timed = _timed(name, func, cls_for_call, size_of_result)
+        setattr(module, name, timed)
+        if getattr(package, name, None) is func:
+            _originals.append((package, name, func))
+            setattr(package, name, timed)
+
+    _DataClassType.__call__ = _construct
+
+
+def _uninstall():
+    del _DataClassType.__call__
+    while _originals:
+        module, name, func = _originals.pop()
+        setattr(module, name, func)
+
+
+_totals = {}
+_originals = []
+_enabled_count = 0
+_lock = RLock()
+
+_clock = getattr(time, "perf_counter", time.time)
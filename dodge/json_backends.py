@@ -0,0 +1,101 @@
+class _JsonBackend(object):
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+
+def json_backends():
+    return [backend.name for backend in _backends()]
+
+
+def set_json_backend(name):
+    global _default_backend
+    _default_backend = _find_backend(name)
+
+
+def _json_backend(name=None):
+    if name is None:
+        return _default_backend
+    else:
+        return _find_backend(name)
+
+
+def _find_backend(name):
+    if name == "json":
+        return _stdlib_backend
+    if name == "auto":
+        return _backends()[0]
+
+    for backend in _backends():
+        if backend.name == name:
+            return backend
+
+    raise ValueError("unknown JSON backend: '{0}'".format(name))
+
+
+class _StdlibJsonBackend(object):
+    name = "json"
+
+    def __getattr__(self, name):
+        # json imports re, which is slow to import, so json is imported when
+        # the backend is first used, which then sets dumps and loads on the
+        # backend itself
+        if name not in ("dumps", "loads"):
+            raise AttributeError(name)
+        import json
+        self.dumps = json.dumps
+        self.loads = json.loads
+        return getattr(self, name)
+
+
+_stdlib_backend = _StdlibJsonBackend()
+
+
+# Backends in order of preference when choosing one automatically, with the
+# stdlib json module last since it's always available. The other backends
+# are only imported when first asked for, so that importing dodge doesn't
+# pay for them.
+_found_backends = None
+
+
+def _backends():
+    global _found_backends
+    if _found_backends is None:
+        _found_backends = _import_backends()
+    return _found_backends
+
+
+def _import_backends():
+    backends = []
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        backends.append(_JsonBackend(
+            "orjson",
+            lambda value: orjson.dumps(value).decode("utf-8"),
+            orjson.loads,
+        ))
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+        backends.append(_JsonBackend(
+            "ujson",
+            lambda value: ujson.dumps(value, escape_forward_slashes=False),
+            ujson.loads,
+        ))
+
+    backends.append(_stdlib_backend)
+    return backends
+
+
+# The fast backends don't accept everything that the json module does, such
+# as integers larger than 64 bits, and may handle some values, such as NaN,
+# differently, so they're only used when asked for
+_default_backend = _stdlib_backend
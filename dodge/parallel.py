@@ -0,0 +1,42 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from . import conversion
+
+
+# Each chunk is converted in a worker process. Data classes that can't be
+# imported by name are pickled as their definitions, so classes created
+# dynamically with data_class can be used.
+
+def loads_many(strings, cls, workers=None, chunksize=1000, backend=None):
+    return _map_chunks(_loads_chunk, strings, (cls, backend), workers, chunksize)
+
+
+def dumps_many(objs, workers=None, chunksize=1000, backend=None):
+    return _map_chunks(_dumps_chunk, objs, (backend, ), workers, chunksize)
+
+
+def _map_chunks(func, values, args, workers, chunksize):
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(func, _chunks(values, chunksize), *[itertools.repeat(arg) for arg in args])
+        return list(itertools.chain.from_iterable(chunks))
+
+
+def _chunks(values, chunksize):
+    values = iter(values)
+    while True:
+        chunk = list(itertools.islice(values, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _loads_chunk(strings, cls, backend):
+    return [conversion.loads(string, cls, backend=backend) for string in strings]
+
+
+def _dumps_chunk(objs, backend):
+    return [conversion.dumps(obj, backend=backend) for obj in objs]
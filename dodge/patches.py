@@ -0,0 +1,182 @@
+from .data import data_class, copy, _fields_attr, _data_class
+from .conversion import _plan
+from .json_backends import _json_backend
+from . import binary, conversion
+
+
+# A patch holds the fields of an object that have changed, by name. The
+# value of each field is either its new value, or a patch to apply to the
+# current value of the field, for nested objects that have changed in
+# place. Like conversions, patches are made and applied using an explicit
+# stack rather than recursion. Lazily loaded objects are treated as
+# instances of their data class.
+
+Patch = data_class("Patch", ["cls", "changes"])
+
+
+def diff(old, new):
+    cls = _data_class(type(new))
+    if _data_class(type(old)) is not cls:
+        raise ValueError("cannot diff objects of different types: {0} and {1}".format(
+            type(old).__name__, type(new).__name__))
+
+    root = Patch(cls, {})
+    stack = [(old, new, root)]
+    nested_patches = []
+
+    while stack:
+        old, new, patch = stack.pop()
+        changes = patch.changes
+        plan = _plan(patch.cls)
+        for name, field_type in zip(plan.names, plan.types):
+            old_value = getattr(old, name)
+            new_value = getattr(new, name)
+            if old_value is new_value:
+                continue
+            elif (
+                field_type is not None and
+                _data_class(type(old_value)) is field_type and
+                _data_class(type(new_value)) is field_type
+            ):
+                nested_patch = changes[name] = Patch(field_type, {})
+                nested_patches.append((changes, name, nested_patch))
+                stack.append((old_value, new_value, nested_patch))
+            elif old_value != new_value:
+                changes[name] = new_value
+
+    # Nested patches are found after the patches that contain them, so
+    # removing empty patches in reverse removes empty patches that only
+    # contained empty patches
+    for changes, name, nested_patch in reversed(nested_patches):
+        if not nested_patch.changes:
+            del changes[name]
+
+    return root
+
+
+def apply_patch(obj, patch):
+    result = {}
+    stack = [(obj, patch, result, None)]
+    pending = []
+
+    while stack:
+        obj, patch, parent_changes, parent_name = stack.pop()
+        if _data_class(type(obj)) is not patch.cls:
+            raise ValueError("patch for {0} cannot be applied to {1}".format(
+                patch.cls.__name__, type(obj).__name__))
+        changes = dict(patch.changes)
+        for name, value in changes.items():
+            if isinstance(value, Patch):
+                stack.append((getattr(obj, name), value, changes, name))
+        pending.append((obj, changes, parent_changes, parent_name))
+
+    for obj, changes, parent_changes, parent_name in reversed(pending):
+        parent_changes[parent_name] = copy(obj, **changes)
+
+    return result[None]
+
+
+def dumps_patch(patch, backend=None):
+    return _json_backend(backend).dumps(_patch_to_dict(patch))
+
+
+def loads_patch(string, cls, backend=None):
+    return _dict_to_patch(_json_backend(backend).loads(string), cls)
+
+
+def pack_patch(patch):
+    parts = []
+    binary._pack_value(_patch_to_dict(patch), parts)
+    return b"".join(parts)
+
+
+def unpack_patch(data, cls):
+    return _dict_to_patch(binary._unpack_value(bytes(data), 0)[0], cls)
+
+
+# Patches are converted to dicts with the new values of fields under "set",
+# converted in the same way as obj_to_dict, and nested patches under "patch".
+# Empty sections are left out.
+
+def _patch_to_dict(patch):
+    result = {}
+    stack = [(patch, result)]
+
+    while stack:
+        patch, patch_dict = stack.pop()
+        plan = _plan(patch.cls)
+        values = {}
+        nested_patches = {}
+        for name, value in patch.changes.items():
+            index = _field_index(plan, name)
+            key = plan.dict_keys[index][1]
+            if isinstance(value, Patch):
+                nested_patches[key] = {}
+                stack.append((value, nested_patches[key]))
+            else:
+                values[key] = _encode_field(plan, index, value)
+        if values:
+            patch_dict["set"] = values
+        if nested_patches:
+            patch_dict["patch"] = nested_patches
+
+    return result
+
+
+def _dict_to_patch(patch_dict, cls):
+    result = Patch(cls, {})
+    stack = [(patch_dict, result)]
+
+    while stack:
+        patch_dict, patch = stack.pop()
+        plan = _plan(patch.cls)
+        for key, value in patch_dict.get("set", {}).items():
+            index = _field_index_for_key(plan, key)
+            patch.changes[plan.names[index]] = _decode_field(plan, index, value)
+        for key, nested_patch_dict in patch_dict.get("patch", {}).items():
+            index = _field_index_for_key(plan, key)
+            if plan.types[index] is None:
+                raise ValueError("field is not a nested object: '{0}'".format(key))
+            nested_patch = patch.changes[plan.names[index]] = Patch(plan.types[index], {})
+            stack.append((nested_patch_dict, nested_patch))
+
+    return result
+
+
+def _field_index(plan, name):
+    try:
+        return plan.names.index(name)
+    except ValueError:
+        raise ValueError("unknown field: '{0}'".format(name))
+
+
+def _field_index_for_key(plan, key):
+    field = plan.field_for_key(key)
+    if field is None:
+        raise ValueError("unknown field: '{0}'".format(key))
+    return plan.names.index(field.name)
+
+
+def _encode_field(plan, index, value):
+    codec = plan.dict_codecs[index]
+    if value is None:
+        return None
+    elif codec is not None:
+        return codec.encode(value)
+    elif hasattr(value, _fields_attr):
+        return conversion.obj_to_dict(value)
+    else:
+        return value
+
+
+def _decode_field(plan, index, value):
+    field_type = plan.types[index]
+    codec = plan.dict_codecs[index]
+    if value is None:
+        return None
+    elif field_type is not None:
+        return conversion.dict_to_obj(value, field_type)
+    elif codec is not None:
+        return codec.decode(value)
+    else:
+        return value
@@ -0,0 +1,138 @@
+from . import conversion
+from .conversion import _plan, _decode_flat_value
+from .json_backends import _json_backend
+
+
+# A projection reads the values of a few fields, given as paths of field
+# names separated by dots, without building any objects other than the
+# values of the fields themselves. The keys of each field in a dict and the
+# position of each field in a flat list are found once, when the projection
+# is created.
+
+def project(cls, paths):
+    return Projection(cls, paths)
+
+
+class Projection(object):
+    def __init__(self, cls, paths):
+        self.cls = cls
+        self.paths = list(paths)
+        steps = [_path_steps(cls, path) for path in self.paths]
+        self._dict_readers = [_dict_reader(path, path_steps) for path, path_steps in zip(self.paths, steps)]
+        self._flat_readers = [_flat_reader(path_steps) for path_steps in steps]
+
+    def from_dict(self, obj_dict):
+        return tuple([read(obj_dict) for read in self._dict_readers])
+
+    def from_dicts(self, dicts):
+        readers = self._dict_readers
+        return [tuple([read(obj_dict) for read in readers]) for obj_dict in dicts]
+
+    def from_json(self, string, backend=None):
+        return self.from_dict(_json_backend(backend).loads(string))
+
+    def from_json_lines(self, lines, backend=None):
+        json_loads = _json_backend(backend).loads
+        return self.from_dicts(json_loads(line) for line in lines if line.strip())
+
+    def from_flat_list(self, values, offset=0):
+        return tuple([read(values, offset) for read in self._flat_readers])
+
+    def from_flat_lists(self, flat_lists):
+        readers = self._flat_readers
+        return [tuple([read(values, 0) for read in readers]) for values in flat_lists]
+
+
+def _path_steps(cls, path):
+    # Each step is the plan of the object that holds the field, and the
+    # index of the field in that plan
+    steps = []
+    plan = _plan(cls)
+    names = path.split(".")
+    for depth, name in enumerate(names):
+        if name not in plan.names:
+            raise ValueError("unknown field: '{0}'".format(path))
+        index = plan.names.index(name)
+        steps.append((plan, index))
+        if depth < len(names) - 1:
+            if plan.types[index] is None:
+                raise ValueError("field is not a nested object: '{0}'".format(".".join(names[:depth + 1])))
+            plan = _plan(plan.types[index])
+    return steps
+
+
+def _dict_reader(path, steps):
+    # dict_to_obj accepts both the camel case key of a field and its name, so
+    # both are tried, camel case first
+    keys = [
+        (plan.dict_keys[index][1], plan.names[index], plan.fields[index])
+        for plan, index in steps
+    ]
+    plan, index = steps[-1]
+    decode = _dict_decoder(plan, index)
+
+    def read(obj_dict):
+        value = obj_dict
+        for depth, (key, name, field) in enumerate(keys):
+            if value is None:
+                return None
+            elif key in value:
+                value = value[key]
+            elif name in value:
+                value = value[name]
+            elif field.has_default:
+                return _read_attrs(field.default, [name for key, name, field in keys[depth + 1:]])
+            else:
+                raise ValueError("missing field: '{0}'".format(path))
+        if value is None or decode is None:
+            return value
+        else:
+            return decode(value)
+
+    return read
+
+
+def _dict_decoder(plan, index):
+    field_type = plan.types[index]
+    if field_type is not None:
+        return lambda value: conversion.dict_to_obj(value, field_type)
+
+    codec = plan.dict_codecs[index]
+    return None if codec is None else codec.decode
+
+
+def _read_attrs(value, names):
+    for name in names:
+        if value is None:
+            return None
+        value = getattr(value, name)
+    return value
+
+
+def _flat_reader(steps):
+    offset = sum(_flat_offsets(plan)[index] for plan, index in steps)
+    plan, index = steps[-1]
+    field_type = plan.types[index]
+
+    if field_type is not None:
+        return lambda values, start: conversion.flat_list_to_obj(values, field_type, start + offset)
+
+    decode = plan._flat_types[index]
+    if decode is None:
+        return lambda values, start: values[start + offset]
+    else:
+        def read(values, start):
+            value = values[start + offset]
+            return None if value is None else _decode_flat_value(decode, value)
+        return read
+
+
+def _flat_offsets(plan):
+    # The position of the first value of each field in the flat list of an
+    # object, where a nested object takes up the values of all of its fields
+    offsets = []
+    offset = 0
+    for field_type in plan.types:
+        offsets.append(offset)
+        offset += 1 if field_type is None else _plan(field_type).flat_length()
+    return offsets
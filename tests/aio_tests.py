@@ -0,0 +1,136 @@
+from nose.tools import istest, assert_equal
+
+import sys
+
+import dodge
+
+if sys.version_info[:2] >= (3, 6):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    import dodge.aio
+    aio = dodge.aio
+else:
+    # dodge.aio uses asynchronous generators
+    aio = None
+
+
+User = dodge.data_class("User", ["username", dodge.field("password", default=None)])
+
+
+# The tests drive coroutines from plain functions, since this module needs
+# to be importable by versions of Python without async syntax
+
+if aio is not None:
+    @istest
+    def objects_are_read_from_json_lines_split_across_chunks():
+        objs = _read_objects(
+            [b'{"username": "bob"}\n\n{"username": "jim", "pass', b'word": "password1"}\n{"username": "sue"}'],
+            User,
+            chunk_size=8,
+        )
+
+        assert_equal([User("bob"), User("jim", "password1"), User("sue")], objs)
+
+
+    @istest
+    def objects_are_written_and_read_with_each_framing():
+        for framing in ["lines", "length"]:
+            yield _objects_are_written_and_read, framing
+
+
+    def _objects_are_written_and_read(framing):
+        users = [User("user{0}".format(index), "password{0}".format(index)) for index in range(25)]
+
+        writer = _BufferWriter()
+        _run(aio.write_objects(writer, users, framing=framing, batch_size=10))
+
+        assert_equal(3, writer.writes)
+        assert_equal(users, _read_objects([writer.data], User, framing=framing, chunk_size=100, batch_size=4))
+
+
+    @istest
+    def large_batches_are_decoded_using_executor():
+        executor = _CountingExecutor(1)
+        try:
+            objs = _read_objects(
+                [b'{"username": "bob"}\n' * 3],
+                User,
+                batch_size=2,
+                executor=executor,
+                offload_size=30,
+            )
+        finally:
+            executor.shutdown()
+
+        assert_equal([User("bob")] * 3, objs)
+        assert_equal(1, executor.submitted)
+
+
+    @istest
+    def error_is_raised_if_stream_ends_part_way_through_record():
+        assert_raises_regexp(
+            ValueError, "^unexpected end of stream$",
+            lambda: _read_objects([dodge.pack(User("bob"))[:3]], User, framing="length")
+        )
+
+
+    def _read_objects(chunks, cls, **kwargs):
+        loop = asyncio.new_event_loop()
+        try:
+            reader = asyncio.StreamReader(loop=loop)
+            for chunk in chunks:
+                reader.feed_data(chunk)
+            reader.feed_eof()
+
+            objs = aio.iter_objects(reader, cls, **kwargs)
+            result = []
+            while True:
+                try:
+                    result.append(loop.run_until_complete(objs.__anext__()))
+                except StopAsyncIteration:
+                    return result
+        finally:
+            loop.close()
+
+
+    def _run(coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+
+    class _BufferWriter(object):
+        def __init__(self):
+            self.data = b""
+            self.writes = 0
+
+        def write(self, data):
+            self.data += data
+            self.writes += 1
+
+        def drain(self):
+            return asyncio.sleep(0)
+
+
+    class _CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super(_CountingExecutor, self).submit(*args, **kwargs)
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
@@ -0,0 +1,122 @@
+from nose.tools import istest, assert_equal
+
+import io
+
+import dodge
+
+
+@istest
+def can_convert_data_classes_to_and_from_bytes():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    user = User("bob", "password1")
+    
+    assert_equal(user, dodge.unpack(dodge.pack(user), User))
+
+
+@istest
+def packed_data_class_does_not_include_field_names():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_equal(b"\x05\x00\x00\x00\x03bob", dodge.pack(User("bob")))
+
+
+@istest
+def values_of_each_supported_type_are_preserved():
+    Values = dodge.data_class("Values", [
+        "none", "false", "true", "int", "big_int", "float", "text", "bytes", "list", "dict"
+    ])
+    
+    values = Values(
+        None, False, True, -42, 2 ** 100, 1.5, u"caf\xe9", b"\x00\xff",
+        [1, u"two", [3.0]],
+        {u"one": 1, u"two": [2]},
+    )
+    result = dodge.unpack(dodge.pack(values), Values)
+    
+    assert_equal(values, result)
+    assert_equal(bool, type(result.false))
+    assert_equal(float, type(result.float))
+
+
+@istest
+def can_convert_nested_data_classes_to_and_from_bytes():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+    ])
+    
+    user = User("bob", Profile("I'm Bob."))
+    
+    assert_equal(user, dodge.unpack(dodge.pack(user), User))
+    assert_equal(User("bob", None), dodge.unpack(dodge.pack(User("bob", None)), User))
+
+
+@istest
+def can_convert_container_fields_to_and_from_bytes():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        dodge.field("profiles", type=dodge.list_of(Profile)),
+        dodge.field("profile", type=dodge.optional(Profile)),
+    ])
+    
+    user = User([Profile("I'm Bob."), Profile("I'm Jim.")], None)
+    
+    assert_equal(user, dodge.unpack(dodge.pack(user), User))
+
+
+@istest
+def nested_data_class_in_field_without_type_is_unpacked_as_dict():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", ["username", "profile"])
+    
+    user = User("bob", Profile("I'm Bob."))
+    
+    assert_equal(User("bob", {"bio": "I'm Bob."}), dodge.unpack(dodge.pack(user), User))
+
+
+@istest
+def error_is_raised_if_value_cannot_be_packed():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_raises_regexp(
+        TypeError, "^cannot pack value of type object$",
+        lambda: dodge.pack(User(object()))
+    )
+
+
+@istest
+def error_is_raised_if_data_is_truncated():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_raises_regexp(
+        ValueError, "^unexpected end of data$",
+        lambda: dodge.unpack(dodge.pack(User("bob"))[:-1], User)
+    )
+
+
+@istest
+def can_convert_streams_of_data_classes_to_and_from_bytes():
+    User = dodge.data_class("User", ["username", "is_root"])
+    
+    users = [User("bob", False), User("jim", True), User("ann", False)]
+    output = io.BytesIO()
+    dodge.pack_stream(iter(users), output, batch_size=2)
+    
+    assert_equal(users, list(dodge.unpack_stream(io.BytesIO(output.getvalue()), User)))
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
@@ -0,0 +1,191 @@
+from nose.tools import istest, assert_equal
+
+import datetime
+import decimal
+import json
+import uuid
+
+import dodge
+
+
+@istest
+def datetime_fields_are_converted_to_and_from_isoformat_strings():
+    Event = dodge.data_class("Event", [
+        dodge.field("occurred_at", type=datetime.datetime),
+        dodge.field("day", type=datetime.date),
+        dodge.field("time", type=datetime.time),
+    ])
+
+    event = Event(
+        datetime.datetime(2014, 3, 1, 12, 30, 15, 500),
+        datetime.date(2014, 3, 1),
+        datetime.time(12, 30),
+    )
+    event_dict = dodge.obj_to_dict(event)
+
+    assert_equal(
+        {"occurredAt": "2014-03-01T12:30:15.000500", "day": "2014-03-01", "time": "12:30:00"},
+        event_dict
+    )
+    assert_equal(event, dodge.dict_to_obj(event_dict, Event))
+
+
+@istest
+def decimal_and_uuid_fields_are_converted_to_and_from_strings():
+    Payment = dodge.data_class("Payment", [
+        dodge.field("id", type=uuid.UUID),
+        dodge.field("amount", type=decimal.Decimal),
+    ])
+
+    payment = Payment(uuid.UUID("12345678-1234-5678-1234-567812345678"), decimal.Decimal("1.10"))
+    string = dodge.dumps(payment)
+
+    assert_equal({"id": "12345678-1234-5678-1234-567812345678", "amount": "1.10"}, json.loads(string))
+    assert_equal(payment, dodge.loads(string, Payment))
+
+
+@istest
+def none_is_not_passed_to_codecs():
+    Event = dodge.data_class("Event", [
+        dodge.field("occurred_at", type=datetime.datetime, default=None),
+    ])
+
+    assert_equal({"occurredAt": None}, dodge.obj_to_dict(Event()))
+    assert_equal(Event(), dodge.dict_to_obj({"occurredAt": None}, Event))
+
+
+@istest
+def codec_on_field_is_used_in_preference_to_registered_codec():
+    Event = dodge.data_class("Event", [
+        dodge.field("day", type=datetime.date, codec=dodge.Codec(
+            encode=lambda value: value.toordinal(),
+            decode=datetime.date.fromordinal,
+        )),
+    ])
+
+    event = Event(datetime.date(2014, 3, 1))
+
+    assert_equal({"day": 735293}, dodge.obj_to_dict(event))
+    assert_equal(event, dodge.dict_to_obj({"day": 735293}, Event))
+
+
+@istest
+def codecs_can_be_registered_for_types_and_their_subclasses():
+    class Point(object):
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def __eq__(self, other):
+            return (self.x, self.y) == (other.x, other.y)
+
+    class Point3(Point):
+        pass
+
+    dodge.register_codec(Point, dodge.Codec(
+        encode=lambda point: [point.x, point.y],
+        decode=lambda values: Point(*values),
+    ))
+    try:
+        Shape = dodge.data_class("Shape", [dodge.field("origin", type=Point3)])
+
+        shape = Shape(Point3(1, 2))
+
+        assert_equal({"origin": [1, 2]}, dodge.obj_to_dict(shape))
+        assert_equal(shape, dodge.dict_to_obj({"origin": [1, 2]}, Shape))
+    finally:
+        dodge.unregister_codec(Point)
+
+
+@istest
+def codec_is_not_used_for_classes_defined_after_it_is_unregistered():
+    class Point(object):
+        pass
+
+    dodge.register_codec(Point, dodge.Codec(encode=lambda point: "point", decode=lambda value: Point()))
+    dodge.unregister_codec(Point)
+    Shape = dodge.data_class("Shape", [dodge.field("origin", type=Point)])
+
+    point = Point()
+
+    assert_equal({"origin": point}, dodge.obj_to_dict(Shape(point)))
+
+
+@istest
+def values_of_types_without_codec_are_converted_as_they_are():
+    class Point(object):
+        pass
+
+    Shape = dodge.data_class("Shape", [dodge.field("origin", type=Point), "name"])
+
+    point = Point()
+    shape = Shape(point, "square")
+
+    assert_equal({"origin": point, "name": "square"}, dodge.obj_to_dict(shape))
+    assert_equal([point, "square"], dodge.obj_to_flat_list(shape))
+
+
+@istest
+def error_is_raised_when_reading_field_with_no_codec_for_its_type():
+    class Point(object):
+        pass
+
+    Shape = dodge.data_class("Shape", [dodge.field("origin", type=Point)])
+
+    assert_raises_regexp(
+        ValueError, "^no codec for type of field 'origin': Point$",
+        lambda: dodge.dict_to_obj({"origin": [1, 2]}, Shape)
+    )
+
+
+@istest
+def codecs_are_used_when_packing_and_unpacking():
+    Payment = dodge.data_class("Payment", [
+        dodge.field("amount", type=decimal.Decimal),
+        dodge.field("paid_at", type=datetime.datetime),
+    ])
+
+    payment = Payment(decimal.Decimal("1.10"), datetime.datetime(2014, 3, 1, 12, 30))
+
+    assert_equal(payment, dodge.unpack(dodge.pack(payment), Payment))
+
+
+@istest
+def codecs_are_used_when_loading_lazily():
+    Event = dodge.data_class("Event", [
+        dodge.field("day", type=datetime.date),
+    ])
+
+    event = dodge.loads('{"day": "2014-03-01"}', Event, lazy=True)
+
+    assert_equal(datetime.date(2014, 3, 1), event.day)
+
+
+try:
+    import enum
+except ImportError:
+    pass
+else:
+    @istest
+    def enum_fields_are_converted_to_and_from_values():
+        class Colour(enum.Enum):
+            red = "red"
+            green = "green"
+
+        Paint = dodge.data_class("Paint", [dodge.field("colour", type=Colour)])
+
+        assert_equal({"colour": "green"}, dodge.obj_to_dict(Paint(Colour.green)))
+        assert_equal(Paint(Colour.green), dodge.dict_to_obj({"colour": "green"}, Paint))
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
@@ -1,5 +1,20 @@
 from nose.tools import istest, assert_equal
 
+import array
+import datetime
+import sys
+import uuid
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import dodge
 
 
@@ -25,6 +40,15 @@ def arguments_with_camelcase_names_are_converted_to_use_underscores():
     assert_equal(expected_user, converted_user)
 
 
+@istest
+def keys_that_convert_to_field_names_are_recognised():
+    User = dodge.data_class("User", ["is_root"])
+    
+    assert_equal(User(is_root=True), dodge.dict_to_obj({"is_root": True}, User))
+    assert_equal(User(is_root=True), dodge.dict_to_obj({"isRoot": True}, User))
+    assert_equal(User(is_root=True), dodge.dict_to_obj({"IsRoot": True}, User))
+
+
 @istest
 def unrecognised_fields_are_ignored():
     User = dodge.data_class("User", ["username"])
@@ -58,6 +82,16 @@ def conversion_from_obj_to_dict_converts_underscores_to_camel_case():
     assert_equal(expected_dict, result)
 
 
+@istest
+def fields_with_keys_that_do_not_convert_back_to_their_names_can_be_converted():
+    Address = dodge.data_class("Address", ["line_1", "line_2"])
+    
+    address = Address("1 Street", "Town")
+    
+    assert_equal({"line1": "1 Street", "line2": "Town"}, dodge.obj_to_dict(address))
+    assert_equal(address, dodge.dict_to_obj(dodge.obj_to_dict(address), Address))
+
+
 @istest
 def converting_object_to_dict_preserves_ordering():
     User = dodge.data_class("User", [
@@ -85,6 +119,18 @@ def can_convert_nested_data_classes_to_and_from_dict():
     assert_equal(user, unserialised_user)
 
 
+@istest
+def obj_to_dict_can_convert_to_plain_dicts():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", ["username", dodge.field("profile", type=Profile)])
+    
+    user_dict = dodge.obj_to_dict(User("bob", Profile("I'm Bob.")), ordered=False)
+    
+    assert_equal(dict, type(user_dict))
+    assert_equal(dict, type(user_dict["profile"]))
+    assert_equal({"username": "bob", "profile": {"bio": "I'm Bob."}}, user_dict)
+
+
 @istest
 def can_convert_data_classes_to_and_from_string():
     User = dodge.data_class("User", ["username", "password"])
@@ -112,6 +158,32 @@ def can_convert_nested_data_classes_to_and_from_string():
     assert_equal(user, unserialised_user)
     
 
+@istest
+def can_convert_data_classes_to_and_from_json_lines():
+    User = dodge.data_class("User", ["username", "is_root"])
+    
+    users = [User("bob", False), User("jim", True), User("ann", False)]
+    output = StringIO()
+    dodge.dump_lines(iter(users), output, batch_size=2, backend="json")
+    
+    assert_equal(
+        '{"username": "bob", "isRoot": false}\n'
+        '{"username": "jim", "isRoot": true}\n'
+        '{"username": "ann", "isRoot": false}\n',
+        output.getvalue()
+    )
+    assert_equal(users, list(dodge.load_lines(StringIO(output.getvalue()), User)))
+
+
+@istest
+def blank_lines_are_ignored_when_loading_json_lines():
+    User = dodge.data_class("User", ["username"])
+    
+    input_file = StringIO('{"username": "bob"}\n\n{"username": "jim"}\n')
+    
+    assert_equal([User("bob"), User("jim")], list(dodge.load_lines(input_file, User)))
+
+
 @istest
 def can_convert_data_classes_to_and_from_flat_list():
     User = dodge.data_class("User", ["username", "password"])
@@ -151,3 +223,529 @@ def flat_list_for_nested_data_classes_contains_all_field_values_as_flat_list():
     user = User("bob", Profile("I'm Bob."))
     
     assert_equal(["bob", "I'm Bob."], dodge.obj_to_flat_list(user))
+
+
+@istest
+def flat_list_can_be_read_from_offset():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    assert_equal(User("bob", "password1"), dodge.flat_list_to_obj(["x", "bob", "password1"], User, offset=1))
+
+
+@istest
+def consecutive_flat_lists_can_be_read_from_list():
+    Point = dodge.data_class("Point", ["x", "y"])
+    
+    values = [0, 1, 2, 3, 4, 5, 6]
+    
+    assert_equal([Point(1, 2), Point(3, 4)], dodge.flat_list_to_objs(values, Point, offset=1, count=2))
+    assert_equal([Point(1, 2), Point(3, 4), Point(5, 6)], dodge.flat_list_to_objs(values, Point, offset=1))
+
+
+@istest
+def consecutive_flat_lists_can_be_read_from_memoryview():
+    Point = dodge.data_class("Point", ["x", "y"])
+    Line = dodge.data_class("Line", [
+        "id",
+        dodge.field("start", type=Point),
+        dodge.field("end", type=Point),
+    ])
+    
+    values = memoryview(array.array("d", [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+    
+    assert_equal([Point(1, 2), Point(3, 4)], dodge.flat_list_to_objs(values, Point, offset=1, count=2))
+    assert_equal(
+        [Line(1, Point(2, 3), Point(4, 5)), Line(6, Point(7, 8), Point(9, 10))],
+        dodge.flat_list_to_objs(values, Line, offset=1),
+    )
+
+
+@istest
+def error_is_raised_if_flat_list_does_not_hold_whole_records():
+    Point = dodge.data_class("Point", ["x", "y"])
+    
+    assert_raises_regexp(
+        ValueError, "^values do not hold a whole number of records$",
+        lambda: dodge.flat_list_to_objs([1, 2, 3], Point)
+    )
+    assert_raises_regexp(
+        ValueError, "^values end before last record$",
+        lambda: dodge.flat_list_to_objs([1, 2, 3], Point, count=2)
+    )
+
+
+@istest
+def can_convert_data_classes_with_slots_to_and_from_dict_and_flat_list():
+    Profile = dodge.data_class("Profile", ["bio"], slots=True)
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+    ], slots=True)
+    
+    user = User("bob", Profile("I'm Bob."))
+    assert_equal({"username": "bob", "profile": {"bio": "I'm Bob."}}, dodge.obj_to_dict(user))
+    assert_equal(user, dodge.dict_to_obj(dodge.obj_to_dict(user), User))
+    assert_equal(["bob", "I'm Bob."], dodge.obj_to_flat_list(user))
+    assert_equal(user, dodge.flat_list_to_obj(dodge.obj_to_flat_list(user), User))
+
+
+@istest
+def conversion_uses_fields_of_class_after_conversion_plan_is_cleared():
+    User = dodge.data_class("User", ["username"])
+    assert_equal({"username": "bob"}, dodge.obj_to_dict(User("bob")))
+    
+    dodge.fields(User).append(dodge.field("is_root", default=False))
+    dodge.clear_conversion_plan(User)
+    user = User("bob")
+    user.is_root = False
+    
+    assert_equal({"username": "bob", "isRoot": False}, dodge.obj_to_dict(user))
+
+
+@istest
+def objects_can_be_converted_to_columns():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    users = [User("bob", "password1"), User("jim", "password2")]
+    
+    assert_equal(
+        {"username": ["bob", "jim"], "password": ["password1", "password2"]},
+        dodge.objs_to_columns(users, User)
+    )
+
+
+@istest
+def nested_fields_are_converted_to_columns_with_dotted_names():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+    ])
+    
+    users = [User("bob", Profile("I'm Bob.")), User("jim", Profile("I'm Jim."))]
+    columns = dodge.objs_to_columns(users, User)
+    
+    assert_equal(["username", "profile.bio"], list(columns.keys()))
+    assert_equal(["I'm Bob.", "I'm Jim."], columns["profile.bio"])
+    assert_equal(users, dodge.columns_to_objs(columns, User))
+
+
+@istest
+def columns_with_typecodes_are_converted_to_arrays():
+    Point = dodge.data_class("Point", ["x", "y", "label"])
+    
+    points = [Point(1, 2.5, "a"), Point(3, 4.5, "b")]
+    columns = dodge.objs_to_columns(points, Point, typecodes={"x": "i", "y": "d"})
+    
+    assert_equal(array.array("i", [1, 3]), columns["x"])
+    assert_equal(array.array("d", [2.5, 4.5]), columns["y"])
+    assert_equal(["a", "b"], columns["label"])
+    assert_equal(points, dodge.columns_to_objs(columns, Point))
+
+
+if numpy is not None:
+    @istest
+    def columns_with_typecodes_are_converted_to_numpy_arrays():
+        Point = dodge.data_class("Point", ["x", "y", "label"])
+        
+        points = [Point(1, 2.5, "a"), Point(3, 4.5, "b")]
+        columns = dodge.objs_to_columns(points, Point, typecodes={"x": "i", "y": "d"}, use_numpy=True)
+        
+        assert isinstance(columns["x"], numpy.ndarray)
+        assert_equal(numpy.dtype("i"), columns["x"].dtype)
+        assert_equal([1, 3], columns["x"].tolist())
+        assert_equal(numpy.dtype("d"), columns["y"].dtype)
+        assert_equal([2.5, 4.5], columns["y"].tolist())
+        assert_equal(["a", "b"], columns["label"])
+        assert_equal(points, dodge.columns_to_objs(columns, Point))
+    
+    
+    @istest
+    def numpy_arrays_are_converted_to_objects_with_python_values():
+        Point = dodge.data_class("Point", ["x", "y", "label"])
+        
+        points = dodge.columns_to_objs({
+            "x": numpy.array([1, 3]),
+            "y": numpy.array([2.5, 4.5]),
+            "label": numpy.array(["a", "b"]),
+        }, Point)
+        
+        assert_equal([Point(1, 2.5, "a"), Point(3, 4.5, "b")], points)
+        assert_equal([int, float, str], [type(value) for value in dodge.obj_to_flat_list(points[0])])
+
+
+@istest
+def objects_with_keyword_only_fields_can_be_converted_from_columns():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", keyword_only=True),
+    ])
+    
+    columns = {"username": ["bob"], "password": ["password1"]}
+    
+    assert_equal([User("bob", password="password1")], dodge.columns_to_objs(columns, User))
+
+
+@istest
+def error_is_raised_if_column_is_missing():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    assert_raises_regexp(
+        ValueError, "^missing column: 'password'$",
+        lambda: dodge.columns_to_objs({"username": ["bob"]}, User)
+    )
+
+
+@istest
+def error_is_raised_if_columns_have_different_lengths():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    assert_raises_regexp(
+        ValueError, "^columns have different lengths$",
+        lambda: dodge.columns_to_objs({"username": ["bob"], "password": []}, User)
+    )
+
+
+@istest
+def can_convert_objects_nested_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    Level = dodge.data_class("Level", ["value"])
+    obj = Level(0)
+    for index in range(1, depth):
+        Level = dodge.data_class("Level", ["value", dodge.field("child", type=Level)])
+        obj = Level(index, obj)
+    
+    flat_list = dodge.obj_to_flat_list(obj)
+    assert_equal(list(range(depth - 1, -1, -1)), flat_list)
+    assert_equal(flat_list, dodge.obj_to_flat_list(dodge.flat_list_to_obj(flat_list, Level)))
+    
+    obj_dict = dodge.obj_to_dict(obj)
+    assert_equal(flat_list, dodge.obj_to_flat_list(dodge.dict_to_obj(obj_dict, Level)))
+
+
+@istest
+def can_convert_wide_trees_of_nested_objects():
+    Leaf = dodge.data_class("Leaf", ["value"])
+    Branch = dodge.data_class("Branch", [
+        dodge.field("branch{0}".format(index), type=Leaf)
+        for index in range(100)
+    ])
+    Tree = dodge.data_class("Tree", [
+        dodge.field("tree{0}".format(index), type=Branch)
+        for index in range(100)
+    ])
+    
+    tree = Tree(*[
+        Branch(*[Leaf(branch * 100 + leaf) for leaf in range(100)])
+        for branch in range(100)
+    ])
+    
+    flat_list = dodge.obj_to_flat_list(tree)
+    assert_equal(list(range(10000)), flat_list)
+    assert_equal(tree, dodge.flat_list_to_obj(flat_list, Tree))
+    assert_equal(tree, dodge.dict_to_obj(dodge.obj_to_dict(tree), Tree))
+    assert_equal(99, dodge.obj_to_dict(tree)["tree0"]["branch99"]["value"])
+
+
+@istest
+def can_convert_list_fields_of_nested_data_classes_to_and_from_dict():
+    Child = dodge.data_class("Child", ["first_name"])
+    Parent = dodge.data_class("Parent", [dodge.field("children", type=dodge.list_of(Child))])
+    
+    parent = Parent([Child("Bob"), Child("Jim")])
+    parent_dict = dodge.obj_to_dict(parent)
+    
+    assert_equal({"children": [{"firstName": "Bob"}, {"firstName": "Jim"}]}, parent_dict)
+    assert_equal(parent, dodge.dict_to_obj(parent_dict, Parent))
+
+
+@istest
+def can_convert_dict_and_optional_fields_to_and_from_dict():
+    Address = dodge.data_class("Address", ["city"])
+    Profile = dodge.data_class("Profile", [dodge.field("address", type=Address)])
+    User = dodge.data_class("User", [
+        dodge.field("profiles", type=dodge.dict_of(Profile)),
+        dodge.field("profile", type=dodge.optional(Profile)),
+        dodge.field("scores", type=dodge.list_of(dodge.optional(int))),
+    ])
+    
+    user = User({"home": Profile(Address("London"))}, None, [1, None])
+    user_dict = dodge.obj_to_dict(user)
+    
+    assert_equal(
+        {"profiles": {"home": {"address": {"city": "London"}}}, "profile": None, "scores": [1, None]},
+        user_dict
+    )
+    assert_equal(user, dodge.dict_to_obj(user_dict, User))
+    assert_equal(
+        User({}, Profile(Address("Paris")), []),
+        dodge.dict_to_obj({"profiles": {}, "profile": {"address": {"city": "Paris"}}, "scores": []}, User)
+    )
+
+
+@istest
+def elements_of_container_fields_are_converted_with_codecs():
+    Event = dodge.data_class("Event", [
+        dodge.field("days", type=dodge.list_of(dodge.list_of(datetime.date))),
+    ])
+    
+    event = Event([[datetime.date(2014, 3, 1)], []])
+    
+    assert_equal({"days": [["2014-03-01"], []]}, dodge.obj_to_dict(event))
+    assert_equal(event, dodge.loads(dodge.dumps(event), Event))
+
+
+@istest
+def container_fields_take_up_one_value_in_flat_list():
+    Child = dodge.data_class("Child", ["first_name", "last_name"])
+    Parent = dodge.data_class("Parent", [
+        "name",
+        dodge.field("children", type=dodge.list_of(Child)),
+        dodge.field("partner", type=dodge.optional(Child)),
+    ])
+    
+    parent = Parent("Bob", [Child("Jim", "Smith"), Child("Sue", "Smith")], None)
+    flat_list = dodge.obj_to_flat_list(parent)
+    
+    assert_equal(["Bob", [["Jim", "Smith"], ["Sue", "Smith"]], None], flat_list)
+    assert_equal(parent, dodge.flat_list_to_obj(flat_list, Parent))
+
+
+@istest
+def can_convert_objects_nested_in_lists_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    Level = dodge.data_class("Level", ["value"])
+    obj = Level(0)
+    for index in range(1, depth):
+        Level = dodge.data_class("Level", ["value", dodge.field("children", type=dodge.list_of(Level))])
+        obj = Level(index, [obj])
+    
+    for result in [
+        dodge.dict_to_obj(dodge.obj_to_dict(obj), Level),
+        dodge.flat_list_to_obj(dodge.obj_to_flat_list(obj), Level),
+    ]:
+        values = [result.value]
+        while hasattr(result, "children"):
+            result, = result.children
+            values.append(result.value)
+        assert_equal(list(range(depth - 1, -1, -1)), values)
+
+
+@istest
+def lazy_conversion_from_dict_to_obj_is_equal_to_eager_conversion():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("is_root", default=False),
+        dodge.field("profile", type=Profile),
+    ])
+    
+    input_dict = {"username": "bob", "profile": {"bio": "I'm Bob."}}
+    user = dodge.dict_to_obj(input_dict, User, lazy=True)
+    
+    assert isinstance(user, User)
+    assert_equal(User("bob", profile=Profile("I'm Bob.")), user)
+    assert_equal(user, User("bob", profile=Profile("I'm Bob.")))
+    assert_equal("User('bob', is_root=False, Profile(\"I'm Bob.\"))", repr(user))
+    assert_equal(dodge.obj_to_dict(User("bob", profile=Profile("I'm Bob."))), dodge.obj_to_dict(user))
+
+
+@istest
+def lazy_conversion_only_converts_fields_when_they_are_accessed():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+    ])
+    
+    user = dodge.loads('{"username": "bob", "profile": {"bio": "I\'m Bob."}}', User, lazy=True)
+    
+    assert "profile" not in user.__dict__
+    assert_equal("bob", user.username)
+    assert "profile" not in user.__dict__
+    profile = user.profile
+    assert_equal("I'm Bob.", profile.bio)
+    assert user.profile is profile
+
+
+@istest
+def copy_of_lazy_object_does_not_convert_nested_objects():
+    Profile = dodge.data_class("Profile", ["bio"])
+    
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+    ], slots=True)
+    
+    user = dodge.dict_to_obj({"username": "bob", "profile": {"bio": "I'm Bob."}}, User, lazy=True)
+    copy = dodge.copy(user, username="jim")
+    
+    assert_equal("jim", copy.username)
+    assert type(copy) is User
+    assert "bio" not in copy.profile.__dict__
+    assert_equal(User("jim", Profile("I'm Bob.")), copy)
+
+
+@istest
+def lazy_conversion_supports_frozen_data_classes():
+    User = dodge.data_class("User", ["username"], frozen=True, slots=True)
+    
+    user = dodge.dict_to_obj({"username": "bob"}, User, lazy=True)
+    
+    assert_equal(hash(User("bob")), hash(user))
+    assert_equal(User("bob"), user)
+
+
+@istest
+def container_fields_of_lazy_objects_are_converted_when_accessed():
+    Child = dodge.data_class("Child", ["name"])
+    Parent = dodge.data_class("Parent", [dodge.field("children", type=dodge.list_of(Child))])
+    
+    parent = dodge.dict_to_obj({"children": [{"name": "Bob"}]}, Parent, lazy=True)
+    
+    assert_equal([Child("Bob")], parent.children)
+
+
+@istest
+def error_is_raised_when_missing_field_of_lazy_object_is_accessed():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    user = dodge.dict_to_obj({"username": "bob"}, User, lazy=True)
+    
+    assert_equal("bob", user.username)
+    assert_raises_regexp(
+        TypeError, "^Missing argument: 'password'$",
+        lambda: user.password
+    )
+
+
+@istest
+def interning_shares_equal_objects_of_frozen_data_classes_and_equal_strings():
+    Instrument = dodge.data_class("Instrument", ["symbol", "exchange"], frozen=True)
+    Trade = dodge.data_class("Trade", ["id", "side", dodge.field("instrument", type=Instrument)])
+    Trades = dodge.data_class("Trades", [dodge.field("trades", type=dodge.list_of(Trade))])
+    
+    trades = dodge.loads(
+        '{"trades": [' +
+        '{"id": 1, "side": "buy", "instrument": {"symbol": "ABC", "exchange": "LSE"}}, ' +
+        '{"id": 2, "side": "buy", "instrument": {"symbol": "ABC", "exchange": "LSE"}}]}',
+        Trades,
+        intern=True,
+    ).trades
+    
+    assert_equal([1, 2], [trade.id for trade in trades])
+    assert trades[0].instrument is trades[1].instrument
+    assert trades[0].side is trades[1].side
+    assert trades[0] is not trades[1]
+
+
+@istest
+def objects_of_data_classes_that_are_not_frozen_are_not_interned():
+    Instrument = dodge.data_class("Instrument", ["symbol"])
+    Trade = dodge.data_class("Trade", [dodge.field("instrument", type=Instrument)])
+    Trades = dodge.data_class("Trades", [dodge.field("trades", type=dodge.list_of(Trade))])
+    
+    trades = dodge.dict_to_obj(
+        {"trades": [{"instrument": {"symbol": "ABC"}}, {"instrument": {"symbol": "ABC"}}]},
+        Trades,
+        intern=True,
+    ).trades
+    
+    assert_equal(trades[0].instrument, trades[1].instrument)
+    assert trades[0].instrument is not trades[1].instrument
+
+
+@istest
+def interner_discards_least_recently_used_values():
+    Instrument = dodge.data_class("Instrument", ["symbol"], frozen=True)
+    interner = dodge.Interner(max_size=2)
+    
+    first = dodge.dict_to_obj({"symbol": "ABC"}, Instrument, intern=interner)
+    assert dodge.dict_to_obj({"symbol": "ABC"}, Instrument, intern=interner) is first
+    dodge.dict_to_obj({"symbol": "DEF"}, Instrument, intern=interner)
+    
+    assert dodge.dict_to_obj({"symbol": "ABC"}, Instrument, intern=interner) is not first
+
+
+@istest
+def values_are_interned_across_json_lines():
+    Instrument = dodge.data_class("Instrument", ["symbol"], frozen=True)
+    Trade = dodge.data_class("Trade", ["id", dodge.field("instrument", type=Instrument)])
+    
+    input_file = StringIO(
+        '{"id": 1, "instrument": {"symbol": "ABC"}}\n{"id": 2, "instrument": {"symbol": "ABC"}}\n')
+    first, second = dodge.load_lines(input_file, Trade, intern=True)
+    
+    assert first.instrument is second.instrument
+
+
+@istest
+def valid_dict_has_no_validation_errors():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", [
+        "first_name",
+        dodge.field("profile", type=Profile),
+        dodge.field("friends", type=dodge.list_of(Profile), default=None),
+    ])
+    
+    assert_equal([], dodge.validate({"firstName": "Bob", "profile": {"bio": "I'm Bob."}}, User))
+    assert_equal([], dodge.validate('{"firstName": "Bob", "profile": {"bio": ""}, "friends": []}', User))
+
+
+@istest
+def validation_reports_all_errors_with_their_paths():
+    Child = dodge.data_class("Child", ["name", dodge.field("born", type=datetime.date, default=None)])
+    Parent = dodge.data_class("Parent", [
+        "name",
+        dodge.field("partner", type=Child),
+        dodge.field("children", type=dodge.list_of(Child)),
+        dodge.field("pets", type=dodge.dict_of(Child), default=None),
+    ])
+    
+    errors = dodge.validate({
+        "partner": "Sue",
+        "children": [{"name": "Jim"}, {"born": "yesterday", "age": 4}],
+        "pets": {"Rex": {}},
+    }, Parent)
+    
+    assert_equal([
+        dodge.ValidationError(["partner"], "expected object"),
+        dodge.ValidationError(["name"], "missing field"),
+        dodge.ValidationError(["children", 1, "born"], "invalid value"),
+        dodge.ValidationError(["children", 1, "age"], "unknown field"),
+        dodge.ValidationError(["children", 1, "name"], "missing field"),
+        dodge.ValidationError(["pets", "Rex", "name"], "missing field"),
+    ], errors)
+
+
+@istest
+def validation_reports_values_of_the_wrong_type_for_codec_as_invalid():
+    User = dodge.data_class("User", [dodge.field("id", type=uuid.UUID)])
+    
+    assert_equal([dodge.ValidationError(["id"], "invalid value")], dodge.validate({"id": 123}, User))
+    assert_equal([dodge.ValidationError(["id"], "invalid value")], dodge.validate({"id": []}, User))
+
+
+@istest
+def validation_reports_invalid_json_and_values_that_are_not_objects():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_equal([dodge.ValidationError([], "invalid JSON")], dodge.validate("{", User))
+    assert_equal([dodge.ValidationError([], "expected object")], dodge.validate("[]", User))
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
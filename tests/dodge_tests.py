@@ -1,6 +1,12 @@
 from nose.tools import istest, assert_equal
 
+import copy
+import pickle
+import subprocess
+import sys
+
 import dodge
+import dodge.data
 
 
 @istest
@@ -107,6 +113,50 @@ def error_is_raised_if_copy_kwarg_is_not_field():
     )
 
 
+@istest
+def copy_many_copies_each_object_with_same_changes():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    originals = [User("bob", "password1"), User("jim", "password2")]
+    copies = dodge.copy_many(originals, password="password3")
+    
+    assert_equal([User("bob", "password3"), User("jim", "password3")], copies)
+    assert_equal([User("bob", "password1"), User("jim", "password2")], originals)
+
+
+@istest
+def error_is_raised_if_copy_many_kwarg_is_not_field():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    assert_raises_regexp(
+        TypeError, "^User.__init__ does not take keyword argument 'salt'$",
+        lambda: dodge.copy_many([User("bob", "password1")], salt="salty")
+    )
+
+
+@istest
+def copy_of_data_class_with_non_identifier_field_names_has_changed_values():
+    User = dodge.data_class("User", ["user name", "password"])
+    
+    copy = dodge.copy(User("bob", "password1"), password="password2")
+    
+    assert_equal(User("bob", "password2"), copy)
+
+
+@istest
+def copy_of_instance_of_subclass_of_data_class_is_instance_of_subclass():
+    User = dodge.data_class("User", ["username", "password"])
+    
+    class Admin(User):
+        def is_admin(self):
+            return True
+    
+    copy = dodge.copy(Admin("bob", "password1"), password="password2")
+    
+    assert type(copy) is Admin
+    assert_equal(Admin("bob", "password2"), copy)
+    assert copy.is_admin()
+
 @istest
 def field_is_set_to_default_if_value_not_provided():
     User = dodge.data_class("User", [
@@ -228,6 +278,465 @@ def super_init_is_called_if_super_class_is_specified():
     assert_equal(42, user.id)
 
 
+@istest
+def data_class_with_generic_methods_behaves_the_same_as_compiled_data_class():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1", show_default=False),
+        dodge.field("salt", keyword_only=True),
+    ], compiled=False)
+    
+    user = User("bob", salt="asf")
+    assert_equal("User('bob', salt='asf')", repr(user))
+    assert_equal(User("bob", salt="asf"), user)
+    assert User("bob", "password2", salt="asf") != user
+    assert_raises_regexp(
+        TypeError, "^User.__init__ takes 2 positional arguments but 3 were given$",
+        lambda: User("bob", "password1", "asf")
+    )
+    assert_raises_regexp(
+        TypeError, "^Missing argument: 'salt'$",
+        lambda: User("bob")
+    )
+    assert_raises_regexp(
+        TypeError, "^User.__init__ does not take keyword argument 'email'$",
+        lambda: User("bob", salt="asf", email="bob@example.com")
+    )
+
+
+@istest
+def compiled_methods_behave_the_same_as_generic_methods():
+    calls_before_compiling = dodge.data._calls_before_compiling
+    dodge.data._calls_before_compiling = 0
+    try:
+        User = dodge.data_class("User", [
+            "username",
+            dodge.field("password", default="password1", show_default=False),
+            dodge.field("salt", keyword_only=True),
+        ])
+        
+        user = User("bob", salt="asf")
+        assert User.__dict__["__init__"].__code__.co_filename.startswith("<dodge.data_class")
+        assert_equal("User('bob', salt='asf')", repr(user))
+        assert_equal("User('bob', password='password2', salt='asf')", repr(User("bob", "password2", salt="asf")))
+        assert_equal(User("bob", salt="asf"), user)
+        assert User("bob", "password2", salt="asf") != user
+        assert_raises_regexp(
+            TypeError, "^User.__init__ takes 2 positional arguments but 3 were given$",
+            lambda: User("bob", "password1", "asf")
+        )
+        assert_raises_regexp(
+            TypeError, "^Missing argument: 'salt'$",
+            lambda: User("bob")
+        )
+        assert_raises_regexp(
+            TypeError, "^Missing argument: 'username'$",
+            lambda: User(salt="asf")
+        )
+        assert_raises_regexp(
+            TypeError, "^User.__init__ does not take keyword argument 'email'$",
+            lambda: User("bob", salt="asf", email="bob@example.com")
+        )
+        assert_raises_regexp(
+            TypeError, "^User.__init__ does not take keyword argument 'username'$",
+            lambda: User("bob", username="jim", salt="asf")
+        )
+    finally:
+        dodge.data._calls_before_compiling = calls_before_compiling
+
+
+@istest
+def data_class_falls_back_to_generic_methods_if_field_name_is_not_identifier():
+    User = dodge.data_class("User", ["user name", "class"])
+    
+    user = User("bob", "admin")
+    assert_equal("bob", getattr(user, "user name"))
+    assert_equal("admin", getattr(user, "class"))
+    assert_equal(User("bob", "admin"), user)
+
+
+@istest
+def error_is_raised_if_keyword_argument_duplicates_positional_argument():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_raises_regexp(
+        TypeError, "^User.__init__ does not take keyword argument 'username'$",
+        lambda: User("bob", username="jim")
+    )
+
+
+@istest
+def instances_of_data_class_with_slots_have_no_dict():
+    User = dodge.data_class("User", ["username", "password"], slots=True)
+    
+    user = User("bob", "password1")
+    assert not hasattr(user, "__dict__")
+    assert_equal(("username", "password"), User.__slots__)
+
+
+@istest
+def data_class_with_slots_supports_equality_copy_and_fields():
+    User = dodge.data_class("User", ["username", "password"], slots=True)
+    
+    user = User("bob", "password1")
+    assert_equal(User("bob", "password1"), user)
+    assert User("bob", "password2") != user
+    assert_equal(User("bob", "password2"), dodge.copy(user, password="password2"))
+    assert_equal(["username", "password"], [field.name for field in dodge.fields(user)])
+
+
+@istest
+def instances_can_be_built_from_rows_of_positional_arguments():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1"),
+        dodge.field("is_root", default=False, keyword_only=True),
+    ])
+    
+    users = dodge.from_rows(User, [("bob", "password2"), ("jim", "password3")])
+    
+    assert_equal([User("bob", "password2"), User("jim", "password3")], users)
+
+
+@istest
+def rows_can_omit_positional_arguments_with_defaults():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1"),
+    ])
+    
+    users = dodge.from_rows(User, [("bob", ), ("jim", "password2")])
+    
+    assert_equal([User("bob"), User("jim", "password2")], users)
+
+
+@istest
+def instances_can_be_built_from_rows_as_generator():
+    User = dodge.data_class("User", ["username"])
+    
+    users = dodge.from_rows(User, iter([("bob", ), ("jim", )]), stream=True)
+    
+    assert not isinstance(users, list)
+    assert_equal([User("bob"), User("jim")], list(users))
+    assert_equal([], list(dodge.from_rows(User, [], stream=True)))
+
+
+@istest
+def error_is_raised_if_rows_have_too_many_or_too_few_values():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", keyword_only=True, default="password1"),
+    ])
+    
+    assert_raises_regexp(
+        TypeError, "^User.__init__ takes 1 positional argument but 2 were given$",
+        lambda: dodge.from_rows(User, [("bob", "password2")])
+    )
+    assert_raises_regexp(
+        TypeError, "^Missing argument: 'username'$",
+        lambda: dodge.from_rows(User, [()])
+    )
+    assert_raises_regexp(
+        TypeError, "^User.__init__ takes 1 positional argument but 2 were given$",
+        lambda: dodge.from_rows(User, [("bob", ), ("jim", "password2")])
+    )
+
+
+@istest
+def instances_can_be_built_from_dicts_of_keyword_arguments():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1"),
+        dodge.field("is_root", default=False, keyword_only=True),
+    ])
+    
+    users = dodge.from_dicts(User, [
+        {"username": "bob"},
+        {"username": "jim", "password": "password2", "is_root": True},
+    ])
+    
+    assert_equal([User("bob"), User("jim", "password2", is_root=True)], users)
+
+
+@istest
+def error_is_raised_if_dict_does_not_match_fields():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1"),
+    ])
+    
+    assert_raises_regexp(
+        TypeError, "^Missing argument: 'username'$",
+        lambda: dodge.from_dicts(User, [{"password": "password2"}])
+    )
+    assert_raises_regexp(
+        TypeError, "^User.__init__ does not take keyword argument 'salt'$",
+        lambda: dodge.from_dicts(User, [{"username": "bob", "salt": "asf"}])
+    )
+
+
+@istest
+def super_init_is_called_when_building_instances_from_rows_and_dicts():
+    class HasId(object):
+        def __init__(self):
+            self.id = 42
+    
+    User = dodge.data_class("User", ["username"], bases=(HasId,))
+    
+    assert_equal(42, dodge.from_rows(User, [("bob", )])[0].id)
+    assert_equal(42, dodge.from_dicts(User, [{"username": "bob"}])[0].id)
+
+
+@istest
+def fields_of_frozen_data_class_cannot_be_assigned_or_deleted():
+    User = dodge.data_class("User", ["username"], frozen=True)
+    
+    user = User("bob")
+    
+    def assign():
+        user.username = "jim"
+    
+    def delete():
+        del user.username
+    
+    assert_raises_regexp(
+        AttributeError, "^cannot assign to attribute 'username' of frozen User$",
+        assign
+    )
+    assert_raises_regexp(
+        AttributeError, "^cannot delete attribute 'username' of frozen User$",
+        delete
+    )
+    assert_equal("bob", user.username)
+
+
+@istest
+def frozen_data_class_instances_with_equal_fields_have_equal_hashes():
+    User = dodge.data_class("User", ["username", "password"], frozen=True)
+    
+    assert_equal(hash(User("bob", "password1")), hash(User("bob", "password1")))
+    assert_equal(
+        set([User("bob", "password1"), User("jim", "password1")]),
+        set([User("bob", "password1"), User("jim", "password1"), User("bob", "password1")])
+    )
+
+
+@istest
+def frozen_data_class_instances_with_different_hashes_are_not_equal():
+    User = dodge.data_class("User", ["username"], frozen=True)
+    
+    first = User("bob")
+    second = User("jim")
+    hash(first)
+    hash(second)
+    
+    assert first != second
+    assert not (first == second)
+    assert first == User("bob")
+
+
+@istest
+def frozen_data_class_can_be_modified_by_copying():
+    User = dodge.data_class("User", ["username", "password"], frozen=True, slots=True)
+    
+    original = User("bob", "password1")
+    hash(original)
+    copy = dodge.copy(original, password="password2")
+    
+    assert_equal("password2", copy.password)
+    assert_equal(hash(User("bob", "password2")), hash(copy))
+
+
+@istest
+def frozen_data_class_with_generic_methods_is_hashable_and_frozen():
+    User = dodge.data_class("User", ["username"], frozen=True, compiled=False)
+    
+    user = User("bob")
+    
+    def assign():
+        user.username = "jim"
+    
+    assert_equal(hash(User("bob")), hash(user))
+    assert_raises_regexp(AttributeError, "^cannot assign to attribute", assign)
+
+
+@istest
+def frozen_data_class_instances_can_be_built_from_rows_and_dicts():
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("password", default="password1"),
+    ], frozen=True)
+    
+    assert_equal([User("bob")], dodge.from_rows(User, [("bob", )]))
+    assert_equal([User("bob", "password2")], dodge.from_dicts(User, [{"username": "bob", "password": "password2"}]))
+
+
+
+@istest
+def instances_of_dynamically_created_data_classes_can_be_pickled():
+    Profile = dodge.data_class("Profile", ["bio"], frozen=True, slots=True)
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profiles", type=dodge.list_of(Profile)),
+        dodge.field("password", default="password1", keyword_only=True),
+    ])
+    
+    user = User("bob", [Profile("I'm Bob.")], password="password2")
+    result = pickle.loads(pickle.dumps(user, protocol=2))
+    
+    assert_equal(user, result)
+    assert type(result) is User
+
+
+@istest
+def dynamically_created_data_classes_can_be_pickled():
+    User = dodge.data_class("User", ["username"])
+    
+    assert pickle.loads(pickle.dumps(User)) is User
+    assert pickle.loads(pickle.dumps(dodge.data_class)) is dodge.data_class
+
+
+@istest
+def attributes_other_than_fields_are_kept_when_pickling_and_copying():
+    User = dodge.data_class("User", ["username"], bases=(HasId, ))
+    Profile = dodge.data_class("Profile", ["bio"], bases=(HasTag, ), slots=True)
+    
+    for _ in range(2):
+        # The second time round uses the compiled methods
+        for _ in range(100):
+            pickle.loads(pickle.dumps(User("bob"), protocol=2))
+            pickle.loads(pickle.dumps(Profile("I'm Bob."), protocol=2))
+        
+        user = User("bob")
+        user.nickname = "bobby"
+        profile = Profile("I'm Bob.")
+        for result, result_profile in [
+            (pickle.loads(pickle.dumps(user, protocol=2)), pickle.loads(pickle.dumps(profile, protocol=2))),
+            (copy.copy(user), copy.copy(profile)),
+            (copy.deepcopy(user), copy.deepcopy(profile)),
+        ]:
+            assert_equal(user, result)
+            assert_equal(42, result.id)
+            assert_equal("bobby", result.nickname)
+            assert_equal(profile, result_profile)
+            assert_equal("tag", result_profile.tag)
+
+
+class HasId(object):
+    def __init__(self):
+        self.id = 42
+
+
+class HasTag(object):
+    __slots__ = ("tag", )
+    
+    def __init__(self):
+        self.tag = "tag"
+
+
+@istest
+def instances_of_subclasses_of_data_classes_can_be_pickled():
+    admin = pickle.loads(pickle.dumps(Admin("bob"), protocol=2))
+    
+    assert type(admin) is Admin
+    assert_equal(Admin("bob"), admin)
+    assert pickle.loads(pickle.dumps(Admin)) is Admin
+
+
+PickledUser = dodge.data_class("PickledUser", ["username"])
+
+
+class Admin(PickledUser):
+    pass
+
+
+@istest
+def pickled_data_classes_are_recreated_in_other_processes():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", [
+        "username",
+        dodge.field("profile", type=Profile),
+        dodge.field("password", default="password1"),
+    ])
+    
+    data = pickle.dumps(User("bob", Profile("I'm Bob.")), protocol=2)
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import pickle, sys; print(repr(pickle.loads(sys.stdin.read())))"
+            if sys.version_info[0] < 3 else
+            "import pickle, sys; print(repr(pickle.loads(sys.stdin.buffer.read())))"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    output, _ = process.communicate(data)
+    
+    assert_equal(b"User('bob', Profile(\"I'm Bob.\"), password='password1')", output.strip())
+
+
+@istest
+def data_classes_can_refer_to_each_other_by_name():
+    classes = dodge.data_classes({
+        "User": ["username", dodge.field("profile", type="Profile")],
+        "Profile": ["bio"],
+    })
+    User, Profile = classes["User"], classes["Profile"]
+    
+    user = dodge.dict_to_obj({"username": "bob", "profile": {"bio": "I'm Bob."}}, User)
+    
+    assert_equal(User("bob", Profile("I'm Bob.")), user)
+    assert dodge.fields(User)[1].type is Profile
+
+
+@istest
+def data_classes_can_refer_to_themselves_in_containers():
+    Tree = dodge.data_classes({
+        "Tree": ["value", dodge.field("children", type=dodge.list_of("Tree"), default=[])],
+    })["Tree"]
+    
+    tree = Tree(1, [Tree(2, [Tree(3)])])
+    
+    assert_equal(tree, dodge.dict_to_obj(dodge.obj_to_dict(tree), Tree))
+    assert_equal(tree, pickle.loads(pickle.dumps(tree, protocol=2)))
+
+
+@istest
+def error_is_raised_if_data_classes_refer_to_unknown_name():
+    assert_raises_regexp(
+        ValueError, "^unknown data class: 'Profile'$",
+        lambda: dodge.data_classes({"User": [dodge.field("profile", type="Profile")]})
+    )
+
+
+@istest
+def methods_of_data_classes_behave_the_same_before_and_after_first_use():
+    User = dodge.data_class("User", ["username", dodge.field("password", default=None)], frozen=True)
+    
+    assert_equal("User('bob', password=None)", repr(User("bob")))
+    assert_equal(User("bob"), User("bob"))
+    assert_equal(hash(User("bob")), hash(User("bob")))
+    assert_equal("User('bob', password=None)", repr(User("bob")))
+
+
+@istest
+def methods_of_data_classes_behave_the_same_once_compiled():
+    User = dodge.data_class("User", ["username", dodge.field("password", default=None)], frozen=True)
+    
+    for _ in range(200):
+        user = User("bob")
+        assert_equal("User('bob', password=None)", repr(user))
+        assert_equal(User("bob"), user)
+        assert user != User("jim")
+        assert_equal(hash(User("bob")), hash(user))
+
+
+@istest
+def methods_assigned_to_data_class_are_not_replaced_by_compiled_methods():
+    User = dodge.data_class("User", ["username"])
+    User.__repr__ = lambda self: "custom"
+    
+    for _ in range(200):
+        assert_equal("custom", repr(User("bob")))
+
+
 import sys
 if sys.version_info[:2] <= (2, 6):
     import re
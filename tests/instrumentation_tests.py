@@ -0,0 +1,79 @@
+from nose.tools import istest, assert_equal
+
+import dodge
+
+
+@istest
+def stats_are_collected_by_operation_and_class():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", ["username", dodge.field("profile", type=Profile)])
+
+    with dodge.collect_stats() as collected:
+        string = dodge.dumps(User("bob", Profile("I'm Bob.")))
+        dodge.loads(string, User)
+        dodge.loads(string, User)
+
+    assert_equal(
+        dict([
+            (("construct", User), 3),
+            (("construct", Profile), 3),
+            (("dumps", User), 1),
+            (("obj_to_dict", User), 1),
+            (("loads", User), 2),
+            (("dict_to_obj", User), 2),
+        ]),
+        dict((key, operation_stats.calls) for key, operation_stats in collected.items())
+    )
+    assert_equal(len(string.encode("utf-8")), collected[("dumps", User)].bytes)
+    assert collected[("loads", User)].seconds > 0
+
+
+@istest
+def bytes_produced_by_packing_are_counted():
+    User = dodge.data_class("User", ["username"])
+
+    with dodge.collect_stats() as collected:
+        data = dodge.pack(User("bob"))
+
+    assert_equal(len(data), collected[("pack", User)].bytes)
+
+
+@istest
+def conversions_made_by_other_modules_are_counted():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", ["username", dodge.field("profile", type=Profile)])
+    projection = dodge.project(User, ["profile"])
+    user_dict = dodge.obj_to_dict(User("bob", Profile("I'm Bob.")))
+
+    with dodge.collect_stats() as collected:
+        projection.from_dict(user_dict)
+
+    assert_equal(1, collected[("dict_to_obj", Profile)].calls)
+
+
+@istest
+def functions_are_not_wrapped_unless_stats_are_enabled():
+    dumps = dodge.dumps
+
+    dodge.enable_stats()
+    try:
+        assert dodge.dumps is not dumps
+    finally:
+        dodge.disable_stats()
+
+    assert dodge.dumps is dumps
+
+
+@istest
+def stats_are_kept_until_reset():
+    User = dodge.data_class("User", ["username"])
+
+    dodge.reset_stats()
+    with dodge.collect_stats():
+        dodge.obj_to_dict(User("bob"))
+    with dodge.collect_stats():
+        dodge.obj_to_dict(User("bob"))
+
+    assert_equal(2, dodge.stats()[("obj_to_dict", User)].calls)
+    dodge.reset_stats()
+    assert_equal({}, dodge.stats())
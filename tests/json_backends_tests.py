@@ -0,0 +1,84 @@
+from nose.tools import istest, assert_equal
+
+import json
+
+import dodge
+
+import codecs_tests
+import conversion_tests
+
+
+@istest
+def stdlib_json_backend_is_always_available():
+    assert_equal("json", dodge.json_backends()[-1])
+
+
+@istest
+def stdlib_json_backend_is_used_by_default():
+    User = dodge.data_class("User", ["id", "scores"])
+    
+    user = User(2 ** 70, {1: float("nan")})
+    
+    assert_equal('{"id": 1180591620717411303424, "scores": {"1": NaN}}', dodge.dumps(user))
+
+
+@istest
+def json_is_the_same_whichever_backend_is_used():
+    Profile = dodge.data_class("Profile", ["bio"])
+    User = dodge.data_class("User", ["username", dodge.field("profile", type=Profile)])
+    
+    user = User(u"bob", Profile(u"I'm Bob. \u263a"))
+    
+    for backend in dodge.json_backends():
+        string = dodge.dumps(user, backend=backend)
+        assert_equal({"username": "bob", "profile": {"bio": u"I'm Bob. \u263a"}}, json.loads(string))
+        assert_equal(user, dodge.loads(string, User, backend=backend))
+
+
+@istest
+def error_is_raised_for_unknown_backend():
+    User = dodge.data_class("User", ["username"])
+    
+    assert_raises_regexp(
+        ValueError, "^unknown JSON backend: 'nope'$",
+        lambda: dodge.dumps(User("bob"), backend="nope")
+    )
+
+
+@istest
+def json_tests_pass_with_each_backend():
+    for backend in dodge.json_backends():
+        for test in _json_tests:
+            yield _run_with_backend, backend, test
+
+
+def _run_with_backend(backend, test):
+    dodge.set_json_backend(backend)
+    try:
+        test()
+    finally:
+        dodge.set_json_backend("json")
+
+
+_json_tests = [
+    conversion_tests.can_convert_data_classes_to_and_from_string,
+    conversion_tests.can_convert_nested_data_classes_to_and_from_string,
+    conversion_tests.blank_lines_are_ignored_when_loading_json_lines,
+    conversion_tests.elements_of_container_fields_are_converted_with_codecs,
+    conversion_tests.lazy_conversion_only_converts_fields_when_they_are_accessed,
+    codecs_tests.decimal_and_uuid_fields_are_converted_to_and_from_strings,
+    codecs_tests.codecs_are_used_when_loading_lazily,
+]
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
@@ -0,0 +1,40 @@
+from nose.tools import istest, assert_equal
+
+import dodge
+
+try:
+    import dodge.parallel
+except ImportError:
+    # concurrent.futures isn't available
+    parallel = None
+else:
+    parallel = dodge.parallel
+
+
+if parallel is not None:
+    @istest
+    def loads_many_converts_strings_to_objects_in_order():
+        Profile = dodge.data_class("Profile", ["bio"])
+        User = dodge.data_class("User", ["username", dodge.field("profile", type=Profile)])
+        
+        strings = [
+            '{{"username": "user{0}", "profile": {{"bio": "bio{0}"}}}}'.format(index)
+            for index in range(25)
+        ]
+        
+        assert_equal(
+            [User("user{0}".format(index), Profile("bio{0}".format(index))) for index in range(25)],
+            parallel.loads_many(strings, User, workers=2, chunksize=4),
+        )
+    
+    
+    @istest
+    def dumps_many_converts_objects_to_strings_in_order():
+        User = dodge.data_class("User", ["username"])
+        
+        users = [User("user{0}".format(index)) for index in range(25)]
+        
+        assert_equal(
+            [dodge.dumps(user) for user in users],
+            parallel.dumps_many(users, workers=2, chunksize=4),
+        )
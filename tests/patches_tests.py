@@ -0,0 +1,106 @@
+from nose.tools import istest, assert_equal
+
+import datetime
+import json
+
+import dodge
+
+
+Profile = dodge.data_class("Profile", ["bio", dodge.field("born", type=datetime.date)])
+
+User = dodge.data_class("User", [
+    "username",
+    dodge.field("profile", type=Profile),
+    dodge.field("friends", type=dodge.list_of(Profile), default=[]),
+])
+
+
+@istest
+def diff_contains_only_changed_fields():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = dodge.copy(old, username="bobby")
+    
+    assert_equal(dodge.Patch(User, {"username": "bobby"}), dodge.diff(old, new))
+
+
+@istest
+def diff_recurses_into_nested_objects():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 2)))
+    
+    assert_equal(
+        dodge.Patch(User, {"profile": dodge.Patch(Profile, {"born": datetime.date(1980, 1, 2)})}),
+        dodge.diff(old, new)
+    )
+
+
+@istest
+def diff_of_equal_objects_is_empty():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    
+    assert_equal(dodge.Patch(User, {}), dodge.diff(old, new))
+
+
+@istest
+def applying_diff_to_old_object_gives_new_object():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = User("bob", Profile("I'm Bobby.", datetime.date(1980, 1, 1)), [Profile("I'm Jim.", None)])
+    
+    result = dodge.apply_patch(old, dodge.diff(old, new))
+    
+    assert_equal(new, result)
+    assert_equal(User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1))), old)
+
+
+@istest
+def patches_can_be_converted_to_and_from_json_and_binary():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = User("bobby", Profile("I'm Bob.", datetime.date(1980, 1, 2)), [Profile("I'm Jim.", None)])
+    patch = dodge.diff(old, new)
+    
+    assert_equal(patch, dodge.loads_patch(dodge.dumps_patch(patch), User))
+    assert_equal(patch, dodge.unpack_patch(dodge.pack_patch(patch), User))
+    assert_equal(
+        {
+            "set": {"username": "bobby", "friends": [{"bio": "I'm Jim.", "born": None}]},
+            "patch": {"profile": {"set": {"born": "1980-01-02"}}},
+        },
+        json.loads(dodge.dumps_patch(patch))
+    )
+
+
+@istest
+def lazily_loaded_objects_can_be_diffed_and_patched():
+    old = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 1)))
+    new = User("bob", Profile("I'm Bob.", datetime.date(1980, 1, 2)))
+    lazy_old = dodge.loads(dodge.dumps(old), User, lazy=True)
+    lazy_new = dodge.loads(dodge.dumps(new), User, lazy=True)
+    
+    patch = dodge.Patch(User, {"profile": dodge.Patch(Profile, {"born": datetime.date(1980, 1, 2)})})
+    assert_equal(patch, dodge.diff(lazy_old, new))
+    assert_equal(patch, dodge.diff(old, lazy_new))
+    assert_equal(new, dodge.apply_patch(lazy_old, patch))
+
+
+@istest
+def error_is_raised_if_patch_is_for_different_class():
+    patch = dodge.Patch(Profile, {"bio": "I'm Bob."})
+    
+    assert_raises_regexp(
+        ValueError, "^patch for Profile cannot be applied to User$",
+        lambda: dodge.apply_patch(User("bob", None), patch)
+    )
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp
@@ -0,0 +1,100 @@
+from nose.tools import istest, assert_equal
+
+import datetime
+
+import dodge
+
+
+Owner = dodge.data_class("Owner", ["name", dodge.field("born", type=datetime.date, default=None)])
+
+Record = dodge.data_class("Record", [
+    "id",
+    dodge.field("owner", type=Owner),
+    dodge.field("tags", type=dodge.list_of(Owner), default=[]),
+    dodge.field("payload", default=None),
+])
+
+
+_record = Record(1, Owner("Bob", datetime.date(1980, 1, 1)), [Owner("Jim")], "data")
+
+
+@istest
+def paths_are_read_from_dicts():
+    projection = dodge.project(Record, ["id", "owner.name", "owner.born"])
+    
+    assert_equal((1, "Bob", datetime.date(1980, 1, 1)), projection.from_dict(dodge.obj_to_dict(_record)))
+
+
+@istest
+def paths_are_read_from_json():
+    projection = dodge.project(Record, ["owner.name", "tags"])
+    
+    assert_equal(("Bob", [Owner("Jim")]), projection.from_json(dodge.dumps(_record)))
+    assert_equal(
+        [("Bob", [Owner("Jim")]), ("Bob", [Owner("Jim")])],
+        projection.from_json_lines([dodge.dumps(_record), "", dodge.dumps(_record)])
+    )
+
+
+@istest
+def paths_are_read_from_flat_lists():
+    projection = dodge.project(Record, ["id", "owner.born", "tags", "payload"])
+    flat_list = dodge.obj_to_flat_list(_record)
+    
+    assert_equal((1, datetime.date(1980, 1, 1), [Owner("Jim")], "data"), projection.from_flat_list(flat_list))
+    assert_equal((1, datetime.date(1980, 1, 1), [Owner("Jim")], "data"), projection.from_flat_list(["x"] + flat_list, offset=1))
+    assert_equal([(1, datetime.date(1980, 1, 1), [Owner("Jim")], "data")], projection.from_flat_lists([flat_list]))
+
+
+@istest
+def path_to_nested_object_reads_whole_object():
+    projection = dodge.project(Record, ["owner"])
+    
+    assert_equal((_record.owner, ), projection.from_dict(dodge.obj_to_dict(_record)))
+    assert_equal((_record.owner, ), projection.from_flat_list(dodge.obj_to_flat_list(_record)))
+
+
+@istest
+def missing_fields_are_read_as_their_default():
+    projection = dodge.project(Record, ["owner.born", "payload"])
+    
+    assert_equal((None, None), projection.from_dict({"id": 1, "owner": {"name": "Bob"}}))
+    assert_equal(
+        [(None, None)],
+        projection.from_dicts([{"id": 1, "owner": None}])
+    )
+
+
+@istest
+def error_is_raised_if_field_without_default_is_missing():
+    projection = dodge.project(Record, ["owner.name"])
+    
+    assert_raises_regexp(
+        ValueError, "^missing field: 'owner.name'$",
+        lambda: projection.from_dict({"id": 1})
+    )
+
+
+@istest
+def error_is_raised_if_path_is_not_a_path_to_a_field():
+    assert_raises_regexp(
+        ValueError, "^unknown field: 'owner.age'$",
+        lambda: dodge.project(Record, ["owner.age"])
+    )
+    assert_raises_regexp(
+        ValueError, "^field is not a nested object: 'payload'$",
+        lambda: dodge.project(Record, ["payload.size"])
+    )
+
+
+import sys
+if sys.version_info[:2] <= (2, 6):
+    import re
+    def assert_raises_regexp(cls, regex, func):
+        try:
+            func()
+            assert False, "Expected {0}".format(cls)
+        except cls as error:
+            assert re.search(regex, str(error)), "{0} does not match {1}".format(str(error), regex)
+else:
+    from nose.tools import assert_raises_regexp